@@ -9,8 +9,10 @@ from typing import Any
 
 from audio_division.album_truth import album_truth
 from audio_division.archive_registry import is_album_root
+from audio_division.archive_scan import ProgressCallback, map_albums
 from audio_division.artifacts import AlbumArtifacts, detect_artifacts, is_disc_folder
 from audio_division.physical_archive import archive_identity_for_row, build_identity_lookup
+from audio_division.registry_store import load_registry
 from audio_division.validation_truth import (
     merge_validation_evidence,
     validation_evidence_from_identity_release,
@@ -52,7 +54,14 @@ def audit_archive(
     identity_registry: dict[str, Any] | None = None,
     lifecycle_registry: dict[str, Any] | None = None,
     validated_index: dict[str, Any] | None = None,
+    workers: int = 1,
+    progress: ProgressCallback | None = None,
 ) -> dict[str, Any]:
+    """
+    Audit every album in the archive registry against the filesystem.
+    With workers > 1 albums are audited on a thread pool; the report is
+    the same.
+    """
     archive_root = archive_root or Path(str(archive_registry.get("archive_root") or ""))
     identity_registry = identity_registry if identity_registry is not None else load_default_json("identity_registry.json")
     lifecycle_registry = lifecycle_registry if lifecycle_registry is not None else load_default_json("lifecycle_registry.json")
@@ -65,7 +74,8 @@ def audit_archive(
     }
     albums = []
     issues = []
-    for row in archive_registry.get("albums", []):
+
+    def audit(row: dict[str, Any]) -> dict[str, Any]:
         identity_release = archive_identity_for_row(row, identity_lookup)
         album_id = identity_release.get("discovery_identity", {}).get("deezer_album_id", "")
         validation_evidence = merge_validation_evidence(
@@ -73,7 +83,9 @@ def audit_archive(
             validation_evidence_from_lifecycle_row(lifecycle_by_album_id.get(str(album_id))),
             validation_evidence_from_identity_release(identity_release),
         )
-        album = audit_album(row, archive_root, validation_evidence=validation_evidence)
+        return audit_album(row, archive_root, validation_evidence=validation_evidence)
+
+    for album in map_albums(audit, archive_registry.get("albums", []), workers=workers, progress=progress):
         albums.append(album)
         issues.extend(album["issues"])
 
@@ -320,14 +332,7 @@ def load_archive_registry(path: Path) -> dict[str, Any]:
 
 
 def load_default_json(filename: str) -> dict[str, Any]:
-    path = Path(__file__).resolve().parents[1] / "data" / filename
-    if not path.exists():
-        return {}
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-    return data if isinstance(data, dict) else {}
+    return load_registry(Path(__file__).resolve().parents[1] / "data" / filename)
 
 
 def escape(value: Any) -> str:
@@ -7,16 +7,28 @@ from pathlib import Path
 from typing import Any
 
 from audio_division.album_truth import album_truth
-from audio_division.artifacts import ARTIFACT_TYPES, detect_artifacts, is_disc_folder as artifact_is_disc_folder
+from audio_division.archive_registry import walk_album_roots
+from audio_division.archive_scan import ProgressCallback
+from audio_division.artifacts import ARTIFACT_TYPES, AlbumArtifacts, detect_artifacts, is_disc_folder as artifact_is_disc_folder
 from curator.atomic import atomic_write_text
 
 ALBUM_CATEGORIES = {"Albums", "EPs", "Singles", "Live"}
 REPORT_LIMIT = 200
 
 
-def reconcile_archive(archive_root: Path, archive_registry: dict[str, Any]) -> dict[str, Any]:
-    reality_roots = discover_album_roots(archive_root)
-    reality_entries = {str(path): reality_album_entry(path, archive_root) for path in reality_roots}
+def reconcile_archive(
+    archive_root: Path,
+    archive_registry: dict[str, Any],
+    *,
+    workers: int = 1,
+    progress: ProgressCallback | None = None,
+) -> dict[str, Any]:
+    reality_entries = {}
+    walked = list(walk_album_roots(archive_root, workers=workers))
+    for index, (path, detected) in enumerate(walked, start=1):
+        reality_entries[str(path)] = reality_album_entry(path, archive_root, detected)
+        if progress:
+            progress(index, len(walked), reality_entries[str(path)])
     registry_entries = {
         str(row.get("archive_path")): row
         for row in archive_registry.get("albums", [])
@@ -54,13 +66,7 @@ def reconcile_archive(archive_root: Path, archive_registry: dict[str, Any]) -> d
 
 
 def discover_album_roots(archive_root: Path) -> list[Path]:
-    if not archive_root.exists() or not archive_root.is_dir():
-        return []
-    roots = []
-    for path in archive_root.rglob("*"):
-        if path.is_dir() and is_album_root(path, archive_root):
-            roots.append(path)
-    return sorted(roots)
+    return [path for path, _ in walk_album_roots(archive_root)]
 
 
 def is_album_root(path: Path, archive_root: Path) -> bool:
@@ -88,8 +94,12 @@ def is_disc_folder(path: Path) -> bool:
     return artifact_is_disc_folder(path)
 
 
-def reality_album_entry(album_path: Path, archive_root: Path) -> dict[str, Any]:
-    detected = detect_artifacts(album_path)
+def reality_album_entry(
+    album_path: Path,
+    archive_root: Path,
+    detected: AlbumArtifacts | None = None,
+) -> dict[str, Any]:
+    detected = detected or detect_artifacts(album_path)
     artifacts = detected.to_dict()
     truth = album_truth(archive_path=album_path, registry_artifacts=artifacts, detected_artifacts=detected)
     return {
@@ -97,7 +107,7 @@ def reality_album_entry(album_path: Path, archive_root: Path) -> dict[str, Any]:
         "archive_path": str(album_path),
         "relative_path": relative_path(album_path, archive_root),
         "track_count": detected.count("audio"),
-        "disc_folders": [child.name for child in disc_folders(album_path)],
+        "disc_folders": [child.name for child in sorted(detected.disc_folders)],
         "artifacts": artifacts,
         "album_truth": truth.to_dict(),
     }
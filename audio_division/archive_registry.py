@@ -4,28 +4,106 @@ import json
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from audio_division.archive_scan import ProgressCallback, list_archive_tree
 from audio_division.artifacts import (
     ARTIFACT_TYPES,
     AUDIO_SUFFIXES,
+    AlbumArtifacts,
+    classify_artifacts,
     detect_artifacts,
     is_disc_folder as artifact_is_disc_folder,
+    scan_directory,
 )
 from curator.atomic import atomic_write_text
 
 ALBUM_CATEGORIES = {"Albums", "EPs", "Singles", "Live"}
+ALBUM_EVIDENCE = ("nfo", "sfv", "playlist", "artwork", "validation")
 REGISTRY_SCHEMA = 1
 
 
-def discover_album_folders(archive_root: Path) -> list[Path]:
-    if not archive_root.exists() or not archive_root.is_dir():
-        return []
-    return sorted(path for path in archive_root.rglob("*") if path.is_dir() and is_album_root(path, archive_root))
+def discover_album_folders(archive_root: Path, *, workers: int = 1) -> list[Path]:
+    return [path for path, _ in walk_album_roots(archive_root, workers=workers)]
+
 
+def walk_album_roots(archive_root: Path, *, workers: int = 1) -> Iterator[tuple[Path, AlbumArtifacts]]:
+    """
+    Every album root under `archive_root`, in sorted order, with its
+    classified artifacts.
 
-def build_archive_registry(archive_root: Path) -> dict[str, Any]:
-    albums = [album_entry(path, archive_root) for path in discover_album_folders(archive_root)]
+    One os.scandir() pass: each directory is listed once, and an album's
+    listing (and its disc folders' listings) feed both the album-root test
+    and the artifact classification. Finds the same folders as
+    is_album_root() over rglob("*"): symlinked directories are reported
+    but not descended into.
+
+    With workers > 1 the listings are read up front on a thread pool
+    (list_archive_tree()), which hides per-call latency on network
+    mounts; the walk over them, and so its output, is unchanged.
+    """
+    if not archive_root.exists() or not archive_root.is_dir():
+        return
+    if workers > 1:
+        listed = list_archive_tree(archive_root, workers)
+        entries = listed.pop(archive_root)
+    else:
+        listed, entries = {}, scan_directory(archive_root)
+    yield from _walk_album_roots(archive_root, entries, False, listed)
+
+
+def _walk_album_roots(
+    directory: Path,
+    entries: list[Any],
+    in_category: bool,
+    listed: dict[Path, list[Any]],
+) -> Iterator[tuple[Path, AlbumArtifacts]]:
+    def scan(folder: Path) -> list[Any]:
+        if folder not in listed:
+            listed[folder] = scan_directory(folder)
+        return listed[folder]
+
+    # Depth-first over name-sorted children visits paths in sorted order.
+    for entry in sorted(entries, key=lambda entry: entry.name):
+        try:
+            if not entry.is_dir():
+                continue
+            descend = not entry.is_symlink()
+        except OSError:
+            continue
+        path = directory / entry.name
+        child_entries = listed.pop(path, None)
+        if child_entries is None:
+            child_entries = scan_directory(path)
+        if in_category and entry.name not in ALBUM_CATEGORIES and not is_disc_folder(path):
+            detected = classify_artifacts(path, child_entries, scan=scan)
+            if has_album_evidence(path, detected):
+                yield path, detected
+        if descend:
+            yield from _walk_album_roots(path, child_entries, entry.name in ALBUM_CATEGORIES, listed)
+        else:
+            # A symlinked album root is classified but not descended into,
+            # so forget any disc listings taken through it.
+            for folder in [folder for folder in listed if folder.parent == path]:
+                del listed[folder]
+
+
+def build_archive_registry(
+    archive_root: Path,
+    *,
+    workers: int = 1,
+    progress: ProgressCallback | None = None,
+) -> dict[str, Any]:
+    albums = []
+    walked = list(walk_album_roots(archive_root, workers=workers))
+    for index, (path, detected) in enumerate(walked, start=1):
+        albums.append(album_entry(path, archive_root, detected))
+        if progress:
+            progress(index, len(walked), albums[-1])
+    return registry_document(archive_root, albums)
+
+
+def registry_document(archive_root: Path, albums: list[dict[str, Any]]) -> dict[str, Any]:
     return {
         "schema": REGISTRY_SCHEMA,
         "generated_at": datetime.now().isoformat(timespec="seconds"),
@@ -35,8 +113,8 @@ def build_archive_registry(archive_root: Path) -> dict[str, Any]:
     }
 
 
-def album_entry(album_path: Path, archive_root: Path) -> dict[str, Any]:
-    detected = detect_artifacts(album_path)
+def album_entry(album_path: Path, archive_root: Path, detected: AlbumArtifacts | None = None) -> dict[str, Any]:
+    detected = detected or detect_artifacts(album_path)
     artifacts = detected.to_dict()
     track_count = detected.count("audio")
     return {
@@ -135,9 +213,9 @@ def is_album_root(path: Path, archive_root: Path) -> bool:
     return has_album_evidence(path)
 
 
-def has_album_evidence(path: Path) -> bool:
-    detected = detect_artifacts(path)
-    return bool(detected.direct_audio_files or any(detected.present(name) for name in ("nfo", "sfv", "playlist", "artwork", "validation")) or detected.count("audio"))
+def has_album_evidence(path: Path, detected: AlbumArtifacts | None = None) -> bool:
+    detected = detected or detect_artifacts(path)
+    return bool(detected.direct_audio_files or any(detected.present(name) for name in ALBUM_EVIDENCE) or detected.count("audio"))
 
 
 def is_disc_folder(path: Path) -> bool:
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from audio_division.archive_registry import (
+    ALBUM_CATEGORIES,
+    REGISTRY_SCHEMA,
+    album_entry,
+    has_album_evidence,
+    is_disc_folder,
+    registry_document,
+)
+from audio_division.archive_scan import list_archive_tree, map_albums
+from audio_division.artifacts import (
+    album_unchanged,
+    directory_mtime,
+    scan_album,
+    scan_directory,
+    trusted_mtime,
+)
+from audio_division.dashboard import load_json
+from curator.atomic import atomic_write_text
+
+ARCHIVE_REGISTRY_FILENAME = "archive_registry.json"
+ARCHIVE_REGISTRY_INDEX_FILENAME = "archive_registry_index.json"
+ARCHIVE_REGISTRY_INDEX_SCHEMA = 1
+
+
+class ArchiveRegistryIndex:
+    """
+    On-disk record of the last archive registry scan, used to refresh the
+    registry without re-listing unchanged folders.
+
+    Every directory's subdirectory listing is keyed by its mtime_ns, the
+    same way ValidationLogIndex keys its listings: an unchanged directory
+    costs one stat() instead of a listing. Album folders also record the
+    mtime_ns of each disc folder; when the album and all of its discs are
+    unchanged, the previous registry entry is reused as is. New and
+    removed albums show up in their parent's listing.
+
+    Directories still get a stat() each, because a directory's mtime only
+    reflects its direct entries. The previous registry is only trusted if
+    it is the one this index was saved with; otherwise every album folder
+    is rescanned (listings are still reused). The result is identical to
+    build_archive_registry().
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        data = self._load()
+        self._root: str | None = data.get("archive_root")
+        self._registry_token: list[Any] | None = data.get("registry")
+        self._dirs: dict[str, dict[str, Any]] = data.get("dirs", {})
+        self._albums: dict[str, dict[str, Any]] = data.get("albums", {})
+        self._seen_dirs: set[str] = set()
+        self._seen_albums: set[str] = set()
+        self._run: dict[str, Any] = {}
+        self.stats = {"dirs_listed": 0, "dirs_reused": 0, "albums_scanned": 0, "albums_reused": 0, "evicted": 0}
+
+    def _load(self) -> dict[str, Any]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(data, dict) or data.get("schema") != ARCHIVE_REGISTRY_INDEX_SCHEMA:
+            return {}
+        return data
+
+    def clear(self) -> None:
+        self._root = None
+        self._registry_token = None
+        self._dirs.clear()
+        self._albums.clear()
+
+    def refresh(
+        self,
+        archive_root: Path,
+        previous: dict[str, Any] | None = None,
+        *,
+        workers: int = 1,
+    ) -> dict[str, Any]:
+        """
+        The archive registry for `archive_root`, rescanning only album
+        folders whose signature changed since `previous` was built.
+
+        With workers > 1 every recorded folder is stat()ed up front on a
+        thread pool, and a refresh with nothing recorded reads the whole
+        tree with list_archive_tree(). A listing read before its stat()
+        is safe: anything changed after the refresh started falls in the
+        racy window and is rescanned next time.
+        """
+        archive_root = Path(archive_root)
+        prior: dict[str, dict[str, Any]] = {}
+        if previous and self._trusts(archive_root, previous):
+            prior = {str(row.get("archive_path")): row for row in previous.get("albums", [])}
+        self._root = str(archive_root)
+        self._run = {"started_ns": time.time_ns(), "stats": {}, "listings": {}, "prefetched": {}, "root": archive_root}
+
+        albums: list[dict[str, Any]] = []
+        if archive_root.exists() and archive_root.is_dir():
+            if workers > 1:
+                self._prefetch(archive_root, workers)
+            self._walk(archive_root, False, prior, albums)
+        registry = registry_document(archive_root, albums)
+        self._registry_token = _registry_token(registry)
+        self._run = {}
+        return registry
+
+    def _trusts(self, archive_root: Path, previous: dict[str, Any]) -> bool:
+        return (
+            self._root == str(archive_root)
+            and previous.get("archive_root") == str(archive_root)
+            and previous.get("schema") == REGISTRY_SCHEMA
+            and self._registry_token == _registry_token(previous)
+        )
+
+    def _walk(self, directory: Path, in_category: bool, prior: dict[str, dict[str, Any]], albums: list[dict[str, Any]]) -> None:
+        # Same traversal as walk_album_roots(): name order, symlinked
+        # directories are candidates but are not descended into.
+        for name, symlink in self._subdirs(directory):
+            path = directory / name
+            if in_category and name not in ALBUM_CATEGORIES and not is_disc_folder(path):
+                entry = self._album(path, prior)
+                if entry is not None:
+                    albums.append(entry)
+            if not symlink:
+                self._walk(path, name in ALBUM_CATEGORIES, prior, albums)
+
+    def _prefetch(self, archive_root: Path, workers: int) -> None:
+        if not self._dirs:
+            self._run["prefetched"] = {str(path): entries for path, entries in list_archive_tree(archive_root, workers).items()}
+        paths = set(self._dirs) | set(self._run["prefetched"])
+        for album, record in self._albums.items():
+            paths.add(album)
+            paths.update(str(Path(album) / name) for name in record.get("discs", {}))
+        paths = sorted(paths)
+        self._run["stats"].update(zip(paths, map_albums(directory_mtime, paths, workers=workers)))
+
+    def _listing(self, directory: Path) -> list[os.DirEntry]:
+        entries = self._run["prefetched"].pop(str(directory), None)
+        return scan_directory(directory) if entries is None else entries
+
+    def _mtime(self, path: Path) -> int | None:
+        cache = self._run["stats"]
+        key = str(path)
+        if key not in cache:
+            cache[key] = directory_mtime(key)
+        return cache[key]
+
+    def _subdirs(self, directory: Path) -> list[tuple[str, bool]]:
+        key = str(directory)
+        self._seen_dirs.add(key)
+        listing = self._run["listings"].get(key)
+        if listing is not None:
+            return listing
+        mtime_ns = self._mtime(directory)
+        record = self._dirs.get(key)
+        if mtime_ns is not None and record and record.get("mtime_ns") == mtime_ns:
+            self.stats["dirs_reused"] += 1
+            listing = [(name, bool(symlink)) for name, symlink in record.get("subdirs", [])]
+            self._run["listings"][key] = listing
+            return listing
+        return self._record_listing(directory, mtime_ns, self._listing(directory) if mtime_ns is not None else [])
+
+    def _record_listing(self, directory: Path, mtime_ns: int | None, entries: list[os.DirEntry]) -> list[tuple[str, bool]]:
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subdirs.append((entry.name, entry.is_symlink()))
+            except OSError:
+                continue
+        subdirs.sort()
+        key = str(directory)
+        self._dirs[key] = {"mtime_ns": trusted_mtime(mtime_ns, self._run["started_ns"]), "subdirs": [list(item) for item in subdirs]}
+        self._run["listings"][key] = subdirs
+        self.stats["dirs_listed"] += 1
+        return subdirs
+
+    def _album(self, path: Path, prior: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
+        key = str(path)
+        self._seen_albums.add(key)
+        mtime_ns = self._mtime(path)
+        record = self._albums.get(key)
+        if record and album_unchanged(
+            path, mtime_ns, record.get("mtime_ns"), record.get("discs", {}).items(), stat=self._mtime
+        ):
+            if not record.get("root"):
+                self.stats["albums_reused"] += 1
+                return None
+            entry = prior.get(key)
+            if entry is not None:
+                self.stats["albums_reused"] += 1
+                return entry
+
+        entries = self._listing(path)
+        detected, discs = scan_album(path, entries, self._run["started_ns"], stat=self._mtime, listing=self._disc_listing)
+        self._seen_dirs.add(key)
+        self._record_listing(path, mtime_ns, entries)
+        is_root = has_album_evidence(path, detected)
+        self._albums[key] = {"mtime_ns": trusted_mtime(mtime_ns, self._run["started_ns"]), "discs": discs, "root": is_root}
+        self.stats["albums_scanned"] += 1
+        return album_entry(path, self._run["root"], detected) if is_root else None
+
+    def _disc_listing(self, folder: Path) -> list[os.DirEntry]:
+        listing = self._listing(folder)
+        self._seen_dirs.add(str(folder))
+        if str(folder) not in self._run["listings"]:
+            self._record_listing(folder, self._mtime(folder), listing)
+        return listing
+
+    def evict_missing(self) -> int:
+        """
+        Drop directories and album folders that were not seen in the last
+        refresh.
+        """
+        evicted = 0
+        for records, seen in ((self._dirs, self._seen_dirs), (self._albums, self._seen_albums)):
+            for key in [key for key in records if key not in seen]:
+                del records[key]
+                evicted += 1
+        self.stats["evicted"] += evicted
+        return evicted
+
+    def save(self) -> None:
+        self.evict_missing()
+        if self.path is None:
+            return
+        text = json.dumps(
+            {
+                "schema": ARCHIVE_REGISTRY_INDEX_SCHEMA,
+                "archive_root": self._root,
+                "registry": self._registry_token,
+                "dirs": self._dirs,
+                "albums": self._albums,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        atomic_write_text(self.path, text + "\n")
+
+
+def _registry_token(registry: dict[str, Any]) -> list[Any]:
+    return [registry.get("generated_at"), len(registry.get("albums", []))]
+
+
+def refresh_archive_registry(
+    archive_root: Path,
+    data_dir: Path,
+    *,
+    full: bool = False,
+    workers: int = 1,
+) -> tuple[dict[str, Any], ArchiveRegistryIndex]:
+    """
+    Refresh `data_dir`'s archive registry against `archive_root`. Returns
+    the registry and the index; write the registry, then index.save().
+    With `full`, the stored index is ignored and every folder is listed.
+    """
+    index = ArchiveRegistryIndex(data_dir / ARCHIVE_REGISTRY_INDEX_FILENAME)
+    if full:
+        index.clear()
+        return index.refresh(archive_root, workers=workers), index
+    return index.refresh(archive_root, load_json(data_dir / ARCHIVE_REGISTRY_FILENAME), workers=workers), index
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from audio_division.artifacts import scan_directory
+from curator.bounded_map import bounded_map
+
+DEFAULT_SCAN_WORKERS = 8
+# Albums queued per worker; bounds memory without starving the pool.
+SCAN_QUEUE_DEPTH = 4
+# How often a streaming scan waiting on slow albums checks for cancellation.
+CANCEL_POLL_SECONDS = 0.1
+
+ProgressCallback = Callable[[int, int, dict[str, Any]], None]
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def scan_workers(settings: dict[str, Any]) -> int:
+    """
+    `archive_paths.scan_workers` from the Audio Division settings, or
+    DEFAULT_SCAN_WORKERS when unset or invalid.
+    """
+    value = str(settings.get("archive_paths", {}).get("scan_workers") or "").strip()
+    try:
+        return max(1, int(value)) if value else DEFAULT_SCAN_WORKERS
+    except ValueError:
+        return DEFAULT_SCAN_WORKERS
+
+
+def list_archive_tree(archive_root: Path, workers: int) -> dict[Path, list[os.DirEntry]]:
+    """
+    The os.scandir() listing of every directory walk_album_roots() would
+    list, read on a pool of `workers` threads.
+
+    Symlinked directories are listed but not descended into, like the
+    walker. Each worker also resolves its entries' type checks, which cost
+    a stat() apiece on filesystems that do not report d_type (NFS, SMB),
+    so the walk that consumes the listings does no I/O of its own.
+    """
+    listings: dict[Path, list[os.DirEntry]] = {}
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="archive-scan")
+    try:
+        pending: dict[Future, Path] = {pool.submit(_list_directory, archive_root, True): archive_root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                entries, children = future.result()
+                listings[path] = entries
+                for child, descend in children:
+                    pending[pool.submit(_list_directory, child, descend)] = child
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return listings
+
+
+def _list_directory(directory: Path, descend: bool) -> tuple[list[os.DirEntry], list[tuple[Path, bool]]]:
+    entries = scan_directory(directory)
+    children = []
+    for entry in entries:
+        try:
+            entry.is_file()
+            if entry.is_dir():
+                children.append((directory / entry.name, not entry.is_symlink()))
+        except OSError:
+            continue
+    return entries, children if descend else []
+
+
+def map_albums(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int = 1,
+    progress: Callable[[int, int, T], None] | None = None,
+) -> Iterator[R]:
+    """
+    func(item) for every item, yielded in input order, through
+    curator.bounded_map with SCAN_QUEUE_DEPTH albums queued per worker.
+    """
+    return bounded_map(
+        func,
+        items,
+        workers=workers,
+        queue_depth=SCAN_QUEUE_DEPTH,
+        progress=progress,
+        thread_name_prefix="archive-scan",
+    )
+
+
+def stream_albums(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int = 1,
+    cancel: threading.Event | None = None,
+) -> Iterator[tuple[int, R]]:
+    """
+    (index, func(item)) for every item, yielded as items finish.
+
+    With workers > 1 items run on a bounded thread pool like map_albums(),
+    and finished items are yielded in completion order (index order
+    within a batch). Once `cancel` is set no further items are started
+    and the iterator stops without waiting for albums still in flight;
+    their results are discarded.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        for index, item in enumerate(items):
+            if cancel is not None and cancel.is_set():
+                return
+            yield index, func(item)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive-scan")
+    pending: dict[Future, int] = {}
+    remaining = enumerate(items)
+    cancelled = False
+
+    def submit(count: int) -> None:
+        for index, item in islice(remaining, count):
+            pending[pool.submit(func, item)] = index
+
+    try:
+        submit(workers * SCAN_QUEUE_DEPTH)
+        while pending:
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                return
+            done, _ = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            finished = sorted((pending.pop(future), future) for future in done)
+            submit(len(finished))
+            for index, future in finished:
+                yield index, future.result()
+    finally:
+        pool.shutdown(wait=not cancelled, cancel_futures=True)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
 import re
-from collections import Counter
+import threading
+import time
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from stat import S_ISDIR
+from typing import Any, Callable, Iterable
 
 from curator.atomic import atomic_write_text
 
@@ -17,6 +21,9 @@ PLAYLIST_SUFFIXES = {".m3u", ".m3u8"}
 PREFERRED_ARTWORK_FILENAMES = ("cover.jpg", "folder.jpg", "front.jpg", "cover.png", "folder.png")
 VALIDATION_MARKER_FILENAME = "STIGMA_VALIDATED.txt"
 DISC_FOLDER_PATTERN = re.compile(r"^(cd|disc)[ _-]?\d+$", re.IGNORECASE)
+# A directory modified this close to a listing may change again within the
+# same mtime tick, so that listing is not trusted later.
+RACY_WINDOW_NS = 2_000_000_000
 
 
 @dataclass(frozen=True)
@@ -28,6 +35,7 @@ class AlbumArtifacts:
     root_files: tuple[Path, ...]
     direct_audio_files: tuple[Path, ...]
     selected_artwork: Path | None
+    disc_folders: tuple[Path, ...] = ()
 
     def files_for(self, artifact: str) -> tuple[Path, ...]:
         return self.files.get(artifact, ())
@@ -103,21 +111,203 @@ class AlbumArtifacts:
 
 
 def detect_artifacts(album_path: str | Path | None) -> AlbumArtifacts:
-    path = Path(album_path) if album_path else Path("")
-    exists = bool(album_path) and path.exists()
-    available = exists and path.is_dir()
+    """
+    AlbumArtifacts for `album_path`, through the process-wide artifact_cache.
+    """
+    if not album_path:
+        return classify_artifacts(Path(""), [], exists=False, available=False)
+    return artifact_cache.detect(Path(album_path))
+
+
+class ArtifactCache:
+    """
+    Process-wide memo of detect_artifacts() results.
+
+    An entry is reused while the album folder's mtime_ns and those of the
+    disc folders it was classified from are unchanged: adding, removing or
+    renaming a file touches its directory, so a hit costs one stat() per
+    folder instead of a listing. Folders modified within RACY_WINDOW_NS of
+    the listing could change again within the same timestamp tick and are
+    not cached. Missing and non-directory paths are not cached either.
+
+    At most `max_entries` folders are kept, least recently used first out.
+    Results are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = 4096, *, clock: Callable[[], int] = time.time_ns) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[tuple[Any, ...], AlbumArtifacts]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def detect(self, path: Path) -> AlbumArtifacts:
+        key = str(path)
+        mtime_ns = directory_mtime(path)
+        if mtime_ns is None:
+            with self._lock:
+                self._entries.pop(key, None)
+                self.misses += 1
+            exists = path.exists()
+            return classify_artifacts(path, [], exists=exists, available=False)
+
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and album_unchanged(path, mtime_ns, *cached[0]):
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            return cached[1]
+
+        started_ns = self._clock()
+        detected, discs = scan_album(path, scan_directory(path), started_ns)
+        trusted = trusted_mtime(mtime_ns, started_ns) is not None and None not in discs.values()
+        with self._lock:
+            self.misses += 1
+            if trusted and self.max_entries > 0:
+                self._entries[key] = ((mtime_ns, tuple(discs.items())), detected)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self._entries.pop(key, None)
+        return detected
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Forget one folder, or everything; needed only after a change that
+        keeps its directory's mtime, such as restoring an old mtime.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def directory_mtime(path: str | Path) -> int | None:
+    """
+    st_mtime_ns of a directory; None when it is missing or not a directory.
+    """
     try:
-        root_files = tuple(item for item in path.iterdir() if item.is_file()) if available else ()
+        stat = os.stat(path)
     except OSError:
-        root_files = ()
+        return None
+    return stat.st_mtime_ns if S_ISDIR(stat.st_mode) else None
+
+
+artifact_cache = ArtifactCache()
+
+
+def scan_directory(directory: Path) -> list[os.DirEntry]:
+    """
+    One os.scandir() listing, in directory order; unreadable reads as empty.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def trusted_mtime(mtime_ns: int | None, started_ns: int) -> int | None:
+    """
+    `mtime_ns`, or None when it is missing or within RACY_WINDOW_NS of
+    `started_ns`, too recent to vouch for a listing taken then.
+    """
+    if mtime_ns is None or mtime_ns >= started_ns - RACY_WINDOW_NS:
+        return None
+    return mtime_ns
+
+
+def album_unchanged(
+    path: Path,
+    mtime_ns: int | None,
+    recorded_mtime: int | None,
+    recorded_discs: Iterable[tuple[str, int | None]],
+    *,
+    stat: Callable[[Path], int | None] = directory_mtime,
+) -> bool:
+    """
+    True when the album folder's current `mtime_ns` and the mtime of each
+    disc folder recorded by scan_album() match the record, so its previous
+    classification still holds.
+    """
+    return (
+        mtime_ns is not None
+        and recorded_mtime == mtime_ns
+        and all(disc_mtime is not None and stat(path / name) == disc_mtime for name, disc_mtime in recorded_discs)
+    )
+
+
+def scan_album(
+    path: Path,
+    entries: list[os.DirEntry],
+    started_ns: int,
+    *,
+    stat: Callable[[Path], int | None] = directory_mtime,
+    listing: Callable[[Path], list[os.DirEntry]] = scan_directory,
+) -> tuple[AlbumArtifacts, dict[str, int | None]]:
+    """
+    classify_artifacts() for the album folder listed as `entries`, plus the
+    trusted_mtime() of each disc folder it descended into, by name.
+
+    Callers stat the album folder before listing it, and each disc folder
+    is stat()ed here before its listing: a change in between leaves an
+    older mtime on record, which forces a fresh listing next time rather
+    than hiding it.
+    """
+    discs: dict[str, int | None] = {}
+
+    def scan(folder: Path) -> list[os.DirEntry]:
+        discs[folder.name] = trusted_mtime(stat(folder), started_ns)
+        return listing(folder)
+
+    return classify_artifacts(path, entries, scan=scan), discs
+
+
+def classify_artifacts(
+    path: Path,
+    entries: list[os.DirEntry],
+    *,
+    exists: bool = True,
+    available: bool = True,
+    scan: Callable[[Path], list[os.DirEntry]] = scan_directory,
+) -> AlbumArtifacts:
+    """
+    AlbumArtifacts for `path` from its directory listing. Disc folders are
+    listed through `scan`, so a walker that already listed them can hand
+    those listings back instead of reading the directory twice.
+
+    DirEntry type checks come from the listing itself on most
+    filesystems, so this costs one directory read per folder rather than
+    a stat() per file.
+    """
+    root_files = tuple(path / entry.name for entry in entries if _entry_is_file(entry))
     direct_audio = tuple(item for item in root_files if item.suffix.lower() in AUDIO_SUFFIXES)
+    discs = tuple(
+        path / entry.name
+        for entry in sorted(entries, key=lambda entry: entry.name.lower())
+        if is_disc_folder(Path(entry.name)) and _entry_is_dir(entry)
+    )
     disc_audio: list[Path] = []
-    if available:
-        for folder in _disc_folders(path):
-            try:
-                disc_audio.extend(item for item in folder.iterdir() if item.is_file() and item.suffix.lower() in AUDIO_SUFFIXES)
-            except OSError:
-                continue
+    for folder in discs:
+        disc_files = (folder / entry.name for entry in scan(folder) if _entry_is_file(entry))
+        disc_audio.extend(item for item in disc_files if item.suffix.lower() in AUDIO_SUFFIXES)
     files = {
         "audio": direct_audio + tuple(disc_audio),
         "artwork": tuple(item for item in root_files if item.suffix.lower() in ARTWORK_SUFFIXES),
@@ -127,7 +317,21 @@ def detect_artifacts(album_path: str | Path | None) -> AlbumArtifacts:
         "validation": tuple(item for item in root_files if item.name == VALIDATION_MARKER_FILENAME),
     }
     artwork = _select_preferred(files["artwork"], PREFERRED_ARTWORK_FILENAMES, casefold_sort=True)
-    return AlbumArtifacts(path, exists, available, files, root_files, direct_audio, artwork)
+    return AlbumArtifacts(path, exists, available, files, root_files, direct_audio, artwork, discs)
+
+
+def _entry_is_file(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
 
 
 def detect_album_artifacts(album_path: Path) -> dict[str, Any]:
@@ -146,16 +350,6 @@ def is_disc_folder(path: Path) -> bool:
     return bool(DISC_FOLDER_PATTERN.match(path.name.strip()))
 
 
-def _disc_folders(album_path: Path) -> list[Path]:
-    try:
-        return sorted(
-            (path for path in album_path.iterdir() if path.is_dir() and is_disc_folder(path)),
-            key=lambda path: path.name.lower(),
-        )
-    except OSError:
-        return []
-
-
 def _select_preferred(
     files: tuple[Path, ...],
     filenames: tuple[str, ...],
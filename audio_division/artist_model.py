@@ -20,6 +20,7 @@ from audio_division.validation_truth import (
     validation_evidence_from_lifecycle_row,
     validation_evidence_from_validated_index,
 )
+from curator.metadata_store import load_metadata_cache
 
 
 SECTION_TYPES = {
@@ -88,7 +89,7 @@ def load_artist_file(path: Path, data_dir: Path | None = None) -> Artist:
         path.read_text(encoding="utf-8"),
         source_file=path,
         lifecycle_registry=_load_json(data_dir / "lifecycle_registry.json"),
-        metadata_cache=_load_json(data_dir / "metadata_cache.json"),
+        metadata_cache=load_metadata_cache(data_dir),
         validated_index=_load_json(data_dir / "validated_albums.json"),
         archive_registry=archive_registry,
         identity_registry=_load_json(data_dir / "identity_registry.json"),
@@ -327,7 +328,8 @@ def _deezer_artist_id(text: str) -> str | None:
 
 
 def _expanded_at(text: str) -> str:
-    for line in text.splitlines():
+    # Delta expansions append their own stamp; the last one is the latest.
+    for line in reversed(text.splitlines()):
         if line.startswith("# expanded_at:"):
             return line.split(":", 1)[1].strip()
     return ""
@@ -3,10 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable
 
-from audio_division.archive_registry import build_archive_registry, write_archive_registry
+from audio_division.archive_registry import write_archive_registry
+from audio_division.archive_registry_index import refresh_archive_registry
+from audio_division.archive_scan import scan_workers
 from audio_division.integration import run_audio_division_process_album
 from audio_division.revalidation import revalidate_archive, write_archive_revalidation_report
-from curator.lifecycle import build_lifecycle_registry, write_registry, write_reports
+from curator.atomic import atomic_batch
+from curator.lifecycle import LIFECYCLE_MANIFEST_FILENAME, build_lifecycle_registry, write_registry, write_reports
+from curator.report_aggregates import aggregate_registry
+from curator.validation_log_index import VALIDATION_LOG_INDEX_FILENAME
 from curator.validator_evidence import collect_validation_evidence, write_validation_reports
 
 
@@ -50,8 +55,10 @@ def refresh_archive(settings: dict[str, Any], data_dir: Path, reports_dir: Path)
     archive_root = _archive_root(settings)
     if not archive_root:
         return {"result": "skipped", "reason": "Main Archive Root is not configured", "registry": {}}
-    registry = build_archive_registry(archive_root)
-    write_archive_registry(registry, data_dir, reports_dir)
+    registry, index = refresh_archive_registry(archive_root, data_dir, workers=scan_workers(settings))
+    with atomic_batch():
+        write_archive_registry(registry, data_dir, reports_dir)
+        index.save()
     return {
         "result": "success",
         "archive_root": str(archive_root),
@@ -64,7 +71,7 @@ def verify_archive(registry: dict[str, Any], settings: dict[str, Any], reports_d
     archive_root = Path(str(registry.get("archive_root") or _archive_root(settings) or ""))
     if not registry or not archive_root:
         return {"result": "skipped", "reason": "Archive registry is unavailable"}
-    report = revalidate_archive(registry, archive_root)
+    report = revalidate_archive(registry, archive_root, workers=scan_workers(settings))
     write_archive_revalidation_report(report, reports_dir)
     summary = report.get("summary", {})
     return {
@@ -84,11 +91,20 @@ def refresh_lifecycle(
     release_folder: Path | None = None,
 ) -> dict[str, Any]:
     roots = _validation_roots(settings, data_dir, release_folder)
-    evidence = collect_validation_evidence(data_dir, roots)
-    registry = build_lifecycle_registry(data_dir, validation_evidence=evidence)
+    evidence = collect_validation_evidence(
+        data_dir,
+        roots,
+        index_path=data_dir / VALIDATION_LOG_INDEX_FILENAME,
+    )
+    registry = build_lifecycle_registry(
+        data_dir,
+        validation_evidence=evidence,
+        manifest_path=data_dir / LIFECYCLE_MANIFEST_FILENAME,
+    )
     write_registry(registry, data_dir / "lifecycle_registry.json")
-    write_reports(registry, reports_dir)
-    write_validation_reports(registry, reports_dir)
+    aggregates = aggregate_registry(registry)
+    write_reports(registry, reports_dir, aggregates=aggregates)
+    write_validation_reports(registry, reports_dir, aggregates=aggregates)
     return {
         "result": "success",
         "albums": len(registry.get("albums", [])),
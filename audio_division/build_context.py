@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from audio_division.dashboard import load_json
+from audio_division.library import build_library
+from audio_division.settings import load_audio_division_settings
+from curator.metadata_store import JSON_FILENAME, MANIFEST_FILENAME, SHARDED_DIRNAME, load_metadata_cache
+from curator.validator_evidence import DEFAULT_EVIDENCE_WORKERS
+
+SETTINGS = "data/audio_division_settings.json"
+LIFECYCLE = "data/lifecycle_registry.json"
+IDENTITY = "data/identity_registry.json"
+ARCHIVE_REGISTRY = "data/archive_registry.json"
+VALIDATED = "data/validated_albums.json"
+PROCESSING_QUEUE = "data/processing_queue.json"
+METADATA = (f"data/{JSON_FILENAME}", f"data/{SHARDED_DIRNAME}")
+LIBRARY = (LIFECYCLE, IDENTITY, *METADATA, SETTINGS)
+
+
+class BuildContext:
+    """
+    Shared sources for one build.
+
+    Every build_*.py script runs its build() against a context; a lone
+    script gets its own, and build_all.py hands one to every stage. Each
+    JSON source is parsed once and handed to every build that reads it; a
+    source rewritten by an upstream build is reloaded on the next request.
+    Builds must treat what they receive as read-only.
+    """
+
+    def __init__(self, root: Path, *, evidence_workers: int = DEFAULT_EVIDENCE_WORKERS) -> None:
+        self.root = Path(root)
+        self.data_dir = self.root / "data"
+        self.evidence_workers = evidence_workers
+        self._values: dict[str, tuple[Any, Any]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads: dict[str, int] = {}
+
+    def _memo(self, key: str, signature: Any, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            cached = self._values.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            value = load()
+            self._values[key] = (signature, value)
+            self.loads[key] = self.loads.get(key, 0) + 1
+            return value
+
+    def json(self, relative: str) -> dict[str, Any]:
+        path = self.root / relative
+        return self._memo(relative, stat_signature(path), lambda: load_json(path))
+
+    def settings(self) -> dict[str, Any]:
+        path = self.root / SETTINGS
+        return self._memo("settings", stat_signature(path), lambda: load_audio_division_settings(path))
+
+    def _metadata_signature(self) -> tuple[Any, ...]:
+        return (stat_signature(self.root / METADATA[0]), stat_signature(self.root / METADATA[1] / MANIFEST_FILENAME))
+
+    def metadata(self) -> dict[str, Any]:
+        return self._memo("metadata", self._metadata_signature(), lambda: load_metadata_cache(self.data_dir))
+
+    def archive_root(self) -> Path | None:
+        archive_root = self.settings().get("archive_paths", {}).get("main_archive_root", "")
+        return Path(archive_root) if archive_root else None
+
+    def library(self) -> dict[str, Any]:
+        lifecycle, identity, metadata = self.json(LIFECYCLE), self.json(IDENTITY), self.metadata()
+        signature = (
+            stat_signature(self.root / LIFECYCLE),
+            stat_signature(self.root / IDENTITY),
+            self._metadata_signature(),
+            self.archive_root(),
+        )
+        return self._memo(
+            "library",
+            signature,
+            lambda: build_library(lifecycle, identity, metadata, self.archive_root()),
+        )
+
+    def reports_dir(self, *, from_settings: bool = False) -> Path:
+        if not from_settings:
+            return self.root / "reports"
+        reports_dir = Path(self.settings().get("reports", {}).get("reports_directory") or self.root / "reports")
+        return reports_dir if reports_dir.is_absolute() else self.root / reports_dir
+
+
+def stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
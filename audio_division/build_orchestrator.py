@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import build_archive_actions
+import build_archive_artifacts
+import build_archive_audit
+import build_archive_identity_recovery
+import build_archive_intelligence
+import build_archive_opportunities
+import build_archive_path_resolution
+import build_archive_readiness
+import build_archive_reconciliation
+import build_archive_registry
+import build_artwork_browser
+import build_identity_registry
+import build_lifecycle_registry
+import build_lifecycle_state
+import build_metadata_intelligence
+import build_opportunities_center
+from audio_division.build_context import (
+    ARCHIVE_REGISTRY,
+    IDENTITY,
+    LIBRARY,
+    LIFECYCLE,
+    METADATA,
+    PROCESSING_QUEUE,
+    SETTINGS,
+    VALIDATED,
+    BuildContext,
+    stat_signature,
+)
+from audio_division.dashboard import load_json
+from curator.atomic import atomic_write_text
+from curator.validator_evidence import DEFAULT_EVIDENCE_WORKERS
+
+BUILD_STATE_FILENAME = "build_state.json"
+BUILD_STATE_SCHEMA = 1
+# Top-level JSON keys that change on every rebuild without changing content.
+VOLATILE_KEYS = ("generated_at", "source_registry_generated_at")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One build step: the files it reads and writes, relative to the repo
+    root, and the function that runs it (a build_*.py script's build()).
+
+    `external` stages also read outside their tracked inputs (the archive
+    root, evidence roots, incoming folders), so they run every time;
+    dependents still skip when their outputs come out unchanged.
+    """
+
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    run: Callable[[BuildContext], str]
+    external: bool = False
+
+
+def _reports(*names: str) -> tuple[str, ...]:
+    return tuple(f"reports/{name}" for name in names)
+
+
+# Each stage runs its build_*.py script's build(). Report files are outputs
+# too, so a deleted or edited report reruns its stage. Reconciliation and
+# audit write to the reports directory from the settings and always run.
+# build_metadata_cache.py is not a stage: it fetches from Deezer and is run
+# on purpose. Its cache is an input here.
+STAGES = (
+    Stage(
+        "lifecycle",
+        (VALIDATED,),
+        (
+            LIFECYCLE,
+            *_reports(
+                "lifecycle_summary.md",
+                "discovery_gap_report.md",
+                "shipment_gap_report.md",
+                "validation_gap_report.md",
+                "validation_evidence_report.md",
+                "validation_coverage_report.md",
+                "validation_age_report.md",
+                "validation_confidence_report.md",
+            ),
+        ),
+        build_lifecycle_registry.build,
+        external=True,
+    ),
+    # Identity also re-reads the validation logs the lifecycle registry names.
+    Stage(
+        "identity",
+        (LIFECYCLE,),
+        (IDENTITY, *_reports("identity_resolution_report.md", "unresolved_identity_report.md")),
+        build_identity_registry.build,
+        external=True,
+    ),
+    Stage(
+        "archive_intelligence",
+        (LIFECYCLE,),
+        _reports("archive_health_report.md", "artist_coverage_report.md", "backlog_report.md", "gap_analysis_report.md"),
+        build_archive_intelligence.build,
+    ),
+    Stage(
+        "archive_identity_recovery",
+        (IDENTITY, LIFECYCLE),
+        _reports(
+            "archive_identity_recovery_report.md",
+            "recoverable_identity_report.md",
+            "unrecoverable_identity_report.md",
+            "archive_strength_report.md",
+        ),
+        build_archive_identity_recovery.build,
+    ),
+    Stage(
+        "metadata_intelligence",
+        (LIFECYCLE, *METADATA),
+        _reports(
+            "metadata_status_report.md",
+            "collection_intelligence_report.md",
+            "genre_report.md",
+            "label_report.md",
+            "release_year_report.md",
+        ),
+        build_metadata_intelligence.build,
+    ),
+    Stage(
+        "archive_registry",
+        (SETTINGS,),
+        (ARCHIVE_REGISTRY, *_reports("archive_registry_report.md", "archive_artifact_coverage_report.md")),
+        build_archive_registry.build,
+        external=True,
+    ),
+    Stage(
+        "archive_reconciliation",
+        (SETTINGS, ARCHIVE_REGISTRY),
+        (),
+        build_archive_reconciliation.build,
+        external=True,
+    ),
+    Stage(
+        "archive_audit",
+        (SETTINGS, ARCHIVE_REGISTRY, IDENTITY, LIFECYCLE, VALIDATED),
+        (),
+        build_archive_audit.build,
+        external=True,
+    ),
+    Stage(
+        "archive_artifacts",
+        (IDENTITY,),
+        _reports("archive_artifact_report.md"),
+        build_archive_artifacts.build,
+        external=True,
+    ),
+    Stage(
+        "archive_path_resolution",
+        LIBRARY,
+        _reports("archive_path_resolution_report.md"),
+        build_archive_path_resolution.build,
+    ),
+    Stage("archive_readiness", LIBRARY, _reports("archive_readiness_report.md"), build_archive_readiness.build),
+    Stage(
+        "archive_opportunities",
+        LIBRARY,
+        _reports("archive_opportunities_report.md"),
+        build_archive_opportunities.build,
+    ),
+    Stage(
+        "opportunities_center",
+        LIBRARY,
+        _reports("opportunities_report.md", "archive_ready_report.md", "review_candidates_report.md"),
+        build_opportunities_center.build,
+    ),
+    Stage(
+        "artwork_browser",
+        (*LIBRARY, ARCHIVE_REGISTRY),
+        _reports("artwork_coverage_report.md"),
+        build_artwork_browser.build,
+    ),
+    Stage(
+        "archive_actions",
+        (LIFECYCLE, IDENTITY, *METADATA),
+        _reports("archive_actions_report.md"),
+        build_archive_actions.build,
+    ),
+    Stage(
+        "lifecycle_state",
+        (*LIBRARY, ARCHIVE_REGISTRY, PROCESSING_QUEUE),
+        _reports("lifecycle_state_report.md"),
+        build_lifecycle_state.build,
+        external=True,
+    ),
+)
+
+
+def stage_dependencies(stages: tuple[Stage, ...] | list[Stage]) -> dict[str, set[str]]:
+    """
+    Stage name -> names of the stages producing any of its inputs.
+    """
+    producers = {output: stage.name for stage in stages for output in stage.outputs}
+    return {
+        stage.name: {producers[item] for item in stage.inputs if item in producers and producers[item] != stage.name}
+        for stage in stages
+    }
+
+
+def select_stages(stages: tuple[Stage, ...], names: list[str] | None) -> list[Stage]:
+    """
+    The named stages plus everything upstream of them, in declaration order.
+    """
+    if not names:
+        return list(stages)
+    known = {stage.name for stage in stages}
+    unknown = sorted(set(names) - known)
+    if unknown:
+        raise ValueError(f"unknown build stage(s): {', '.join(unknown)}")
+    dependencies = stage_dependencies(stages)
+    wanted: set[str] = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(dependencies[name])
+    return [stage for stage in stages if stage.name in wanted]
+
+
+class _Fingerprints:
+    """
+    Content hashes of build inputs and outputs, memoized per run by
+    (size, mtime_ns). JSON files hash without VOLATILE_KEYS, so a rebuild
+    that only moves a timestamp does not invalidate dependents.
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[str, tuple[Any, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def of(self, path: Path) -> str | None:
+        signature = stat_signature(path)
+        with self._lock:
+            cached = self._memo.get(str(path))
+        if cached is not None and cached[0] == signature and not path.is_dir():
+            return cached[1]
+        value = self._compute(path)
+        with self._lock:
+            self._memo[str(path)] = (signature, value)
+        return value
+
+    def _compute(self, path: Path) -> str | None:
+        if path.is_dir():
+            digest = hashlib.sha256()
+            for child in sorted(item for item in path.rglob("*") if item.is_file()):
+                digest.update(f"{child.relative_to(path).as_posix()}\0{self.of(child)}\n".encode("utf-8"))
+            return digest.hexdigest()
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if path.suffix == ".json":
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                stable = {key: value for key, value in data.items() if key not in VOLATILE_KEYS}
+                raw = json.dumps(stable, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+
+def load_build_state(path: Path) -> dict[str, Any]:
+    data = load_json(path)
+    if data.get("schema") != BUILD_STATE_SCHEMA:
+        return {"schema": BUILD_STATE_SCHEMA, "stages": {}}
+    data.setdefault("stages", {})
+    return data
+
+
+def run_build(
+    root: Path,
+    *,
+    stages: tuple[Stage, ...] = STAGES,
+    only: list[str] | None = None,
+    workers: int = os.cpu_count() or 1,
+    force: bool = False,
+    evidence_workers: int = DEFAULT_EVIDENCE_WORKERS,
+) -> dict[str, Any]:
+    """
+    Run the selected stages in dependency order, independent stages on a
+    thread pool, skipping any stage whose input and output hashes match
+    its last successful run.
+
+    A failed stage does not stop unrelated stages; its dependents are
+    reported as blocked. Returns per-stage status, timing and message.
+    """
+    root = Path(root)
+    selected = select_stages(stages, only)
+    dependencies = {name: deps for name, deps in stage_dependencies(selected).items()}
+    state_path = root / "data" / BUILD_STATE_FILENAME
+    state = load_build_state(state_path)
+    state_lock = threading.Lock()
+    ctx = BuildContext(root, evidence_workers=evidence_workers)
+    fingerprints = _Fingerprints()
+    results: dict[str, dict[str, Any]] = {}
+
+    def fingerprint_all(items: tuple[str, ...]) -> dict[str, str | None]:
+        return {item: fingerprints.of(root / item) for item in items}
+
+    def execute(stage: Stage) -> dict[str, Any]:
+        started = time.perf_counter()
+        inputs = fingerprint_all(stage.inputs)
+        previous = state["stages"].get(stage.name, {})
+        if (
+            not force
+            and not stage.external
+            and previous.get("inputs") == inputs
+            and previous.get("outputs") == fingerprint_all(stage.outputs)
+            and all(value is not None for value in previous.get("outputs", {}).values())
+        ):
+            return {"status": "skipped", "seconds": time.perf_counter() - started, "message": "inputs unchanged"}
+        message = stage.run(ctx)
+        record = {"inputs": inputs, "outputs": fingerprint_all(stage.outputs)}
+        with state_lock:
+            state["stages"][stage.name] = record
+        return {"status": "ran", "seconds": time.perf_counter() - started, "message": message}
+
+    pending = {stage.name: stage for stage in selected}
+    running: dict[Future, str] = {}
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="build-stage")
+    try:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                deps = dependencies[name]
+                if any(results.get(dep, {}).get("status") in ("failed", "blocked") for dep in deps):
+                    del pending[name]
+                    results[name] = {"status": "blocked", "seconds": 0.0, "message": "upstream stage failed"}
+                elif all(dep in results for dep in deps):
+                    del pending[name]
+                    running[pool.submit(execute, stage)] = name
+            if not running:
+                if pending:
+                    raise ValueError(f"build stages form a cycle: {', '.join(sorted(pending))}")
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    results[name] = {"status": "failed", "seconds": 0.0, "message": f"{type(exc).__name__}: {exc}"}
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        atomic_write_text(state_path, json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+
+    return {
+        "stages": [{"stage": stage.name, **results[stage.name]} for stage in selected],
+        "source_loads": dict(ctx.loads),
+    }
+
+
+def render_build_summary(result: dict[str, Any]) -> str:
+    rows = result["stages"]
+    width = max((len(row["stage"]) for row in rows), default=5)
+    lines = [f"{'Stage'.ljust(width)}  Status   Seconds  Result"]
+    for row in rows:
+        lines.append(f"{row['stage'].ljust(width)}  {row['status'].ljust(7)}  {row['seconds']:7.2f}  {row['message']}")
+    total = sum(row["seconds"] for row in rows)
+    lines.append(f"{'total'.ljust(width)}           {total:7.2f}")
+    return "\n".join(lines) + "\n"
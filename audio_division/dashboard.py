@@ -7,6 +7,7 @@ from typing import Any
 from audio_division.actions import ACTION_CATEGORIES, action_summary, generate_archive_actions
 from audio_division.metadata_status import metadata_coverage as compute_metadata_coverage
 from audio_division.operations import operation_summary
+from audio_division.registry_store import load_registry, load_registry_metadata
 
 
 def load_json(path: Path) -> dict[str, Any]:
@@ -21,10 +22,10 @@ def load_json(path: Path) -> dict[str, Any]:
 
 def load_dashboard_sources(data_dir: Path) -> dict[str, dict[str, Any]]:
     return {
-        "lifecycle": load_json(data_dir / "lifecycle_registry.json"),
-        "identity": load_json(data_dir / "identity_registry.json"),
-        "metadata": load_json(data_dir / "metadata_cache.json"),
-        "operation_history": load_json(data_dir / "operation_history.json"),
+        "lifecycle": load_registry(data_dir / "lifecycle_registry.json"),
+        "identity": load_registry(data_dir / "identity_registry.json"),
+        "metadata": load_registry_metadata(data_dir),
+        "operation_history": load_registry(data_dir / "operation_history.json"),
     }
 
 
@@ -7,7 +7,7 @@ from typing import Any
 from audio_division.album_truth import album_truth, truth_summary as album_truth_summary
 from audio_division.artifacts import detect_artifacts
 from audio_division.archive_readiness import annotate_library_readiness
-from audio_division.dashboard import load_json
+from audio_division.registry_store import load_registry, load_registry_metadata
 from audio_division.lifecycle_state import attach_lifecycle_state
 from audio_division.metadata_status import album_metadata_status
 from audio_division.validation_truth import (
@@ -20,9 +20,9 @@ from curator.atomic import atomic_write_text
 
 def load_library_sources(data_dir: Path) -> dict[str, dict[str, Any]]:
     return {
-        "lifecycle": load_json(data_dir / "lifecycle_registry.json"),
-        "identity": load_json(data_dir / "identity_registry.json"),
-        "metadata": load_json(data_dir / "metadata_cache.json"),
+        "lifecycle": load_registry(data_dir / "lifecycle_registry.json"),
+        "identity": load_registry(data_dir / "identity_registry.json"),
+        "metadata": load_registry_metadata(data_dir),
     }
 
 
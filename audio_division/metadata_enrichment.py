@@ -10,6 +10,7 @@ from typing import Any
 
 from audio_division.metadata_status import album_metadata_status
 from curator.atomic import atomic_write_text
+from curator.metadata_store import load_metadata_cache, open_metadata_store
 
 ENRICHMENT_SOURCE = "identity_registry"
 
@@ -131,13 +132,16 @@ def rebuild_metadata_enrichment(
     """Rebuild local enrichment data without touching archive files or the network."""
     data_dir = Path(data_dir)
     reports_dir = Path(reports_dir)
-    cache_path = Path(cache_path) if cache_path else data_dir / "metadata_cache.json"
+    store = None if cache_path else open_metadata_store(data_dir)
     cache, result = enrich_metadata(
         _load_json(data_dir / "identity_registry.json"),
         _load_json(data_dir / "lifecycle_registry.json"),
-        _load_json(cache_path),
+        _load_json(Path(cache_path)) if cache_path else load_metadata_cache(data_dir),
     )
-    atomic_write_text(cache_path, json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+    if store is not None:
+        store.save(cache)
+    else:
+        atomic_write_text(Path(cache_path), json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
     reports_dir.mkdir(parents=True, exist_ok=True)
     atomic_write_text(reports_dir / "metadata_enrichment_report.md", render_enrichment_report(result))
     return result
@@ -4,7 +4,7 @@ from collections import Counter
 from pathlib import Path
 from typing import Any
 
-from curator.atomic import atomic_write_text
+from curator.atomic import atomic_batch, atomic_write_text
 
 METADATA_STATES = ("CACHED", "AVAILABLE_NOT_CACHED", "MISSING", "UNKNOWN")
 ALBUM_FIELDS = ("upc", "label", "genres", "contributors", "release_date")
@@ -85,8 +85,8 @@ def render_metadata_status_report(lifecycle: dict[str, Any], metadata: dict[str,
     return "\n".join(lines) + "\n"
 
 
-def render_collection_intelligence_report(metadata: dict[str, Any]) -> str:
-    stats = collection_statistics(metadata)
+def render_collection_intelligence_report(metadata: dict[str, Any], *, stats: dict[str, Any] | None = None) -> str:
+    stats = stats or collection_statistics(metadata)
     lines = [
         "# Collection Intelligence Report",
         "",
@@ -116,12 +116,13 @@ def render_simple_counter_report(title: str, heading: str, rows: list[tuple[Any,
 
 def write_metadata_reports(lifecycle: dict[str, Any], metadata: dict[str, Any], reports_dir: Path) -> None:
     reports_dir.mkdir(parents=True, exist_ok=True)
-    stats = collection_statistics(metadata)
-    atomic_write_text(reports_dir / "metadata_status_report.md", render_metadata_status_report(lifecycle, metadata))
-    atomic_write_text(reports_dir / "collection_intelligence_report.md", render_collection_intelligence_report(metadata))
-    atomic_write_text(reports_dir / "genre_report.md", render_simple_counter_report("Genre Report", "Genre", stats["genres"]))
-    atomic_write_text(reports_dir / "label_report.md", render_simple_counter_report("Label Report", "Label", stats["top_labels"]))
-    atomic_write_text(reports_dir / "release_year_report.md", render_simple_counter_report("Release Year Report", "Year", stats["release_years"]))
+    with atomic_batch():
+        stats = collection_statistics(metadata)
+        atomic_write_text(reports_dir / "metadata_status_report.md", render_metadata_status_report(lifecycle, metadata))
+        atomic_write_text(reports_dir / "collection_intelligence_report.md", render_collection_intelligence_report(metadata, stats=stats))
+        atomic_write_text(reports_dir / "genre_report.md", render_simple_counter_report("Genre Report", "Genre", stats["genres"]))
+        atomic_write_text(reports_dir / "label_report.md", render_simple_counter_report("Label Report", "Label", stats["top_labels"]))
+        atomic_write_text(reports_dir / "release_year_report.md", render_simple_counter_report("Release Year Report", "Year", stats["release_years"]))
 
 
 def _status(state: str, reason: str, cached_fields: dict[str, bool], missing_fields: list[str]) -> dict[str, Any]:
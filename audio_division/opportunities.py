@@ -14,7 +14,7 @@ from audio_division.maintenance import (
     CATEGORY_WARNINGS,
     maintenance_records,
 )
-from curator.atomic import atomic_write_text
+from curator.atomic import atomic_batch, atomic_write_text
 
 OPPORTUNITY_CATEGORIES = (
     "missing_nfo",
@@ -217,9 +217,10 @@ def render_review_candidates_report(opportunities: list[dict[str, Any]]) -> str:
 
 def write_hub_opportunity_reports(opportunities: list[dict[str, Any]], reports_dir: Path) -> None:
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(reports_dir / "opportunities_report.md", render_hub_opportunities_report(opportunities))
-    atomic_write_text(reports_dir / "archive_ready_report.md", render_archive_ready_report(opportunities))
-    atomic_write_text(reports_dir / "review_candidates_report.md", render_review_candidates_report(opportunities))
+    with atomic_batch():
+        atomic_write_text(reports_dir / "opportunities_report.md", render_hub_opportunities_report(opportunities))
+        atomic_write_text(reports_dir / "archive_ready_report.md", render_archive_ready_report(opportunities))
+        atomic_write_text(reports_dir / "review_candidates_report.md", render_review_candidates_report(opportunities))
 
 
 def _append_if(
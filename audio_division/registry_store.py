@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from curator.metadata_store import ENTITY_KINDS, JSON_FILENAME, MANIFEST_FILENAME, SHARDED_DIRNAME, load_metadata_cache
+
+
+def _readonly(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError("registry views are read-only; copy with thaw() before modifying")
+
+
+class ReadOnlyDict(dict):
+    """
+    dict that refuses mutation. It is still a dict, so isinstance checks,
+    .get(), iteration and json.dumps() work unchanged; dict(view) gives a
+    mutable shallow copy.
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """
+    list that refuses mutation; list(view) gives a mutable shallow copy.
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def copy(self) -> list[Any]:
+        return list(self)
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """
+    Read-only deep view of decoded JSON; frozen parts are reused as is.
+    """
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return ReadOnlyList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Mutable deep copy of a frozen (or plain) JSON value.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _frozen_object(pairs: list[tuple[str, Any]]) -> ReadOnlyDict:
+    # json.loads builds objects bottom-up, so nested objects are already
+    # frozen here; only arrays (which have no hook) need converting.
+    return ReadOnlyDict((key, _freeze_array(value) if type(value) is list else value) for key, value in pairs)
+
+
+def _freeze_array(values: list[Any]) -> ReadOnlyList:
+    return ReadOnlyList(_freeze_array(value) if type(value) is list else value for value in values)
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+EMPTY = ReadOnlyDict()
+
+
+class RegistryStore:
+    """
+    Process-wide cache of decoded registry files.
+
+    Each file is parsed once and reused while its (inode, size, mtime_ns)
+    is unchanged. atomic_write_text() replaces the inode, so even a
+    same-size rewrite within one timestamp tick is parsed again on the
+    next request. Values are read-only views shared by every caller, so a
+    refresh that reads four registries costs four stat() calls when
+    nothing changed. Callers that need to modify a registry take
+    thaw(value) first.
+
+    Missing, unreadable or non-object files read as an empty mapping, like
+    dashboard.load_json().
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Any, Any]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: str, signature: Any, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another thread may have parsed it while we waited.
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == signature:
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+            value = load()
+            with self._lock:
+                self._entries[key] = (signature, value)
+            return value
+
+    def load(self, path: Path) -> dict[str, Any]:
+        path = Path(path)
+        signature = _stat_signature(path)
+        if signature is None:
+            return EMPTY
+        return self._get(str(path.resolve()), signature, lambda: _decode(path))
+
+    def metadata(self, data_dir: Path) -> dict[str, Any]:
+        """
+        load_metadata_cache() for `data_dir`, for either backend. Every
+        shard write renames into its kind directory, so the directories'
+        stats change along with the manifest's.
+        """
+        data_dir = Path(data_dir)
+        sharded = data_dir / SHARDED_DIRNAME
+        signature = (
+            _stat_signature(data_dir / JSON_FILENAME),
+            _stat_signature(sharded / MANIFEST_FILENAME),
+            *(_stat_signature(sharded / kind) for kind in ENTITY_KINDS),
+        )
+        return self._get(
+            f"metadata:{data_dir.resolve()}",
+            signature,
+            lambda: freeze(load_metadata_cache(data_dir)),
+        )
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """
+        Forget one file, or everything; needed only after an in-place
+        write that keeps the size within one timestamp tick.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(path).resolve()), None)
+
+    def clear(self) -> None:
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def _decode(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"), object_pairs_hook=_frozen_object)
+    except Exception:
+        return EMPTY
+    return data if isinstance(data, dict) else EMPTY
+
+
+registry_store = RegistryStore()
+
+
+def load_registry(path: Path) -> dict[str, Any]:
+    return registry_store.load(path)
+
+
+def load_registry_metadata(data_dir: Path) -> dict[str, Any]:
+    return registry_store.metadata(data_dir)
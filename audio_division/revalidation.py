@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import json
 import re
+import threading
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Iterator
 
 from audio_division.archive_audit import broken_playlist_references, broken_sfv_references
-from audio_division.archive_registry import album_entry, discover_album_folders
+from audio_division.archive_registry import album_entry, walk_album_roots
+from audio_division.archive_scan import ProgressCallback, stream_albums
 from audio_division.artifacts import AUDIO_SUFFIXES, AlbumArtifacts, detect_artifacts, is_disc_folder
 from audio_division.physical_archive import archive_identity_for_row, build_identity_lookup
+from audio_division.registry_store import load_registry
 from audio_division.validation_truth import (
     merge_validation_evidence,
     validation_evidence_from_identity_release,
@@ -42,7 +44,10 @@ CHECKS = (
 )
 
 DISC_NUMBER_RE = re.compile(r"^(?:cd|disc)[ _-]?(\d+)$", re.IGNORECASE)
-ProgressCallback = Callable[[int, int, dict[str, Any]], None]
+
+
+class RevalidationCancelled(Exception):
+    """Raised by revalidate_archive() when its `cancel` event is set before every album is checked."""
 
 
 def revalidate_archive(
@@ -53,8 +58,60 @@ def revalidate_archive(
     lifecycle_registry: dict[str, Any] | None = None,
     validated_index: dict[str, Any] | None = None,
     progress: ProgressCallback | None = None,
+    detected_artifacts: dict[str, AlbumArtifacts] | None = None,
+    workers: int = 1,
+    cancel: threading.Event | None = None,
 ) -> dict[str, Any]:
-    """Read-only revalidation pass across every album in the archive registry."""
+    """Read-only revalidation pass across every album in the archive registry.
+
+    `detected_artifacts` maps archive paths to artifacts a walk already
+    classified; those folders are not listed again. With workers > 1
+    albums are checked on a thread pool and `progress` reports them as
+    they finish; results are put back in registry order, so the report is
+    the same as a serial run. Setting `cancel` stops the pass and raises
+    RevalidationCancelled.
+    """
+    archive_root = archive_root or Path(str(archive_registry.get("archive_root") or ""))
+    rows = list(archive_registry.get("albums", []))
+    results: list[dict[str, Any] | None] = [None] * len(rows)
+    stream = stream_revalidation(
+        {"albums": rows},
+        archive_root,
+        identity_registry=identity_registry,
+        lifecycle_registry=lifecycle_registry,
+        validated_index=validated_index,
+        detected_artifacts=detected_artifacts,
+        workers=workers,
+        cancel=cancel,
+    )
+    done = 0
+    for index, result in stream:
+        results[index] = result
+        done += 1
+        if progress:
+            progress(done, len(rows), rows[index])
+    if done < len(rows):
+        raise RevalidationCancelled(f"Revalidation cancelled after {done} of {len(rows)} albums.")
+    return revalidation_report(archive_root, results)
+
+
+def stream_revalidation(
+    archive_registry: dict[str, Any],
+    archive_root: Path | None = None,
+    *,
+    identity_registry: dict[str, Any] | None = None,
+    lifecycle_registry: dict[str, Any] | None = None,
+    validated_index: dict[str, Any] | None = None,
+    detected_artifacts: dict[str, AlbumArtifacts] | None = None,
+    workers: int = 1,
+    cancel: threading.Event | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """(row index, revalidate_album() result) for each registry album, as albums finish.
+
+    With workers > 1 albums are checked on a bounded thread pool, so
+    results arrive in completion order. Once `cancel` is set no further
+    albums are started and the stream ends early.
+    """
     archive_root = archive_root or Path(str(archive_registry.get("archive_root") or ""))
     identity_registry = identity_registry if identity_registry is not None else load_default_json("identity_registry.json")
     lifecycle_registry = lifecycle_registry if lifecycle_registry is not None else load_default_json("lifecycle_registry.json")
@@ -66,14 +123,8 @@ def revalidate_archive(
         for row in (lifecycle_registry or {}).get("albums", [])
         if isinstance(row, dict) and row.get("album_id")
     }
-    rows = list(archive_registry.get("albums", []))
-    total = len(rows)
-    albums = []
-    issues = []
 
-    for index, row in enumerate(rows, start=1):
-        if progress:
-            progress(index, total, row)
+    def check(row: dict[str, Any]) -> dict[str, Any]:
         identity_release = archive_identity_for_row(row, identity_lookup)
         album_id = identity_release.get("discovery_identity", {}).get("deezer_album_id", "")
         validation_evidence = merge_validation_evidence(
@@ -81,17 +132,26 @@ def revalidate_archive(
             validation_evidence_from_lifecycle_row(lifecycle_by_album_id.get(str(album_id))),
             validation_evidence_from_identity_release(identity_release),
         )
-        result = revalidate_album(row, archive_root, validation_evidence=validation_evidence)
-        albums.append(result)
-        issues.extend(result["issues"])
+        return revalidate_album(
+            row,
+            archive_root,
+            validation_evidence=validation_evidence,
+            detected_artifacts=(detected_artifacts or {}).get(str(row.get("archive_path") or "")),
+        )
 
+    return stream_albums(check, archive_registry.get("albums", []), workers=workers, cancel=cancel)
+
+
+def revalidation_report(archive_root: Path, albums: list[dict[str, Any]]) -> dict[str, Any]:
+    """The archive revalidation report for per-album results in registry order."""
+    issues = [issue for album in albums for issue in album["issues"]]
     health_counts = Counter(album["health_category"] for album in albums)
     breakdown = Counter(issue["category"] for issue in issues)
     return {
         "generated_at": datetime.now().isoformat(timespec="seconds"),
         "archive_root": str(archive_root),
         "summary": {
-            "albums_scanned": total,
+            "albums_scanned": len(albums),
             "healthy": health_counts.get(HEALTH_OK, 0),
             "warnings": health_counts.get(HEALTH_WARNING, 0),
             "errors": health_counts.get(HEALTH_ERROR, 0),
@@ -212,10 +272,21 @@ def revalidate_archive_root(
     reports_dir: Path,
     *,
     progress: ProgressCallback | None = None,
+    workers: int = 1,
+    cancel: threading.Event | None = None,
 ) -> dict[str, Any]:
-    albums = [album_entry(path, archive_root) for path in discover_album_folders(archive_root)]
+    walked = list(walk_album_roots(archive_root, workers=workers))
+    albums = [album_entry(path, archive_root, detected) for path, detected in walked]
     registry = {"archive_root": str(archive_root), "albums": albums}
-    report = revalidate_archive(registry, archive_root, progress=progress)
+    detected_by_path = {str(path): detected for path, detected in walked}
+    report = revalidate_archive(
+        registry,
+        archive_root,
+        progress=progress,
+        detected_artifacts=detected_by_path,
+        workers=workers,
+        cancel=cancel,
+    )
     write_archive_revalidation_report(report, reports_dir)
     return report
 
@@ -225,14 +296,7 @@ def checks_by_id(checks: list[dict[str, str]]) -> dict[str, dict[str, str]]:
 
 
 def load_default_json(filename: str) -> dict[str, Any]:
-    path = Path(__file__).resolve().parents[1] / "data" / filename
-    if not path.exists():
-        return {}
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
-    return data if isinstance(data, dict) else {}
+    return load_registry(Path(__file__).resolve().parents[1] / "data" / filename)
 
 
 def _artifact_checks(
@@ -7,7 +7,6 @@ from typing import Any
 
 from audio_division.archive_health_dashboard import ArchiveHealthReport, archive_health_report
 from audio_division.closed_loop_monitor import discover_incoming_albums
-from audio_division.dashboard import load_json
 from audio_division.environment_health import (
     STATUS_FAIL,
     STATUS_PASS,
@@ -20,6 +19,7 @@ from audio_division.lifecycle_state import merge_lifecycle_rows
 from audio_division.library import library_from_data_dir
 from audio_division.physical_archive import build_archive_albums
 from audio_division.pipeline_health import PipelineHealthReport, pipeline_health_report
+from audio_division.registry_store import load_registry, load_registry_metadata
 from audio_division.settings import load_audio_division_settings
 from curator.atomic import atomic_write_text
 
@@ -97,9 +97,9 @@ class SelfTestRunner:
 
     def _archive_albums(self) -> list[dict[str, Any]]:
         return build_archive_albums(
-            load_json(self.data_dir / "archive_registry.json"),
-            load_json(self.data_dir / "identity_registry.json"),
-            load_json(self.data_dir / "metadata_cache.json"),
+            load_registry(self.data_dir / "archive_registry.json"),
+            load_registry(self.data_dir / "identity_registry.json"),
+            load_registry_metadata(self.data_dir),
         )
 
     def _pipeline_rows(self, archive_albums: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -108,7 +108,7 @@ class SelfTestRunner:
         incoming = discover_incoming_albums(
             self.settings,
             archive_albums,
-            load_json(self.data_dir / "processing_queue.json"),
+            load_registry(self.data_dir / "processing_queue.json"),
         )
         return merge_lifecycle_rows(library.get("albums", []), archive_albums, incoming)
 
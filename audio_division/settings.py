@@ -13,6 +13,7 @@ DEFAULT_SETTINGS = {
         "incoming_root": "",
         "problematic_root": "",
         "needs_validation_root": "",
+        "scan_workers": "",
     },
     "validator": {
         "validated_index_path": "data/validated_albums.json",
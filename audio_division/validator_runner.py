@@ -10,7 +10,9 @@ from audio_division.action_routing import command_failure_guidance, missing_tool
 from audio_division.operation_runner import record_operation_history
 from curator.atomic import atomic_write_text
 from curator.identity import build_identity_registry, write_identity_registry, write_identity_reports
-from curator.lifecycle import build_lifecycle_registry, write_registry, write_reports
+from curator.lifecycle import LIFECYCLE_MANIFEST_FILENAME, build_lifecycle_registry, write_registry, write_reports
+from curator.report_aggregates import aggregate_registry
+from curator.validation_log_index import VALIDATION_LOG_INDEX_FILENAME
 from curator.validator_evidence import collect_validation_evidence, parse_validation_log, write_validation_reports
 
 
@@ -182,11 +184,20 @@ def _refresh_validation_indexes(
     release_folder: Path,
 ) -> dict[str, Any]:
     evidence_roots = _validation_evidence_roots(settings, data_dir, release_folder)
-    evidence = collect_validation_evidence(data_dir, evidence_roots)
-    lifecycle = build_lifecycle_registry(data_dir, validation_evidence=evidence)
+    evidence = collect_validation_evidence(
+        data_dir,
+        evidence_roots,
+        index_path=data_dir / VALIDATION_LOG_INDEX_FILENAME,
+    )
+    lifecycle = build_lifecycle_registry(
+        data_dir,
+        validation_evidence=evidence,
+        manifest_path=data_dir / LIFECYCLE_MANIFEST_FILENAME,
+    )
     write_registry(lifecycle, data_dir / "lifecycle_registry.json")
-    write_reports(lifecycle, reports_dir)
-    write_validation_reports(lifecycle, reports_dir)
+    aggregates = aggregate_registry(lifecycle)
+    write_reports(lifecycle, reports_dir, aggregates=aggregates)
+    write_validation_reports(lifecycle, reports_dir, aggregates=aggregates)
 
     identity = build_identity_registry(lifecycle)
     write_identity_registry(identity, data_dir / "identity_registry.json")
@@ -0,0 +1,50 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from audio_division.build_orchestrator import STAGES, render_build_summary, run_build
+from curator.validator_evidence import DEFAULT_EVIDENCE_WORKERS
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild every derived registry and report, skipping unchanged stages.")
+    parser.add_argument(
+        "stages",
+        nargs="*",
+        metavar="STAGE",
+        help=f"stages to build, with their upstream stages (default: all of {', '.join(stage.name for stage in STAGES)})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="stages run at the same time (default: CPU count)",
+    )
+    parser.add_argument(
+        "--evidence-workers",
+        type=int,
+        default=DEFAULT_EVIDENCE_WORKERS,
+        help=f"threads used to walk evidence roots and parse validation logs (default: {DEFAULT_EVIDENCE_WORKERS})",
+    )
+    parser.add_argument("--force", action="store_true", help="run every selected stage even if its inputs are unchanged")
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).resolve().parent
+    try:
+        result = run_build(
+            root,
+            only=args.stages,
+            workers=args.workers,
+            force=args.force,
+            evidence_workers=args.evidence_workers,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(render_build_summary(result), end="")
+    if any(row["status"] in ("failed", "blocked") for row in result["stages"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,18 @@ from audio_division.artifacts import (
     scan_archive_artifacts,
     write_archive_artifact_report,
 )
-from audio_division.dashboard import load_json
+from audio_division.build_context import IDENTITY, BuildContext
+
+
+def build(ctx: BuildContext) -> str:
+    report = scan_archive_artifacts(album_paths_from_identity_registry(ctx.json(IDENTITY)))
+    write_archive_artifact_report(report, ctx.reports_dir())
+    return f"Wrote archive artifact report for {report['total_albums_scanned']} album folder(s)."
 
 
 def main() -> None:
     root = Path(__file__).resolve().parent
-    identity = load_json(root / "data" / "identity_registry.json")
-    report = scan_archive_artifacts(album_paths_from_identity_registry(identity))
-    write_archive_artifact_report(report, root / "reports")
-    print(f"Wrote archive artifact report for {report['total_albums_scanned']} album folder(s).")
+    print(build(BuildContext(root)))
 
 
 if __name__ == "__main__":
@@ -1,37 +1,42 @@
-import json
+import argparse
 from pathlib import Path
 
 from audio_division.archive_audit import audit_archive, write_archive_audit
-from audio_division.settings import load_audio_division_settings
+from audio_division.archive_scan import DEFAULT_SCAN_WORKERS, scan_workers
+from audio_division.build_context import ARCHIVE_REGISTRY, IDENTITY, LIFECYCLE, VALIDATED, BuildContext
 
 
-def main() -> None:
-    root = Path(__file__).resolve().parent
-    data_dir = root / "data"
-    settings = load_audio_division_settings(data_dir / "audio_division_settings.json")
-    registry_path = data_dir / "archive_registry.json"
-    registry = json.loads(registry_path.read_text(encoding="utf-8")) if registry_path.exists() else {}
-    identity = json.loads((data_dir / "identity_registry.json").read_text(encoding="utf-8")) if (data_dir / "identity_registry.json").exists() else {}
-    lifecycle = json.loads((data_dir / "lifecycle_registry.json").read_text(encoding="utf-8")) if (data_dir / "lifecycle_registry.json").exists() else {}
-    validated = json.loads((data_dir / "validated_albums.json").read_text(encoding="utf-8")) if (data_dir / "validated_albums.json").exists() else {}
-    archive_root = Path(registry.get("archive_root") or settings.get("archive_paths", {}).get("main_archive_root", ""))
+def build(ctx: BuildContext, *, workers: int | None = None) -> str:
+    registry = ctx.json(ARCHIVE_REGISTRY)
+    settings_root = ctx.settings().get("archive_paths", {}).get("main_archive_root", "")
     report = audit_archive(
         registry,
-        archive_root,
-        identity_registry=identity,
-        lifecycle_registry=lifecycle,
-        validated_index=validated,
+        Path(registry.get("archive_root") or settings_root),
+        identity_registry=ctx.json(IDENTITY),
+        lifecycle_registry=ctx.json(LIFECYCLE),
+        validated_index=ctx.json(VALIDATED),
+        workers=workers or scan_workers(ctx.settings()),
     )
-    reports_dir = Path(settings.get("reports", {}).get("reports_directory") or root / "reports")
-    if not reports_dir.is_absolute():
-        reports_dir = root / reports_dir
-    write_archive_audit(report, reports_dir)
+    write_archive_audit(report, ctx.reports_dir(from_settings=True))
     summary = report["summary"]
-    print(
+    return (
         "Wrote archive audit "
         f"({summary['albums_scanned']} scanned, {summary['warnings']} warnings, {summary['errors']} errors)."
     )
 
 
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Audit archive album folders listed in the archive registry.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"threads used to scan album folders (default: archive_paths.scan_workers, or {DEFAULT_SCAN_WORKERS})",
+    )
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).resolve().parent
+    print(build(BuildContext(root), workers=args.workers))
+
+
 if __name__ == "__main__":
     main()
@@ -1,18 +1,20 @@
 from pathlib import Path
 
-from curator.archive_intelligence import (
-    load_lifecycle_registry,
-    write_archive_intelligence_reports,
-)
+from audio_division.build_context import LIFECYCLE, BuildContext
+from curator.archive_intelligence import write_archive_intelligence_reports
 
 
-def main() -> None:
-    root = Path(__file__).resolve().parent
-    registry = load_lifecycle_registry(root / "data" / "lifecycle_registry.json")
-    write_archive_intelligence_reports(registry, root / "reports")
+def build(ctx: BuildContext) -> str:
+    registry = ctx.json(LIFECYCLE)
+    write_archive_intelligence_reports(registry, ctx.reports_dir())
 
     total = len(registry.get("albums", []))
-    print(f"Wrote archive intelligence reports for {total} album(s).")
+    return f"Wrote archive intelligence reports for {total} album(s)."
+
+
+def main() -> None:
+    root = Path(__file__).resolve().parent
+    print(build(BuildContext(root)))
 
 
 if __name__ == "__main__":
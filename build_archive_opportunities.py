@@ -1,19 +1,18 @@
 from pathlib import Path
 
-from audio_division.library import library_from_data_dir
+from audio_division.build_context import BuildContext
 from audio_division.opportunities import generate_opportunities, write_opportunities_report
-from audio_division.settings import load_audio_division_settings
+
+
+def build(ctx: BuildContext) -> str:
+    opportunities = generate_opportunities(ctx.library())
+    write_opportunities_report(opportunities, ctx.reports_dir())
+    return f"Wrote archive opportunities report with {len(opportunities)} opportunity(s)."
 
 
 def main() -> None:
     root = Path(__file__).resolve().parent
-    data_dir = root / "data"
-    settings = load_audio_division_settings(data_dir / "audio_division_settings.json")
-    archive_root = settings.get("archive_paths", {}).get("main_archive_root", "")
-    library = library_from_data_dir(data_dir, Path(archive_root) if archive_root else None)
-    opportunities = generate_opportunities(library)
-    write_opportunities_report(opportunities, root / "reports")
-    print(f"Wrote archive opportunities report with {len(opportunities)} opportunity(s).")
+    print(build(BuildContext(root)))
 
 
 if __name__ == "__main__":
@@ -1,29 +1,38 @@
-import json
+import argparse
 from pathlib import Path
 
 from audio_division.archive_reconciliation import reconcile_archive, write_archive_reconciliation_report
-from audio_division.settings import load_audio_division_settings
+from audio_division.archive_scan import DEFAULT_SCAN_WORKERS, scan_workers
+from audio_division.build_context import ARCHIVE_REGISTRY, BuildContext
 
 
-def main() -> None:
-    root = Path(__file__).resolve().parent
-    data_dir = root / "data"
-    settings = load_audio_division_settings(data_dir / "audio_division_settings.json")
-    archive_root = Path(settings.get("archive_paths", {}).get("main_archive_root", ""))
-    registry_path = data_dir / "archive_registry.json"
-    registry = json.loads(registry_path.read_text(encoding="utf-8")) if registry_path.exists() else {}
-    report = reconcile_archive(archive_root, registry)
-    reports_dir = Path(settings.get("reports", {}).get("reports_directory") or root / "reports")
-    if not reports_dir.is_absolute():
-        reports_dir = root / reports_dir
-    write_archive_reconciliation_report(report, reports_dir)
+def build(ctx: BuildContext, *, workers: int | None = None) -> str:
+    report = reconcile_archive(
+        ctx.archive_root() or Path(""),
+        ctx.json(ARCHIVE_REGISTRY),
+        workers=workers or scan_workers(ctx.settings()),
+    )
+    write_archive_reconciliation_report(report, ctx.reports_dir(from_settings=True))
     summary = report["summary"]
-    print(
+    return (
         "Wrote archive reconciliation report "
         f"({summary['albums_missing']} missing, {summary['albums_added']} added, "
         f"{summary['disc_folder_album_rows']} disc rows)."
     )
 
 
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Reconcile the archive registry against the main archive root.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"threads used to scan album folders (default: archive_paths.scan_workers, or {DEFAULT_SCAN_WORKERS})",
+    )
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).resolve().parent
+    print(build(BuildContext(root), workers=args.workers))
+
+
 if __name__ == "__main__":
     main()
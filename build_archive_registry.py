@@ -1,17 +1,41 @@
+import argparse
 from pathlib import Path
 
-from audio_division.archive_registry import build_archive_registry, write_archive_registry
-from audio_division.settings import load_audio_division_settings
+from audio_division.archive_registry import write_archive_registry
+from audio_division.archive_registry_index import refresh_archive_registry
+from audio_division.archive_scan import DEFAULT_SCAN_WORKERS, scan_workers
+from audio_division.build_context import BuildContext
+from curator.atomic import atomic_batch
 
 
-def main() -> None:
+def build(ctx: BuildContext, *, full: bool = False, workers: int | None = None) -> str:
+    registry, index = refresh_archive_registry(
+        ctx.archive_root() or Path(""),
+        ctx.data_dir,
+        full=full,
+        workers=workers or scan_workers(ctx.settings()),
+    )
+    with atomic_batch():
+        write_archive_registry(registry, ctx.data_dir, ctx.reports_dir())
+        index.save()
+    return (
+        f"Wrote archive registry with {registry['summary']['album_folders']} album folder(s); "
+        f"rescanned {index.stats['albums_scanned']}, reused {index.stats['albums_reused']}."
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Refresh the archive registry from the main archive root.")
+    parser.add_argument("--full", action="store_true", help="ignore the scan index and list every folder")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"threads used to scan album folders (default: archive_paths.scan_workers, or {DEFAULT_SCAN_WORKERS})",
+    )
+    args = parser.parse_args(argv)
+
     root = Path(__file__).resolve().parent
-    data_dir = root / "data"
-    settings = load_audio_division_settings(data_dir / "audio_division_settings.json")
-    archive_root = Path(settings.get("archive_paths", {}).get("main_archive_root", ""))
-    registry = build_archive_registry(archive_root)
-    write_archive_registry(registry, data_dir, root / "reports")
-    print(f"Wrote archive registry with {registry['summary']['album_folders']} album folder(s).")
+    print(build(BuildContext(root), full=args.full, workers=args.workers))
 
 
 if __name__ == "__main__":
@@ -1,19 +1,27 @@
 from pathlib import Path
 
+from audio_division.build_context import IDENTITY, LIFECYCLE, BuildContext
+from curator.atomic import atomic_batch
 from curator.identity import build_identity_registry, write_identity_registry, write_identity_reports
-from curator.lifecycle import load_json_file
+from curator.validation_log_index import VALIDATION_LOG_INDEX_FILENAME, ValidationLogIndex, shared_log_cache
 
 
-def main() -> None:
-    root = Path(__file__).resolve().parent
-    lifecycle_registry = load_json_file(root / "data" / "lifecycle_registry.json")
-    registry = build_identity_registry(lifecycle_registry)
-    write_identity_registry(registry, root / "data" / "identity_registry.json")
-    write_identity_reports(registry, root / "reports")
+def build(ctx: BuildContext) -> str:
+    # Logs parsed by the last evidence collection are reused while unchanged.
+    ValidationLogIndex(ctx.data_dir / VALIDATION_LOG_INDEX_FILENAME, shared=shared_log_cache).seed_shared_cache()
+    registry = build_identity_registry(ctx.json(LIFECYCLE))
+    with atomic_batch():
+        write_identity_registry(registry, ctx.root / IDENTITY)
+        write_identity_reports(registry, ctx.reports_dir())
 
     total = registry["summary"]["total_releases"]
     unresolved = registry["summary"]["unresolved_validator_logs"]
-    print(f"Wrote identity registry for {total} release(s); unresolved logs: {unresolved}.")
+    return f"Wrote identity registry for {total} release(s); unresolved logs: {unresolved}."
+
+
+def main() -> None:
+    root = Path(__file__).resolve().parent
+    print(build(BuildContext(root)))
 
 
 if __name__ == "__main__":
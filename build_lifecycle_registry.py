@@ -1,20 +1,55 @@
+import argparse
+import os
 from pathlib import Path
 
-from curator.lifecycle import build_lifecycle_registry, write_registry, write_reports
-from curator.validator_evidence import collect_validation_evidence, write_validation_reports
+from audio_division.build_context import LIFECYCLE, BuildContext
+from curator.atomic import atomic_batch
+from curator.lifecycle import LIFECYCLE_MANIFEST_FILENAME, build_lifecycle_registry, write_registry, write_reports
+from curator.report_aggregates import aggregate_registry
+from curator.validation_log_index import VALIDATION_LOG_INDEX_FILENAME
+from curator.validator_evidence import DEFAULT_EVIDENCE_WORKERS, collect_validation_evidence, write_validation_reports
 
 
-def main() -> None:
-    root = Path(__file__).resolve().parent
-    data_dir = root / "data"
-    evidence = collect_validation_evidence(data_dir)
-    registry = build_lifecycle_registry(data_dir, validation_evidence=evidence)
-    write_registry(registry, root / "data" / "lifecycle_registry.json")
-    write_reports(registry, root / "reports")
-    write_validation_reports(registry, root / "reports")
+def build(ctx: BuildContext, *, workers: int = 1) -> str:
+    evidence = collect_validation_evidence(
+        ctx.data_dir,
+        index_path=ctx.data_dir / VALIDATION_LOG_INDEX_FILENAME,
+        workers=ctx.evidence_workers,
+    )
+    registry = build_lifecycle_registry(
+        ctx.data_dir,
+        validation_evidence=evidence,
+        manifest_path=ctx.data_dir / LIFECYCLE_MANIFEST_FILENAME,
+        workers=workers,
+    )
+    aggregates = aggregate_registry(registry)
+    with atomic_batch():
+        write_registry(registry, ctx.root / LIFECYCLE)
+        write_reports(registry, ctx.reports_dir(), aggregates=aggregates)
+        write_validation_reports(registry, ctx.reports_dir(), aggregates=aggregates)
 
     total = registry["summary"]["total_albums"]
-    print(f"Wrote lifecycle registry for {total} album(s).")
+    return f"Wrote lifecycle registry for {total} album(s)."
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the derived lifecycle registry.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processes used to parse changed artist files when there are many (default: CPU count)",
+    )
+    parser.add_argument(
+        "--evidence-workers",
+        type=int,
+        default=DEFAULT_EVIDENCE_WORKERS,
+        help=f"threads used to walk evidence roots and parse validation logs (default: {DEFAULT_EVIDENCE_WORKERS})",
+    )
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).resolve().parent
+    print(build(BuildContext(root, evidence_workers=args.evidence_workers), workers=args.workers))
 
 
 if __name__ == "__main__":
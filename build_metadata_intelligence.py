@@ -1,16 +1,17 @@
 from pathlib import Path
 
-from audio_division.dashboard import load_json
+from audio_division.build_context import LIFECYCLE, BuildContext
 from audio_division.metadata_status import write_metadata_reports
 
 
+def build(ctx: BuildContext) -> str:
+    write_metadata_reports(ctx.json(LIFECYCLE), ctx.metadata(), ctx.reports_dir())
+    return "Wrote metadata intelligence reports."
+
+
 def main() -> None:
     root = Path(__file__).resolve().parent
-    data_dir = root / "data"
-    lifecycle = load_json(data_dir / "lifecycle_registry.json")
-    metadata = load_json(data_dir / "metadata_cache.json")
-    write_metadata_reports(lifecycle, metadata, root / "reports")
-    print("Wrote metadata intelligence reports.")
+    print(build(BuildContext(root)))
 
 
 if __name__ == "__main__":
@@ -6,7 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from curator.atomic import atomic_write_text
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.fuzzy_index import FuzzyIndex
 from curator.identity import normalize_identity_text
 
 RECOVERY_LEVELS = ("RECOVERABLE_HIGH", "RECOVERABLE_MEDIUM", "RECOVERABLE_LOW", "UNRECOVERABLE")
@@ -32,6 +33,10 @@ def lifecycle_candidates(lifecycle_registry: dict[str, Any]) -> list[dict[str, A
     return candidates
 
 
+def candidate_index(candidates: list[dict[str, Any]]) -> FuzzyIndex:
+    return FuzzyIndex((item.get("normalized_artist", ""), item.get("normalized_title", "")) for item in candidates)
+
+
 def recovery_level(
     parsed_folder: dict[str, Any],
     candidate: dict[str, Any],
@@ -80,13 +85,29 @@ def recovery_level(
 def recovery_candidates_for_unresolved(
     unresolved: dict[str, Any],
     candidates: list[dict[str, Any]],
+    index: FuzzyIndex | None = None,
 ) -> list[dict[str, Any]]:
+    """
+    Ranked recovery candidates for one unresolved log.
+
+    Only candidates sharing the exact normalized artist, or found by the
+    fuzzy index, are scored: recovery_level() needs an exact artist, and
+    fuzzy artist/title matches are offered as RECOVERABLE_LOW.
+    """
     parsed_folder = unresolved.get("parsed_folder", {})
     validation = unresolved.get("validation", {})
+    if index is None:
+        index = candidate_index(candidates)
+    artist = normalize_identity_text(parsed_folder.get("artist"))
+    title = normalize_identity_text(parsed_folder.get("title"))
+    fuzzy = dict(index.search(artist, title)) if title else {}
     scored: list[dict[str, Any]] = []
 
-    for candidate in candidates:
+    for row in sorted(set(index.rows_for_artist(artist)) | set(fuzzy)):
+        candidate = candidates[row]
         level, reasons = recovery_level(parsed_folder, candidate, validation)
+        if level == "UNRECOVERABLE" and row in fuzzy:
+            level, reasons = "RECOVERABLE_LOW", ["fuzzy_artist_title", f"similarity_{fuzzy[row]:.2f}"]
         if level == "UNRECOVERABLE":
             continue
         scored.append(
@@ -113,11 +134,12 @@ def build_archive_identity_recovery(
     generated_at: str | None = None,
 ) -> dict[str, Any]:
     candidates = lifecycle_candidates(lifecycle_registry)
+    index = candidate_index(candidates)
     recoverable: list[dict[str, Any]] = []
     unrecoverable: list[dict[str, Any]] = []
 
     for unresolved in identity_registry.get("unresolved", []):
-        matches = recovery_candidates_for_unresolved(unresolved, candidates)
+        matches = recovery_candidates_for_unresolved(unresolved, candidates, index)
         if matches:
             best_level = matches[0]["recovery_level"]
             recoverable.append({**unresolved, "recovery_level": best_level, "recovery_candidates": matches})
@@ -273,16 +295,17 @@ def render_archive_strength_report(registry: dict[str, Any]) -> str:
 
 def write_archive_identity_recovery_reports(registry: dict[str, Any], reports_dir: Path) -> None:
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(
-        reports_dir / "archive_identity_recovery_report.md",
-        render_archive_identity_recovery_report(registry),
-    )
-    atomic_write_text(reports_dir / "recoverable_identity_report.md", render_recoverable_identity_report(registry))
-    atomic_write_text(
-        reports_dir / "unrecoverable_identity_report.md",
-        render_unrecoverable_identity_report(registry),
-    )
-    atomic_write_text(reports_dir / "archive_strength_report.md", render_archive_strength_report(registry))
+    with atomic_batch():
+        atomic_write_text(
+            reports_dir / "archive_identity_recovery_report.md",
+            render_archive_identity_recovery_report(registry),
+        )
+        atomic_write_text(reports_dir / "recoverable_identity_report.md", render_recoverable_identity_report(registry))
+        atomic_write_text(
+            reports_dir / "unrecoverable_identity_report.md",
+            render_unrecoverable_identity_report(registry),
+        )
+        atomic_write_text(reports_dir / "archive_strength_report.md", render_archive_strength_report(registry))
 
 
 def _ratio(count: int, total: int) -> float:
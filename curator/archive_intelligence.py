@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
-from curator.atomic import atomic_write_text
-from curator.lifecycle import STATE_ORDER
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.lifecycle_states import STATE_ORDER
+from curator.report_aggregates import aggregate_registry
 
 
 def load_lifecycle_registry(path: Path) -> dict[str, Any]:
@@ -31,41 +32,19 @@ def _album_sort_key(row: dict[str, Any]) -> tuple[str, str, str]:
     return (str(row.get("artist", "")).lower(), str(row.get("title", "")).lower(), row["album_id"])
 
 
-def state_counts(registry: dict[str, Any]) -> dict[str, int]:
-    counts = Counter(row.get("highest_state") or "UNKNOWN" for row in registry.get("albums", []))
-    return {state: counts.get(state, 0) for state in STATE_ORDER}
+def state_counts(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> dict[str, int]:
+    return (aggregates or aggregate_registry(registry))["highest_state_counts"]
 
 
-def calculate_artist_coverage(registry: dict[str, Any]) -> list[dict[str, Any]]:
-    artists: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "artist": "",
-            "discovered": 0,
-            "validated": 0,
-            "confirmed": 0,
-            "backlog": 0,
-        }
-    )
-
-    for row in registry.get("albums", []):
-        if not row.get("states", {}).get("discovered", False):
-            continue
-
-        artist = row.get("artist") or "(unknown)"
-        item = artists[artist]
-        item["artist"] = artist
-        item["discovered"] += 1
-        if row.get("states", {}).get("validated", False):
-            item["validated"] += 1
-        if row.get("states", {}).get("confirmed", False):
-            item["confirmed"] += 1
-        if not row.get("states", {}).get("attempted", False):
-            item["backlog"] += 1
-
+def calculate_artist_coverage(
+    registry: dict[str, Any],
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
     out = []
-    for item in artists.values():
-        discovered = item["discovered"]
-        item["coverage_percent"] = _pct(item["validated"], discovered)
+    for item in (aggregates or aggregate_registry(registry))["artist_coverage"]:
+        item = dict(item)
+        item["coverage_percent"] = _pct(item["validated"], item["discovered"])
         out.append(item)
 
     return sorted(
@@ -79,13 +58,8 @@ def calculate_artist_coverage(registry: dict[str, Any]) -> list[dict[str, Any]]:
     )
 
 
-def calculate_backlog(registry: dict[str, Any]) -> dict[str, Any]:
-    rows = [
-        row
-        for row in registry.get("albums", [])
-        if row.get("states", {}).get("discovered", False)
-        and not row.get("states", {}).get("attempted", False)
-    ]
+def calculate_backlog(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> dict[str, Any]:
+    rows = (aggregates or aggregate_registry(registry))["gaps"]["discovered_not_attempted"]
     by_artist = Counter(row.get("artist") or "(unknown)" for row in rows)
     return {
         "total": len(rows),
@@ -94,41 +68,29 @@ def calculate_backlog(registry: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def calculate_gaps(registry: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
-    albums = registry.get("albums", [])
+def calculate_gaps(
+    registry: dict[str, Any],
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    gaps = (aggregates or aggregate_registry(registry))["gaps"]
     return {
-        "shipped_not_validated": [
-            row
-            for row in albums
-            if row.get("states", {}).get("shipped", False)
-            and not row.get("states", {}).get("validated", False)
-        ],
-        "attempted_not_shipped": [
-            row
-            for row in albums
-            if row.get("states", {}).get("attempted", False)
-            and not row.get("states", {}).get("shipped", False)
-        ],
-        "confirmed_not_validated": [
-            row
-            for row in albums
-            if row.get("states", {}).get("confirmed", False)
-            and not row.get("states", {}).get("validated", False)
-        ],
-        "validated_not_discovered": [
-            row
-            for row in albums
-            if row.get("states", {}).get("validated", False)
-            and not row.get("states", {}).get("discovered", False)
-        ],
+        name: gaps[name]
+        for name in (
+            "shipped_not_validated",
+            "attempted_not_shipped",
+            "confirmed_not_validated",
+            "validated_not_discovered",
+        )
     }
 
 
-def render_archive_health_report(registry: dict[str, Any]) -> str:
-    total = len(registry.get("albums", []))
-    counts = state_counts(registry)
-    gaps = calculate_gaps(registry)
-    backlog = calculate_backlog(registry)
+def render_archive_health_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    aggregates = aggregates or aggregate_registry(registry)
+    total = aggregates["total_albums"]
+    counts = state_counts(registry, aggregates=aggregates)
+    gaps = calculate_gaps(registry, aggregates=aggregates)
+    backlog = calculate_backlog(registry, aggregates=aggregates)
 
     lines = [
         "# Archive Health Report",
@@ -166,8 +128,9 @@ def render_archive_health_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def render_artist_coverage_report(registry: dict[str, Any]) -> str:
-    coverage = calculate_artist_coverage(registry)
+def render_artist_coverage_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    aggregates = aggregates or aggregate_registry(registry)
+    coverage = calculate_artist_coverage(registry, aggregates=aggregates)
     complete = [row for row in coverage if row["discovered"] > 0 and row["validated"] == row["discovered"]]
     incomplete = [row for row in coverage if row["discovered"] > row["validated"]]
     incomplete.sort(key=lambda row: (-row["backlog"], row["coverage_percent"], row["artist"].lower()))
@@ -223,8 +186,9 @@ def render_artist_coverage_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def render_backlog_report(registry: dict[str, Any]) -> str:
-    backlog = calculate_backlog(registry)
+def render_backlog_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    aggregates = aggregates or aggregate_registry(registry)
+    backlog = calculate_backlog(registry, aggregates=aggregates)
     lines = [
         "# Backlog Report",
         "",
@@ -259,8 +223,9 @@ def render_backlog_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def render_gap_analysis_report(registry: dict[str, Any]) -> str:
-    gaps = calculate_gaps(registry)
+def render_gap_analysis_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    aggregates = aggregates or aggregate_registry(registry)
+    gaps = calculate_gaps(registry, aggregates=aggregates)
     lines = [
         "# Gap Analysis Report",
         "",
@@ -294,9 +259,25 @@ def render_gap_analysis_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def write_archive_intelligence_reports(registry: dict[str, Any], reports_dir: Path) -> None:
+def write_archive_intelligence_reports(
+    registry: dict[str, Any],
+    reports_dir: Path,
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> None:
+    aggregates = aggregates or aggregate_registry(registry)
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(reports_dir / "archive_health_report.md", render_archive_health_report(registry))
-    atomic_write_text(reports_dir / "artist_coverage_report.md", render_artist_coverage_report(registry))
-    atomic_write_text(reports_dir / "backlog_report.md", render_backlog_report(registry))
-    atomic_write_text(reports_dir / "gap_analysis_report.md", render_gap_analysis_report(registry))
+    with atomic_batch():
+        atomic_write_text(
+            reports_dir / "archive_health_report.md",
+            render_archive_health_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(
+            reports_dir / "artist_coverage_report.md",
+            render_artist_coverage_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(reports_dir / "backlog_report.md", render_backlog_report(registry, aggregates=aggregates))
+        atomic_write_text(
+            reports_dir / "gap_analysis_report.md",
+            render_gap_analysis_report(registry, aggregates=aggregates),
+        )
@@ -1,44 +1,166 @@
 from __future__ import annotations
 
+import contextvars
 import os
 import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+_active_batch: contextvars.ContextVar[AtomicBatch | None] = contextvars.ContextVar("atomic_batch", default=None)
 
 
 def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
     """
     Write text by replacing the target with a fully flushed temp file.
+
+    Inside an atomic_batch() the write is staged and lands when the batch
+    commits.
     """
     path = Path(path)
+    batch = _active_batch.get()
+    if batch is not None:
+        batch.stage(path, text, encoding=encoding)
+        return
+
     path.parent.mkdir(parents=True, exist_ok=True)
 
     tmp_name: str | None = None
     try:
-        with tempfile.NamedTemporaryFile(
-            "w",
-            encoding=encoding,
-            dir=path.parent,
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as tmp:
-            tmp_name = tmp.name
+        tmp_name = _write_temp(path, text, encoding, fsync=True)
+        os.replace(tmp_name, path)
+        tmp_name = None
+        _fsync_dir(path.parent)
+    finally:
+        if tmp_name is not None:
+            _unlink(tmp_name)
+
+
+class AtomicBatch:
+    """
+    Group commit for many atomic_write_text() calls.
+
+    stage() writes each file to a temp file beside its target. commit()
+    then fsyncs every temp file, renames them all into place, and fsyncs
+    each affected directory once, instead of twice per file. Every target
+    is still replaced by a complete, flushed file, so readers never see a
+    partial write; the files become visible one rename at a time.
+
+    If the batch is abandoned, nothing is renamed and the temp files are
+    removed. Staged content is not visible to reads before commit().
+    """
+
+    def __init__(self) -> None:
+        self._staged: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    def stage(self, path: Path, text: str, *, encoding: str = "utf-8") -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_name = _write_temp(path, text, encoding, fsync=False)
+        with self._lock:
+            previous = self._staged.pop(path, None)
+            self._staged[path] = tmp_name
+        if previous is not None:
+            _unlink(previous)
+
+    def commit(self) -> int:
+        """
+        Land every staged file; returns how many were written.
+        """
+        with self._lock:
+            staged, self._staged = self._staged, {}
+        pending = dict(staged)
+        try:
+            for tmp_name in staged.values():
+                _fsync_file(tmp_name)
+            directories: dict[Path, None] = {}
+            for path, tmp_name in staged.items():
+                os.replace(tmp_name, path)
+                del pending[path]
+                directories[path.parent] = None
+            for directory in directories:
+                _fsync_dir(directory)
+        finally:
+            for tmp_name in pending.values():
+                _unlink(tmp_name)
+        return len(staged)
+
+    def discard(self) -> None:
+        with self._lock:
+            staged, self._staged = self._staged, {}
+        for tmp_name in staged.values():
+            _unlink(tmp_name)
+
+
+@contextmanager
+def atomic_batch() -> Iterator[AtomicBatch]:
+    """
+    Stage every atomic_write_text() in this context and commit them together
+    on exit; on error, discard them. A nested batch joins the outer one.
+    Writes from other threads are not captured and stay immediate.
+    """
+    batch = _active_batch.get()
+    if batch is not None:
+        yield batch
+        return
+
+    batch = AtomicBatch()
+    token = _active_batch.set(batch)
+    try:
+        yield batch
+    except BaseException:
+        batch.discard()
+        raise
+    finally:
+        _active_batch.reset(token)
+    batch.commit()
+
+
+def _write_temp(path: Path, text: str, encoding: str, *, fsync: bool) -> str:
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding=encoding,
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as tmp:
+        try:
             tmp.write(text)
             tmp.flush()
-            os.fsync(tmp.fileno())
+            if fsync:
+                os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            _unlink(tmp.name)
+            raise
+        return tmp.name
 
-        os.replace(tmp_name, path)
-        tmp_name = None
 
-        if hasattr(os, "O_DIRECTORY"):
-            dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
-            try:
-                os.fsync(dir_fd)
-            finally:
-                os.close(dir_fd)
+def _fsync_file(name: str) -> None:
+    fd = os.open(name, os.O_RDWR)
+    try:
+        os.fsync(fd)
     finally:
-        if tmp_name is not None:
-            try:
-                os.unlink(tmp_name)
-            except FileNotFoundError:
-                pass
+        os.close(fd)
+
+
+def _fsync_dir(directory: Path) -> None:
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _unlink(name: str) -> None:
+    try:
+        os.unlink(name)
+    except FileNotFoundError:
+        pass
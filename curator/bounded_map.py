@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+DEFAULT_QUEUE_DEPTH = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int = 1,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    progress: Callable[[int, int, T], None] | None = None,
+    thread_name_prefix: str = "",
+) -> Iterator[R]:
+    """
+    func(item) for every item, yielded in input order.
+
+    With workers > 1 items run on a thread pool, at most `queue_depth` per
+    worker ahead of the consumer, so a long run holds a bounded number of
+    futures and finished results. `progress` is called as
+    progress(index, total, item) on the calling thread and in input order
+    either way, so callers see the same sequence as a serial run. Closing
+    the iterator early, or Ctrl-C, drops the queued items instead of
+    draining them.
+    """
+    items = list(items)
+    total = len(items)
+    if workers <= 1 or total <= 1:
+        for index, item in enumerate(items, start=1):
+            if progress:
+                progress(index, total, item)
+            yield func(item)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix)
+    queued: deque[Future] = deque()
+    remaining = iter(items)
+    try:
+        for item in remaining:
+            queued.append(pool.submit(func, item))
+            if len(queued) >= workers * max(1, queue_depth):
+                break
+        for index, item in enumerate(items, start=1):
+            if progress:
+                progress(index, total, item)
+            result = queued.popleft().result()
+            for following in remaining:
+                queued.append(pool.submit(func, following))
+                break
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
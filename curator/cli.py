@@ -2,6 +2,7 @@ import argparse
 from pathlib import Path
 
 from curator.curate import run_curation
+from curator.response_cache import RESPONSE_CACHE_DIRNAME, configure_response_cache
 from curator.write import write_by_artist
 
 
@@ -32,24 +33,38 @@ def main() -> None:
         help="Directory for artist output (default: data/artists)",
     )
 
+    parser.add_argument(
+        "--refresh-artists",
+        action="store_true",
+        help="Re-expand already curated artists, appending only new releases",
+    )
+
     args = parser.parse_args()
 
     if not args.inbox.exists():
         print(f"❌ Inbox not found: {args.inbox}")
         return
 
+    configure_response_cache(args.inbox.parent / RESPONSE_CACHE_DIRNAME)
+
     print("▶ Running STiGMA Deezer Curator")
     print(f"  Inbox:   {args.inbox}")
     print(f"  Log:     {args.log}")
     print(f"  Artists: {args.artists}")
     print()
 
-    album_links = run_curation(
+    result = run_curation(
         inbox_path=args.inbox,
         log_path=args.log,
+        artists_dir=args.artists,
+        refresh_artists=args.refresh_artists,
     )
+    album_links = result["album_urls"]
 
     write_by_artist(album_links, args.artists)
 
     print("✔ Done")
     print(f"  New album links written: {len(album_links)}")
+    if args.refresh_artists:
+        stats = result["stats"]
+        print(f"  Artists updated: {stats['artists_updated']} ({stats['releases_added']} new releases)")
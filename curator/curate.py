@@ -1,15 +1,22 @@
 from pathlib import Path
 
-from curator.links import parse_deezer_link, LinkType
+from curator.links import parse_deezer_link, DeezerLink, LinkType
 from curator.expand import expand_artist_releases
 from curator.log import CuratedLog
-from curator.write import write_expansion_block
+from curator.write import (
+    append_expansion_delta,
+    expansion_files,
+    known_album_ids,
+    write_expansion_block,
+)
 
 
 def run_curation(
     inbox_path: Path,
     log_path: Path,
     artists_dir: Path,
+    *,
+    refresh_artists: bool = False,
 ) -> dict:
     """
     Processes inbox links.
@@ -18,6 +25,9 @@ def run_curation(
     - Album links are passed through (returned to GUI)
     - Artist links are expanded into structured, annotated blocks
     - Each inbox line is processed once (tracked in curated.log)
+    - With refresh_artists, already-curated artist links are re-expanded
+      in delta mode: only album ids missing from the artist file are
+      looked up and appended
 
     Returns:
         {
@@ -26,38 +36,43 @@ def run_curation(
                 "albums_passed": int,
                 "artists_expanded": int,
                 "artists_skipped": int,
+                "artists_updated": int,
+                "releases_added": int,
             }
         }
     """
     log = CuratedLog(log_path)
 
+    stats = {
+        "albums_passed": 0,
+        "artists_expanded": 0,
+        "artists_skipped": 0,
+        "artists_updated": 0,
+        "releases_added": 0,
+    }
+
     if not inbox_path.exists():
         return {
             "album_urls": [],
-            "stats": {
-                "albums_passed": 0,
-                "artists_expanded": 0,
-                "artists_skipped": 0,
-            },
+            "stats": stats,
         }
 
     with inbox_path.open("r", encoding="utf-8") as f:
         raw_links = [line.strip() for line in f if line.strip()]
 
     album_urls: list[str] = []
-
-    stats = {
-        "albums_passed": 0,
-        "artists_expanded": 0,
-        "artists_skipped": 0,
-    }
+    expanded = expansion_files(artists_dir) if refresh_artists else {}
 
     for raw in raw_links:
+        link = parse_deezer_link(raw)
+
         if log.has(raw):
-            stats["artists_skipped"] += 1
+            if refresh_artists and link.type == LinkType.ARTIST and link.id:
+                _refresh_artist(link, expanded.get(link.raw), stats)
+            else:
+                stats["artists_skipped"] += 1
             continue
 
-        link = parse_deezer_link(raw)
         should_log = True
 
         try:
@@ -66,6 +81,11 @@ def run_curation(
                 stats["albums_passed"] += 1
 
             elif link.type == LinkType.ARTIST and link.id:
+                existing = expanded.get(link.raw)
+                if existing:
+                    _refresh_artist(link, existing, stats)
+                    continue
+
                 releases = expand_artist_releases(link.id)
 
                 wrote = write_expansion_block(
@@ -94,3 +114,26 @@ def run_curation(
         "album_urls": album_urls,
         "stats": stats,
     }
+
+
+def _refresh_artist(link: DeezerLink, path: Path | None, stats: dict) -> None:
+    """
+    Delta-expand one already-curated artist into its existing file.
+    """
+    if path is None:
+        stats["artists_skipped"] += 1
+        return
+
+    try:
+        known = known_album_ids(path.read_text(encoding="utf-8"))
+        releases = expand_artist_releases(link.id, known_album_ids=known)
+        added = append_expansion_delta(path=path, artist_url=link.raw, releases=releases)
+    except Exception as exc:
+        print(f"⚠️  Failed to refresh {link.raw}: {exc}")
+        return
+
+    if added:
+        stats["artists_updated"] += 1
+        stats["releases_added"] += added
+    else:
+        stats["artists_skipped"] += 1
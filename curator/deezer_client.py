@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEEZER_API = "https://api.deezer.com"
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_MAXSIZE = 8
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+
+class DeezerClient:
+    """
+    Keep-alive HTTP session shared by every Deezer fetch path.
+
+    Connections are pooled per host and reused across calls, so thousands of
+    album, artist and track lookups pay the TCP+TLS handshake once per pooled
+    connection instead of once per request. pool_maxsize caps open connections
+    per host; callers beyond that wait for a free connection.
+
+    Only connection attempts are retried, with exponential backoff: those
+    requests never reached Deezer, so a retry does not spend another slot
+    of the caller's token bucket. Read timeouts, 429s and server errors are
+    returned to the caller, which retries through its own throttle (the
+    metadata cache's error ledger, or the next expansion run).
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self.session = session or requests.Session()
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        return self.session.get(url, params=params, timeout=timeout if timeout is not None else self.timeout)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_default_client: DeezerClient | None = None
+_default_lock = threading.Lock()
+
+
+def default_client() -> DeezerClient:
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = DeezerClient()
+        return _default_client
+
+
+def configure_default_client(**options: Any) -> DeezerClient:
+    """
+    Replace the process-wide client, e.g. to widen the pool for more workers.
+    """
+    global _default_client
+    with _default_lock:
+        previous = _default_client
+        _default_client = DeezerClient(**options)
+    if previous is not None:
+        previous.close()
+    return _default_client
+
+
+def deezer_get(
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    timeout: float | None = None,
+) -> requests.Response:
+    """
+    Drop-in replacement for requests.get that goes through the pooled client.
+    """
+    return default_client().get(url, params=params, timeout=timeout)
@@ -1,82 +1,52 @@
-import requests
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Collection, Iterator
 
+from curator.deezer_client import DEEZER_API, deezer_get
 from curator.metadata import get_album_metadata
+from curator.throttle import TokenBucket
 
-DEEZER_API = "https://api.deezer.com"
 PAGE_SIZE = 50
+DEFAULT_EXPAND_WORKERS = 4
+DEFAULT_REQUESTS_PER_SECOND = 10.0
 
 
-def expand_artist_releases(artist_id: str) -> dict[str, list[str]]:
+def expand_artist_releases(
+    artist_id: str,
+    *,
+    workers: int = DEFAULT_EXPAND_WORKERS,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    known_album_ids: Collection[str] = frozenset(),
+) -> dict[str, list[str]]:
     """
     Expand a Deezer artist into structured, annotated release lines.
 
     Classification uses Deezer's own record_type:
         album | ep | single
-    """
-    releases = []
-    index = 0
-
-    while True:
-        url = f"{DEEZER_API}/artist/{artist_id}/albums"
-        params = {
-            "index": index,
-            "limit": PAGE_SIZE,
-        }
-
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
-        items = data.get("data", [])
-
-        if not items:
-            break
-
-        for item in items:
-            album_id = item.get("id")
-            record_type = item.get("record_type")
-
-            if not album_id or record_type not in {"album", "ep", "single"}:
-                continue
-
-            metadata = get_album_metadata(str(album_id))
-            if not metadata:
-                continue
-
-            title = getattr(metadata, "title", "Unknown title")
-            year = getattr(metadata, "year", None)
-            tracks = getattr(metadata, "tracks", 0) or 0
-
-            # ---- Flags ----
-            flags = []
-            title_lower = title.lower()
-
-            if "live" in title_lower:
-                flags.append("LIVE?")
 
-            if "deluxe" in title_lower or "expanded" in title_lower:
-                flags.append("DELUXE?")
+    The first page reveals the artist's total; the remaining pages are then
+    fetched concurrently, and each release's metadata lookup is queued on the
+    same bounded pool as soon as its page arrives. One token bucket caps page
+    and metadata requests together. Releases are collected in page order, so
+    the buckets match a sequential (workers=1) run exactly.
 
-            if getattr(metadata, "is_compilation", False):
-                flags.append("COMPILATION")
-
-            if getattr(metadata, "is_clean", False):
-                flags.append("CLEAN")
-
-            releases.append(
-                {
-                    "url": f"https://www.deezer.com/album/{album_id}",
-                    "type": record_type,  # authoritative
-                    "title": title,
-                    "year": year,
-                    "tracks": tracks,
-                    "flags": flags,
-                }
-            )
-
-        index += PAGE_SIZE
-        time.sleep(0.1)
+    Releases in `known_album_ids` are skipped without a metadata lookup;
+    delta expansion passes the ids already in the artist file.
+    """
+    bucket = TokenBucket(requests_per_second, burst=max(1, workers), sleep=time.sleep)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artist-expand") if workers > 1 else None
+
+    try:
+        lookups = [
+            _submit(pool, _lookup_release, bucket, item)
+            for item in _iter_release_items(artist_id, bucket, pool)
+            if str(item["id"]) not in known_album_ids
+        ]
+        releases = [release for release in map(_result, lookups) if release]
+    finally:
+        if pool is not None:
+            # On error or Ctrl-C, drop queued lookups instead of draining them.
+            pool.shutdown(wait=True, cancel_futures=True)
 
     # ---- Bucket & sort ----
     buckets = {
@@ -102,6 +72,107 @@ def expand_artist_releases(artist_id: str) -> dict[str, list[str]]:
     return buckets
 
 
+def _submit(pool: ThreadPoolExecutor | None, func: Callable[..., Any], *args: Any) -> Any:
+    return pool.submit(func, *args) if pool is not None else func(*args)
+
+
+def _result(value: Any) -> Any:
+    return value.result() if isinstance(value, Future) else value
+
+
+def _fetch_page(artist_id: str, index: int, bucket: TokenBucket) -> dict:
+    bucket.acquire()
+    url = f"{DEEZER_API}/artist/{artist_id}/albums"
+    params = {
+        "index": index,
+        "limit": PAGE_SIZE,
+    }
+
+    response = deezer_get(url, params=params, timeout=10)
+    response.raise_for_status()
+
+    return response.json()
+
+
+def _iter_release_items(
+    artist_id: str,
+    bucket: TokenBucket,
+    pool: ThreadPoolExecutor | None,
+) -> Iterator[dict]:
+    """
+    Release items in page order, stopping at the first empty page.
+    """
+    first = _fetch_page(artist_id, 0, bucket)
+    items = first.get("data", [])
+    yield from _release_items(items)
+
+    index = PAGE_SIZE
+    total = first.get("total")
+    if items and pool is not None and isinstance(total, int):
+        pages = [
+            _submit(pool, _fetch_page, artist_id, page_index, bucket)
+            for page_index in range(PAGE_SIZE, total, PAGE_SIZE)
+        ]
+        for page in pages:
+            items = _result(page).get("data", [])
+            if not items:
+                for pending in pages:
+                    pending.cancel()
+                return
+            yield from _release_items(items)
+            index += PAGE_SIZE
+
+    # Sequential paging, and the check past `total` in case it was stale.
+    while items:
+        items = _fetch_page(artist_id, index, bucket).get("data", [])
+        yield from _release_items(items)
+        index += PAGE_SIZE
+
+
+def _release_items(items: list[dict]) -> Iterator[dict]:
+    for item in items:
+        if item.get("id") and item.get("record_type") in {"album", "ep", "single"}:
+            yield item
+
+
+def _lookup_release(bucket: TokenBucket, item: dict) -> dict | None:
+    album_id = item["id"]
+    record_type = item["record_type"]
+
+    metadata = get_album_metadata(str(album_id), throttle=bucket.acquire)
+    if not metadata:
+        return None
+
+    title = getattr(metadata, "title", "Unknown title")
+    year = getattr(metadata, "year", None)
+    tracks = getattr(metadata, "tracks", 0) or 0
+
+    # ---- Flags ----
+    flags = []
+    title_lower = title.lower()
+
+    if "live" in title_lower:
+        flags.append("LIVE?")
+
+    if "deluxe" in title_lower or "expanded" in title_lower:
+        flags.append("DELUXE?")
+
+    if getattr(metadata, "is_compilation", False):
+        flags.append("COMPILATION")
+
+    if getattr(metadata, "is_clean", False):
+        flags.append("CLEAN")
+
+    return {
+        "url": f"https://www.deezer.com/album/{album_id}",
+        "type": record_type,  # authoritative
+        "title": title,
+        "year": year,
+        "tracks": tracks,
+        "flags": flags,
+    }
+
+
 def _format_release_line(r: dict) -> str:
     """
     URL-first, grep-safe, streamrip-safe line.
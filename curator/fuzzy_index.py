@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from typing import Iterable
+
+GRAM_SIZE = 3
+DEFAULT_FUZZY_MIN_SCORE = 0.7
+DEFAULT_FUZZY_LIMIT = 10
+SHORTLIST_FACTOR = 5
+MIN_PROBE_GRAMS = 2
+FIELDS = ("artist", "title")
+
+
+def text_grams(text: str, size: int = GRAM_SIZE) -> frozenset[str]:
+    """
+    Character n-grams of already-normalized text, padded so that word
+    boundaries count; text shorter than one gram is its own gram.
+    """
+    if not text:
+        return frozenset()
+    padded = f" {text} "
+    if len(padded) <= size:
+        return frozenset([padded])
+    return frozenset(padded[i : i + size] for i in range(len(padded) - size + 1))
+
+
+def dice(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+
+class FuzzyIndex:
+    """
+    Inverted n-gram index over normalized (artist, title) pairs.
+
+    A search only visits rows sharing a gram with the query, so matching
+    thousands of folders against the lifecycle registry stays near-linear
+    instead of comparing every pair. Grams carried by more than
+    `max_posting` rows (common short fragments) are skipped while gathering
+    candidates, except for the rarest few of each query field; the
+    shortlisted rows are then scored exactly.
+
+    The score is the Dice coefficient of the gram sets, averaged over the
+    fields present in the query. Ties break on insertion order, so results
+    are deterministic.
+    """
+
+    def __init__(self, pairs: Iterable[tuple[str, str]], *, max_posting: int | None = None) -> None:
+        self._grams: list[dict[str, frozenset[str]]] = []
+        self._postings: dict[str, list[int]] = {}
+        self._by_artist: dict[str, list[int]] = {}
+        for row, (artist, title) in enumerate(pairs):
+            grams = {"artist": text_grams(artist), "title": text_grams(title)}
+            self._grams.append(grams)
+            self._by_artist.setdefault(artist, []).append(row)
+            for field in FIELDS:
+                for gram in grams[field]:
+                    self._postings.setdefault(f"{field[0]}:{gram}", []).append(row)
+        self.max_posting = max_posting if max_posting is not None else max(256, len(self._grams) // 20)
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def rows_for_artist(self, artist: str) -> list[int]:
+        """
+        Rows whose normalized artist equals `artist` exactly.
+        """
+        return list(self._by_artist.get(artist, []))
+
+    def search(
+        self,
+        artist: str,
+        title: str,
+        *,
+        limit: int = DEFAULT_FUZZY_LIMIT,
+        min_score: float = DEFAULT_FUZZY_MIN_SCORE,
+    ) -> list[tuple[int, float]]:
+        """
+        Up to `limit` (row, score) pairs scoring at least `min_score`,
+        best first.
+        """
+        query = {"artist": text_grams(artist), "title": text_grams(title)}
+        fields = [field for field in FIELDS if query[field]]
+        if not fields or limit <= 0:
+            return []
+
+        overlap: Counter[int] = Counter()
+        for field in fields:
+            postings = sorted(
+                (self._postings.get(f"{field[0]}:{gram}", []) for gram in query[field]),
+                key=len,
+            )
+            for probe, rows in enumerate(postings):
+                if probe >= MIN_PROBE_GRAMS and len(rows) > self.max_posting:
+                    break
+                overlap.update(rows)
+
+        shortlist = heapq.nsmallest(limit * SHORTLIST_FACTOR, overlap, key=lambda row: (-overlap[row], row))
+        scored = []
+        for row in shortlist:
+            grams = self._grams[row]
+            score = sum(dice(query[field], grams[field]) for field in fields) / len(fields)
+            if score >= min_score:
+                scored.append((row, round(score, 4)))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import re
 import unicodedata
@@ -9,8 +8,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from curator.atomic import atomic_write_text
-from curator.validator_evidence import parse_validation_log
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.fuzzy_index import FuzzyIndex
+from curator.validator_evidence import manifest_hash_from_hashes, read_validation_log
 
 CONFIDENCE_ORDER = ("HIGH", "MEDIUM", "LOW", "UNKNOWN")
 FOLDER_RE = re.compile(r"(.+)-(\d{4})-FLAC-STiGMA$")
@@ -42,23 +42,10 @@ def split_archive_folder(folder: str | None) -> dict[str, str | None]:
     }
 
 
-def manifest_hash_from_hashes(hashes: dict[str, Any]) -> str | None:
-    if not hashes:
-        return None
-    manifest = "\n".join(f"{name}\0{hashes[name]}" for name in sorted(hashes))
-    return hashlib.sha256(manifest.encode("utf-8")).hexdigest()
-
-
 def _log_manifest_hash(path: str | None) -> str | None:
     if not path:
         return None
-    try:
-        data = json.loads(Path(path).read_text(encoding="utf-8"))
-    except Exception:
-        return None
-    completeness = data.get("completeness", {}) if isinstance(data, dict) else {}
-    hashes = completeness.get("hashes", {}) if isinstance(completeness, dict) else {}
-    return manifest_hash_from_hashes(hashes) if isinstance(hashes, dict) else None
+    return read_validation_log(Path(path))["manifest_hash"]
 
 
 def _release_from_lifecycle(row: dict[str, Any]) -> dict[str, Any]:
@@ -122,36 +109,61 @@ def _candidate_index(albums: list[dict[str, Any]]) -> dict[tuple[str, str], list
     return index
 
 
+def _fuzzy_index(albums: list[dict[str, Any]]) -> FuzzyIndex:
+    return FuzzyIndex(
+        (normalize_identity_text(row.get("artist")), normalize_identity_text(row.get("title"))) for row in albums
+    )
+
+
 def _candidate_from_folder(
     parsed_folder: dict[str, str | None],
     candidates_by_artist_title: dict[tuple[str, str], list[dict[str, Any]]],
+    albums: list[dict[str, Any]] | None = None,
+    fuzzy_index: FuzzyIndex | None = None,
 ) -> list[dict[str, Any]]:
     key = (
         normalize_identity_text(parsed_folder.get("artist")),
         normalize_identity_text(parsed_folder.get("title")),
     )
     rows = candidates_by_artist_title.get(key, [])
+    if rows or fuzzy_index is None or not key[1]:
+        return [
+            {
+                "deezer_album_id": str(row.get("album_id")),
+                "artist": row.get("artist"),
+                "title": row.get("title"),
+                "confidence": "MEDIUM",
+                "evidence": ["normalized_artist_title_match"],
+            }
+            for row in rows[:10]
+        ]
+
+    # No exact match: ranked fuzzy matches are weaker review candidates.
     return [
         {
-            "deezer_album_id": str(row.get("album_id")),
-            "artist": row.get("artist"),
-            "title": row.get("title"),
-            "confidence": "MEDIUM",
-            "evidence": ["normalized_artist_title_match"],
+            "deezer_album_id": str(albums[row].get("album_id")),
+            "artist": albums[row].get("artist"),
+            "title": albums[row].get("title"),
+            "confidence": "LOW",
+            "evidence": ["fuzzy_artist_title_match"],
+            "similarity": score,
         }
-        for row in rows[:10]
+        for row, score in fuzzy_index.search(*key)
     ]
 
 
 def _unresolved_from_log(
     item: dict[str, Any],
     candidates_by_artist_title: dict[tuple[str, str], list[dict[str, Any]]],
+    albums: list[dict[str, Any]] | None = None,
+    fuzzy_index: FuzzyIndex | None = None,
 ) -> dict[str, Any]:
     path = item.get("path")
-    parsed_log = parse_validation_log(Path(path)) if path else None
+    log_record = read_validation_log(Path(path)) if path else {}
+    parsed_log = log_record.get("parsed")
     folder = item.get("folder") or (parsed_log or {}).get("folder")
     parsed_folder = split_archive_folder(folder)
-    candidates = _candidate_from_folder(parsed_folder, candidates_by_artist_title)
+    candidates = _candidate_from_folder(parsed_folder, candidates_by_artist_title, albums, fuzzy_index)
     reason = item.get("reason") or "unresolved"
 
     if parsed_log and not parsed_log.get("album_id"):
@@ -165,12 +177,12 @@ def _unresolved_from_log(
         "folder": folder,
         "parsed_folder": parsed_folder,
         "reason": reason,
-        "identity_confidence": "MEDIUM" if candidates else "UNKNOWN",
+        "identity_confidence": candidates[0]["confidence"] if candidates else "UNKNOWN",
         "candidates": candidates,
         "validation": {
             "validated_at": (parsed_log or {}).get("validated_at"),
             "track_count": (parsed_log or {}).get("track_count"),
-            "manifest_hash": _log_manifest_hash(path),
+            "manifest_hash": log_record.get("manifest_hash"),
             "missing_album_id_tracks": (parsed_log or {}).get("completeness", {}).get(
                 "missing_album_id_tracks"
             ),
@@ -187,9 +199,11 @@ def build_identity_registry(
     albums = lifecycle_registry.get("albums", [])
     releases = [_release_from_lifecycle(row) for row in albums]
     candidates_by_artist_title = _candidate_index(albums)
+    unmatched_logs = lifecycle_registry.get("unmatched_validation_logs", [])
+    fuzzy_index = _fuzzy_index(albums) if unmatched_logs else None
     unresolved = [
-        _unresolved_from_log(item, candidates_by_artist_title)
-        for item in lifecycle_registry.get("unmatched_validation_logs", [])
+        _unresolved_from_log(item, candidates_by_artist_title, albums, fuzzy_index)
+        for item in unmatched_logs
     ]
 
     counts = Counter(item["identity_confidence"] for item in releases)
@@ -198,7 +212,9 @@ def build_identity_registry(
         "total_releases": len(releases),
         "confidence_counts": {level: counts.get(level, 0) for level in CONFIDENCE_ORDER},
         "unresolved_validator_logs": len(unresolved),
-        "unresolved_with_candidates": unresolved_candidate_counts.get("MEDIUM", 0),
+        "unresolved_with_candidates": unresolved_candidate_counts.get("MEDIUM", 0)
+        + unresolved_candidate_counts.get("LOW", 0),
+        "unresolved_with_fuzzy_candidates": unresolved_candidate_counts.get("LOW", 0),
         "unresolved_without_candidates": unresolved_candidate_counts.get("UNKNOWN", 0),
     }
 
@@ -236,6 +252,7 @@ def render_identity_resolution_report(registry: dict[str, Any]) -> str:
         f"- Unknown confidence releases: `{summary['confidence_counts']['UNKNOWN']}`",
         f"- Unresolved validator logs: `{summary['unresolved_validator_logs']}`",
         f"- Unresolved logs with review candidates: `{summary['unresolved_with_candidates']}`",
+        f"- Unresolved logs with fuzzy candidates only: `{summary.get('unresolved_with_fuzzy_candidates', 0)}`",
         "",
         "## Confidence Counts",
         "",
@@ -311,8 +328,9 @@ def render_unresolved_identity_report(registry: dict[str, Any]) -> str:
 
 def write_identity_reports(registry: dict[str, Any], reports_dir: Path) -> None:
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(reports_dir / "identity_resolution_report.md", render_identity_resolution_report(registry))
-    atomic_write_text(reports_dir / "unresolved_identity_report.md", render_unresolved_identity_report(registry))
+    with atomic_batch():
+        atomic_write_text(reports_dir / "identity_resolution_report.md", render_identity_resolution_report(registry))
+        atomic_write_text(reports_dir / "unresolved_identity_report.md", render_unresolved_identity_report(registry))
 
 
 def _pct(count: int, total: int) -> str:
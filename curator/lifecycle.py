@@ -1,25 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from curator.atomic import atomic_write_text
-
-STATE_ORDER = ("DISCOVERED", "ATTEMPTED", "SHIPPED", "VALIDATED", "CONFIRMED")
-STATE_KEYS = {
-    "DISCOVERED": "discovered",
-    "ATTEMPTED": "attempted",
-    "SHIPPED": "shipped",
-    "VALIDATED": "validated",
-    "CONFIRMED": "confirmed",
-}
-STATE_RANK = {state: idx for idx, state in enumerate(STATE_ORDER, start=1)}
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.lifecycle_states import STATE_KEYS, STATE_ORDER, STATE_RANK
+from curator.report_aggregates import aggregate_registry
 
 ALBUM_RE = re.compile(r"deezer\.com/(?:[a-z]{2}/)?album/(\d+)", re.IGNORECASE)
+LIFECYCLE_MANIFEST_FILENAME = "lifecycle_build_manifest.json"
+LIFECYCLE_MANIFEST_SCHEMA = 1
+MIN_PARALLEL_SOURCES = 64
 
 
 def load_json_file(path: Path) -> dict[str, Any]:
@@ -96,83 +94,86 @@ def _artist_from_filename(filename: str | None) -> str | None:
     return Path(filename).stem.replace("_", " ")
 
 
-def read_artist_releases(artists_dir: Path) -> tuple[dict[str, dict[str, Any]], dict[str, int]]:
-    rows: dict[str, dict[str, Any]] = {}
-    files = sorted(artists_dir.glob("*.txt")) if artists_dir.exists() else []
-    line_count = 0
-
-    for path in files:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-        artist = _artist_from_file(path, lines)
-
-        for line in lines:
-            match = ALBUM_RE.search(line)
-            if not match:
-                continue
+def _empty_contribution() -> dict[str, Any]:
+    return {"artist": None, "title": None, "state": None, "timestamps": {}, "details": {}}
 
-            line_count += 1
-            row = _album(rows, match.group(1))
-            row["artist"] = row["artist"] or artist
-            row["title"] = row["title"] or _title_from_annotated_line(line)
-            _set_state(row, "DISCOVERED")
-            _add_source(row, f"artists/{path.name}")
 
-    return rows, {"artist_files": len(files), "artist_album_lines": line_count}
+def _apply_contribution(row: dict[str, Any], contribution: dict[str, Any], source: str) -> None:
+    row["artist"] = row["artist"] or contribution.get("artist")
+    row["title"] = row["title"] or contribution.get("title")
+    _set_state(row, contribution["state"])
+    _add_source(row, source)
+    row["timestamps"].update(contribution.get("timestamps", {}))
+    row["details"].update(contribution.get("details", {}))
 
 
-def _merge_rows(
-    target: dict[str, dict[str, Any]],
-    incoming: dict[str, dict[str, Any]],
-) -> None:
-    for album_id, incoming_row in incoming.items():
-        row = _album(target, album_id)
-        row["artist"] = row["artist"] or incoming_row.get("artist")
-        row["title"] = row["title"] or incoming_row.get("title")
+def parse_artist_file(path: Path, text: str) -> tuple[dict[str, dict[str, Any]], int]:
+    """
+    Album contributions of one artist file, and its album line count.
+    """
+    rows: dict[str, dict[str, Any]] = {}
+    lines = text.splitlines()
+    artist = _artist_from_file(path, lines)
+    line_count = 0
 
-        for key, value in incoming_row["states"].items():
-            if value:
-                row["states"][key] = True
+    for line in lines:
+        match = ALBUM_RE.search(line)
+        if not match:
+            continue
 
-        row["highest_state"] = highest_state(row["states"])
+        line_count += 1
+        row = rows.setdefault(match.group(1), {**_empty_contribution(), "artist": artist, "state": "DISCOVERED"})
+        row["title"] = row["title"] or _title_from_annotated_line(line)
 
-        for source in incoming_row.get("sources", []):
-            _add_source(row, source)
+    return rows, line_count
 
 
-def build_lifecycle_registry(
-    data_dir: Path,
+def read_artist_releases(
+    artists_dir: Path,
     *,
-    generated_at: str | None = None,
-    validation_evidence: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+    workers: int = 1,
+) -> tuple[dict[str, dict[str, Any]], dict[str, int]]:
+    """
+    Discovered rows from every artist file.
+
+    With workers > 1 files are parsed on a process pool; per-file results
+    are still merged in sorted path order, so the rows are identical.
+    """
     rows: dict[str, dict[str, Any]] = {}
+    files = sorted(artists_dir.glob("*.txt")) if artists_dir.exists() else []
+    sources = [(f"artists/{path.name}", path, path.read_bytes()) for path in files]
+    line_count = 0
+
+    for (name, _, _), (contributions, count) in zip(sources, _map_parse_sources(sources, workers)):
+        line_count += count
+        for album_id, contribution in contributions.items():
+            _apply_contribution(_album(rows, album_id), contribution, name)
+
+    return rows, {"artist_files": len(files), "artist_album_lines": line_count}
 
-    discovered, artist_counts = read_artist_releases(data_dir / "artists")
-    _merge_rows(rows, discovered)
 
-    attempted = load_json_file(data_dir / "attempted_albums.json")
+def _attempted_contributions(attempted: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    rows = {}
     for album_id, payload in attempted.items():
-        row = _album(rows, str(album_id))
-        _set_state(row, "ATTEMPTED")
-        _add_source(row, "attempted_albums.json")
+        row = rows[str(album_id)] = {**_empty_contribution(), "state": "ATTEMPTED"}
         if isinstance(payload, dict):
-            row["title"] = row["title"] or _title_from_annotated_line(
-                str(payload.get("album_url", ""))
-            )
+            row["title"] = _title_from_annotated_line(str(payload.get("album_url", "")))
             if payload.get("last_attempt"):
                 row["timestamps"]["last_attempt"] = payload["last_attempt"]
             if payload.get("attempts") is not None:
                 row["details"]["attempts"] = payload["attempts"]
+    return rows
+
 
-    shipped_raw = load_json_file(data_dir / "shipped_jobs.json")
+def _shipped_entries(shipped_raw: dict[str, Any]) -> dict[str, Any]:
     shipped = shipped_raw.get("shipped", {}) if isinstance(shipped_raw, dict) else {}
-    if not isinstance(shipped, dict):
-        shipped = {}
+    return shipped if isinstance(shipped, dict) else {}
+
 
-    for album_id, payload in shipped.items():
-        row = _album(rows, str(album_id))
-        _set_state(row, "SHIPPED")
-        _add_source(row, "shipped_jobs.json")
+def _shipped_contributions(shipped_raw: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    rows = {}
+    for album_id, payload in _shipped_entries(shipped_raw).items():
+        row = rows[str(album_id)] = {**_empty_contribution(), "state": "SHIPPED"}
         if isinstance(payload, dict):
             if payload.get("shipped_at_utc"):
                 row["timestamps"]["shipped_at_utc"] = payload["shipped_at_utc"]
@@ -180,61 +181,248 @@ def build_lifecycle_registry(
                 row["details"]["jobname"] = payload["jobname"]
             if payload.get("remote_job"):
                 row["details"]["remote_job"] = payload["remote_job"]
+    return rows
 
-    validated = load_json_file(data_dir / "validated_albums.json")
+
+def _validated_contributions(validated: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    rows = {}
     for album_id, payload in validated.items():
-        row = _album(rows, str(album_id))
-        _set_state(row, "VALIDATED")
-        _add_source(row, "validated_albums.json")
+        row = rows[str(album_id)] = {**_empty_contribution(), "state": "VALIDATED"}
         if isinstance(payload, dict):
-            row["title"] = row["title"] or payload.get("folder")
+            row["title"] = payload.get("folder")
             if payload.get("validated_at"):
                 row["timestamps"]["validated_at"] = payload["validated_at"]
             if payload.get("folder"):
                 row["details"]["validated_folder"] = payload["folder"]
             if payload.get("tracks") is not None:
                 row["details"]["validated_tracks"] = payload["tracks"]
+    return rows
+
 
-    confirmed = load_json_file(data_dir / "confirmed_albums.json")
+def _confirmed_contributions(confirmed: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    rows = {}
     for album_id, payload in confirmed.items():
-        row = _album(rows, str(album_id))
-        _set_state(row, "CONFIRMED")
-        _add_source(row, "confirmed_albums.json")
+        row = rows[str(album_id)] = {**_empty_contribution(), "state": "CONFIRMED"}
         if isinstance(payload, dict):
-            row["artist"] = row["artist"] or _artist_from_filename(payload.get("artist_file"))
+            row["artist"] = _artist_from_filename(payload.get("artist_file"))
             if payload.get("confirmed_at"):
                 row["timestamps"]["confirmed_at"] = payload["confirmed_at"]
             if payload.get("artist_file"):
                 row["details"]["confirmed_artist_file"] = payload["artist_file"]
+    return rows
+
+
+# Merge order matters: artist and title keep the first value seen, so
+# artist files come first (in path order), then these sources in order.
+JSON_SOURCES = (
+    ("attempted_albums.json", "attempted_albums", _attempted_contributions),
+    ("shipped_jobs.json", "shipped_albums", _shipped_contributions),
+    ("validated_albums.json", "validated_albums", _validated_contributions),
+    ("confirmed_albums.json", "confirmed_albums", _confirmed_contributions),
+)
+
+
+def _json_from_bytes(raw: bytes) -> dict[str, Any]:
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _parse_source(name: str, path: Path, raw: bytes) -> tuple[dict[str, dict[str, Any]], int]:
+    if name.startswith("artists/"):
+        return parse_artist_file(path, raw.decode("utf-8", errors="replace"))
+    for filename, _, contributions in JSON_SOURCES:
+        if filename == name:
+            data = _json_from_bytes(raw)
+            count = len(_shipped_entries(data)) if filename == "shipped_jobs.json" else len(data)
+            return contributions(data), count
+    raise ValueError(f"unknown lifecycle source: {name}")
+
+
+def _map_parse_sources(
+    sources: list[tuple[str, Path, bytes]],
+    workers: int,
+) -> Iterator[tuple[dict[str, dict[str, Any]], int]]:
+    """
+    _parse_source() over `sources`, yielding results in input order.
+
+    A process pool is only started for MIN_PARALLEL_SOURCES or more
+    sources; below that, starting it costs more than the parsing it saves.
+    """
+    if workers <= 1 or len(sources) < MIN_PARALLEL_SOURCES:
+        for name, path, raw in sources:
+            yield _parse_source(name, path, raw)
+        return
+
+    names, paths, raws = zip(*sources)
+    chunksize = max(1, len(sources) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_parse_source, names, paths, raws, chunksize=chunksize)
+
+
+def _source_paths(data_dir: Path) -> list[tuple[str, Path]]:
+    artists_dir = data_dir / "artists"
+    files = sorted(artists_dir.glob("*.txt")) if artists_dir.exists() else []
+    sources = [(f"artists/{path.name}", path) for path in files]
+    sources.extend((filename, data_dir / filename) for filename, _, _ in JSON_SOURCES)
+    return sources
+
+
+def _scan_sources(
+    data_dir: Path,
+    previous: dict[str, Any],
+    *,
+    workers: int = 1,
+) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """
+    Current sources in merge order, reusing unchanged entries of `previous`.
+
+    A source is reused when its size and mtime match, or when they differ
+    but the content hash does not; only sources whose hash changed are
+    parsed, on `workers` processes. Returns the sources and the names whose
+    contributions changed (reparsed, added or removed).
+    """
+    sources: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, Path, os.stat_result, bytes, str]] = []
+
+    for name, path in _source_paths(data_dir):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        old = previous.get(name)
+        if old and old.get("size") == stat.st_size and old.get("mtime_ns") == stat.st_mtime_ns:
+            sources[name] = old
+            continue
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            continue
+        digest = hashlib.sha256(raw).hexdigest()
+        if old and old.get("sha256") == digest:
+            sources[name] = {**old, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            continue
+        # Placeholder keeps the merge order; filled in below.
+        sources[name] = {}
+        pending.append((name, path, stat, raw, digest))
+
+    changed: set[str] = set()
+    results = _map_parse_sources([(name, path, raw) for name, path, _, raw, _ in pending], workers)
+    for (name, _, stat, _, digest), (rows, count) in zip(pending, results):
+        sources[name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "count": count,
+            "rows": rows,
+        }
+        changed.add(name)
+
+    changed.update(set(previous) - set(sources))
+    return sources, changed
+
+
+def _merge_sources(
+    sources: dict[str, dict[str, Any]],
+    album_ids: set[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    rows: dict[str, dict[str, Any]] = {}
+    for name, source in sources.items():
+        contributions = source["rows"]
+        ids = contributions if album_ids is None else album_ids.intersection(contributions)
+        for album_id in ids:
+            _apply_contribution(_album(rows, album_id), contributions[album_id], name)
 
-    albums = []
     for row in rows.values():
         row["artist"] = row["artist"] or "(unknown)"
         row["title"] = row["title"] or "(unknown)"
         row["sources"].sort()
-        albums.append(row)
+    return rows
+
+
+def load_build_manifest(path: Path) -> dict[str, Any]:
+    manifest = load_json_file(path)
+    if manifest.get("schema") != LIFECYCLE_MANIFEST_SCHEMA:
+        return {}
+    if not isinstance(manifest.get("sources"), dict) or not isinstance(manifest.get("albums"), dict):
+        return {}
+    return manifest
+
 
-    albums.sort(
+def build_lifecycle_registry(
+    data_dir: Path,
+    *,
+    generated_at: str | None = None,
+    validation_evidence: dict[str, Any] | None = None,
+    manifest_path: Path | None = None,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """
+    Project every album's lifecycle state from the artist files and the
+    attempted/shipped/validated/confirmed state files.
+
+    With `manifest_path`, each source's (size, mtime, sha256) and the rows it
+    contributed are persisted there. A rebuild then reparses only changed
+    sources and re-merges only the albums they touch (before or after the
+    change); the registry is identical to a full build.
+
+    `workers` > 1 parses changed sources on a process pool, which mostly
+    helps cold builds of a large artists/ tree.
+    """
+    previous = load_build_manifest(manifest_path) if manifest_path is not None else {}
+    sources, changed = _scan_sources(data_dir, previous.get("sources", {}), workers=workers)
+
+    if previous:
+        previous_sources = previous["sources"]
+        affected: set[str] = set()
+        for name in changed:
+            affected.update(previous_sources.get(name, {}).get("rows", {}))
+            affected.update(sources.get(name, {}).get("rows", {}))
+        rows = {album_id: row for album_id, row in previous["albums"].items() if album_id not in affected}
+        rows.update(_merge_sources(sources, affected))
+    else:
+        affected = set()
+        rows = _merge_sources(sources)
+
+    if manifest_path is not None:
+        manifest = {
+            "schema": LIFECYCLE_MANIFEST_SCHEMA,
+            "sources": sources,
+            "albums": rows,
+            "last_build": {
+                "sources_reparsed": len(changed & set(sources)),
+                "albums_remerged": len(affected) if previous else len(rows),
+            },
+        }
+        # Serialized before validation evidence is attached to the rows.
+        atomic_write_text(manifest_path, json.dumps(manifest, ensure_ascii=False, sort_keys=True) + "\n")
+
+    albums = sorted(
+        rows.values(),
         key=lambda row: (
             -STATE_RANK.get(row["highest_state"] or "", 0),
             row["artist"].lower(),
             row["title"].lower(),
             row["album_id"],
-        )
+        ),
     )
 
     summary = summarize_registry(albums)
 
+    artist_sources = [source for name, source in sources.items() if name.startswith("artists/")]
+    source_counts = {
+        "artist_files": len(artist_sources),
+        "artist_album_lines": sum(source["count"] for source in artist_sources),
+    }
+    for filename, key, _ in JSON_SOURCES:
+        source_counts[key] = sources.get(filename, {}).get("count", 0)
+
     registry = {
         "schema": 1,
         "generated_at": generated_at or datetime.now().isoformat(timespec="seconds"),
-        "source_counts": {
-            **artist_counts,
-            "attempted_albums": len(attempted),
-            "shipped_albums": len(shipped),
-            "validated_albums": len(validated),
-            "confirmed_albums": len(confirmed),
-        },
+        "source_counts": source_counts,
         "summary": summary,
         "albums": albums,
     }
@@ -248,41 +436,21 @@ def build_lifecycle_registry(
 
 
 def summarize_registry(albums: list[dict[str, Any]]) -> dict[str, Any]:
-    highest_counts = Counter(row["highest_state"] or "UNKNOWN" for row in albums)
-    coverage_counts = Counter()
-    for row in albums:
-        for state, key in STATE_KEYS.items():
-            if row["states"].get(key, False):
-                coverage_counts[state] += 1
-
-    gaps = {
-        "discovered_not_attempted": sum(
-            1
-            for row in albums
-            if row["states"]["discovered"] and not row["states"]["attempted"]
-        ),
-        "shipped_not_validated": sum(
-            1
-            for row in albums
-            if row["states"]["shipped"] and not row["states"]["validated"]
-        ),
-        "confirmed_not_validated": sum(
-            1
-            for row in albums
-            if row["states"]["confirmed"] and not row["states"]["validated"]
-        ),
-        "validated_not_discovered": sum(
-            1
-            for row in albums
-            if row["states"]["validated"] and not row["states"]["discovered"]
-        ),
-    }
-
+    aggregates = aggregate_registry({"albums": albums})
+    gaps = aggregates["gaps"]
     return {
-        "total_albums": len(albums),
-        "highest_state_counts": {state: highest_counts.get(state, 0) for state in STATE_ORDER},
-        "state_evidence_counts": {state: coverage_counts.get(state, 0) for state in STATE_ORDER},
-        "gaps": gaps,
+        "total_albums": aggregates["total_albums"],
+        "highest_state_counts": aggregates["highest_state_counts"],
+        "state_evidence_counts": aggregates["state_evidence_counts"],
+        "gaps": {
+            name: len(gaps[name])
+            for name in (
+                "discovered_not_attempted",
+                "shipped_not_validated",
+                "confirmed_not_validated",
+                "validated_not_discovered",
+            )
+        },
     }
 
 
@@ -291,12 +459,28 @@ def write_registry(registry: dict[str, Any], path: Path) -> None:
     atomic_write_text(path, text)
 
 
-def write_reports(registry: dict[str, Any], reports_dir: Path) -> None:
+def write_reports(
+    registry: dict[str, Any],
+    reports_dir: Path,
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> None:
+    aggregates = aggregates or aggregate_registry(registry)
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(reports_dir / "lifecycle_summary.md", render_lifecycle_summary(registry))
-    atomic_write_text(reports_dir / "discovery_gap_report.md", render_discovery_gap_report(registry))
-    atomic_write_text(reports_dir / "shipment_gap_report.md", render_shipment_gap_report(registry))
-    atomic_write_text(reports_dir / "validation_gap_report.md", render_validation_gap_report(registry))
+    with atomic_batch():
+        atomic_write_text(reports_dir / "lifecycle_summary.md", render_lifecycle_summary(registry))
+        atomic_write_text(
+            reports_dir / "discovery_gap_report.md",
+            render_discovery_gap_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(
+            reports_dir / "shipment_gap_report.md",
+            render_shipment_gap_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(
+            reports_dir / "validation_gap_report.md",
+            render_validation_gap_report(registry, aggregates=aggregates),
+        )
 
 
 def _pct(count: int, total: int) -> str:
@@ -364,12 +548,12 @@ def render_lifecycle_summary(registry: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def render_discovery_gap_report(registry: dict[str, Any]) -> str:
-    rows = [
-        row
-        for row in registry["albums"]
-        if row["states"]["discovered"] and not row["states"]["attempted"]
-    ]
+def _gaps(registry: dict[str, Any], aggregates: dict[str, Any] | None) -> dict[str, list[dict[str, Any]]]:
+    return (aggregates or aggregate_registry(registry))["gaps"]
+
+
+def render_discovery_gap_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    rows = _gaps(registry, aggregates)["discovered_not_attempted"]
     by_artist = Counter(row["artist"] for row in rows)
 
     lines = [
@@ -396,12 +580,8 @@ def render_discovery_gap_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def render_shipment_gap_report(registry: dict[str, Any]) -> str:
-    rows = [
-        row
-        for row in registry["albums"]
-        if row["states"]["shipped"] and not row["states"]["validated"]
-    ]
+def render_shipment_gap_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    rows = _gaps(registry, aggregates)["shipped_not_validated"]
     shipped_times = [
         row["timestamps"].get("shipped_at_utc")
         for row in rows
@@ -439,20 +619,12 @@ def render_shipment_gap_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def render_validation_gap_report(registry: dict[str, Any]) -> str:
-    albums = registry["albums"]
-    confirmed_not_validated = [
-        row for row in albums if row["states"]["confirmed"] and not row["states"]["validated"]
-    ]
-    validated_not_discovered = [
-        row for row in albums if row["states"]["validated"] and not row["states"]["discovered"]
-    ]
-    shipped_without_attempt = [
-        row for row in albums if row["states"]["shipped"] and not row["states"]["attempted"]
-    ]
-    validated_without_shipped = [
-        row for row in albums if row["states"]["validated"] and not row["states"]["shipped"]
-    ]
+def render_validation_gap_report(registry: dict[str, Any], *, aggregates: dict[str, Any] | None = None) -> str:
+    gaps = _gaps(registry, aggregates)
+    confirmed_not_validated = gaps["confirmed_not_validated"]
+    validated_not_discovered = gaps["validated_not_discovered"]
+    shipped_without_attempt = gaps["shipped_not_attempted"]
+    validated_without_shipped = gaps["validated_not_shipped"]
 
     lines = [
         "# Validation Gap Report",
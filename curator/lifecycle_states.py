@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+STATE_ORDER = ("DISCOVERED", "ATTEMPTED", "SHIPPED", "VALIDATED", "CONFIRMED")
+STATE_KEYS = {
+    "DISCOVERED": "discovered",
+    "ATTEMPTED": "attempted",
+    "SHIPPED": "shipped",
+    "VALIDATED": "validated",
+    "CONFIRMED": "confirmed",
+}
+STATE_RANK = {state: idx for idx, state in enumerate(STATE_ORDER, start=1)}
@@ -1,9 +1,11 @@
 import requests
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+from curator.deezer_client import DEEZER_API, deezer_get
+from curator.response_cache import read_through
 
-DEEZER_API = "https://api.deezer.com"
 REQUEST_DELAY = 0.1  # seconds
 
 
@@ -54,16 +56,34 @@ def _is_clean_edition(title: str, explicit_lyrics: Any) -> bool:
     )
 
 
-def get_album_metadata(album_id: str) -> AlbumMetadata | None:
+def _fetch_album_payload(album_id: str, throttle: Callable[[], Any] | None = None) -> dict[str, Any] | None:
     url = f"{DEEZER_API}/album/{album_id}"
 
+    if throttle is not None:
+        throttle()
     try:
-        response = requests.get(url, timeout=10)
+        response = deezer_get(url, timeout=10)
         response.raise_for_status()
     except requests.RequestException:
         return None
 
     data = response.json()
+    if throttle is None:
+        time.sleep(REQUEST_DELAY)
+    return data if isinstance(data, dict) else None
+
+
+def get_album_metadata(album_id: str, *, throttle: Callable[[], Any] | None = None) -> AlbumMetadata | None:
+    """
+    Album metadata, from the response cache when present.
+
+    `throttle` is called before a real request, e.g. a TokenBucket's
+    acquire; without it each request is followed by REQUEST_DELAY.
+    Cached payloads cost neither.
+    """
+    data = read_through(f"album/{album_id}", lambda: _fetch_album_payload(album_id, throttle))
+    if not data:
+        return None
 
     artist = data.get("artist", {}).get("name")
     title = data.get("title")
@@ -71,8 +91,6 @@ def get_album_metadata(album_id: str) -> AlbumMetadata | None:
     tracks = _track_count(data.get("nb_tracks"))
     is_compilation = data.get("record_type") == "compilation"
 
-    time.sleep(REQUEST_DELAY)
-
     if not artist or not title:
         return None
 
@@ -2,19 +2,85 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import sys
+import threading
 import time
 from collections import Counter
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, TypeVar
 
-import requests
-
-from curator.atomic import atomic_write_text
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.bounded_map import bounded_map
+from curator.deezer_client import DEEZER_API, DEFAULT_POOL_MAXSIZE, configure_default_client, deezer_get
 from curator.lifecycle import load_json_file
+from curator.response_cache import RESPONSE_CACHE_DIRNAME, configure_response_cache, read_through, response_cache
+from curator.throttle import TokenBucket
 
-DEEZER_API = "https://api.deezer.com"
 REQUEST_DELAY = 0.1
+DEFAULT_REQUESTS_PER_SECOND = 1 / REQUEST_DELAY
+HYDRATION_MODES = ("full", "album")
+DEEP_TRACK_FIELDS = ("isrc", "disc_number", "contributors")
+DEFAULT_CHECKPOINT_ALBUMS = 25
+DEFAULT_CHECKPOINT_SECONDS = 30.0
+
+ERROR_KINDS = ("transient", "rate_limited", "not_found")
+RETRY_BACKOFF_SECONDS = {
+    "transient": 60 * 60,
+    "rate_limited": 15 * 60,
+    "not_found": 7 * 24 * 60 * 60,
+}
+MAX_RETRY_BACKOFF_SECONDS = 30 * 24 * 60 * 60
+DEEZER_NOT_FOUND_CODES = {800}
+DEEZER_RATE_LIMIT_CODES = {4}
+
+REFRESH_KINDS = ("albums", "artists", "tracks")
+DEFAULT_REFRESH_TTL_DAYS = {"albums": 30, "artists": 14, "tracks": 90}
+REFRESH_IGNORED_FIELDS = {"fetched_at", "hydration"}
+
+ProgressCallback = Callable[[int, int, dict[str, Any]], None]
+T = TypeVar("T")
+
+
+class MetadataFetchError(Exception):
+    """
+    A Deezer fetch that failed, classified for the retry ledger.
+
+    kind is "transient" (timeouts, connection errors, 5xx, unreadable
+    payloads), "rate_limited" (HTTP 429 or Deezer quota errors) or
+    "not_found" (HTTP 404/410 or Deezer "no data").
+    """
+
+    def __init__(self, kind: str, message: str, *, status: int | None = None) -> None:
+        super().__init__(message)
+        self.kind = kind
+        self.status = status
+        self.message = message
+
+    @classmethod
+    def from_exception(cls, exc: Exception) -> MetadataFetchError:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+        if status in (404, 410):
+            kind = "not_found"
+        elif status == 429:
+            kind = "rate_limited"
+        else:
+            kind = "transient"
+        return cls(kind, f"{type(exc).__name__}: {exc}", status=status)
+
+    @classmethod
+    def from_payload(cls, error: Any) -> MetadataFetchError:
+        error = error if isinstance(error, dict) else {"message": str(error)}
+        code = error.get("code")
+        if code in DEEZER_NOT_FOUND_CODES:
+            kind = "not_found"
+        elif code in DEEZER_RATE_LIMIT_CODES:
+            kind = "rate_limited"
+        else:
+            kind = "transient"
+        return cls(kind, str(error.get("message") or error.get("type") or "deezer error"))
 
 
 def empty_cache(generated_at: str | None = None) -> dict[str, Any]:
@@ -46,6 +112,87 @@ def load_cache(path: Path) -> dict[str, Any]:
     return data
 
 
+class MetadataJournal:
+    """
+    Append-only log of harvest results written while a build runs.
+
+    Every merged album (or deep-fetched track) is appended as one JSON line
+    and flushed, so a crash or Ctrl-C loses at most the line being written.
+    The file is fsynced as a checkpoint every `every_albums` results or
+    `every_seconds`, whichever comes first. replay_journal() folds the lines
+    back into a loaded cache, and the journal is discarded once the full
+    cache has been written.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        every_albums: int = DEFAULT_CHECKPOINT_ALBUMS,
+        every_seconds: float = DEFAULT_CHECKPOINT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = Path(path)
+        self.every_albums = max(1, every_albums)
+        self.every_seconds = every_seconds
+        self._clock = clock
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a", encoding="utf-8")
+        self._pending = 0
+        self._last_checkpoint = clock()
+        self.checkpoints = 0
+
+    def append(self, result: dict[str, Any]) -> None:
+        self._handle.write(json.dumps(result, ensure_ascii=False, sort_keys=True) + "\n")
+        self._handle.flush()
+        self._pending += 1
+        if self._pending >= self.every_albums or self._clock() - self._last_checkpoint >= self.every_seconds:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._pending = 0
+        self._last_checkpoint = self._clock()
+        self.checkpoints += 1
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        self.checkpoint()
+        self._handle.close()
+
+    def __enter__(self) -> MetadataJournal:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def journal_path_for(cache_path: Path) -> Path:
+    return cache_path.with_name(cache_path.name + ".journal")
+
+
+def replay_journal(cache: dict[str, Any], path: Path) -> int:
+    """
+    Merge journaled results into `cache`; returns the number replayed.
+
+    A torn final line from an interrupted write is ignored.
+    """
+    if not path.exists():
+        return 0
+    replayed = 0
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            result = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(result, dict):
+            _merge_harvest(cache, result)
+            replayed += 1
+    return replayed
+
+
 def album_ids_from_registries(
     lifecycle_registry: dict[str, Any],
     identity_registry: dict[str, Any],
@@ -56,29 +203,59 @@ def album_ids_from_registries(
         for row in identity_registry.get("releases", [])
         if row.get("discovery_identity", {}).get("deezer_album_id")
     )
-    return sorted(ids, key=lambda value: int(value) if value.isdigit() else value)
+    return sorted(ids, key=_id_sort_key)
+
+
+def _id_sort_key(value: str) -> tuple[int, int, str]:
+    return (0, int(value), "") if value.isdigit() else (1, 0, value)
 
 
-def fetch_json(url: str, *, get: Callable[..., Any] = requests.get) -> dict[str, Any] | None:
+def fetch_json(
+    url: str,
+    *,
+    get: Callable[..., Any] = deezer_get,
+    strict: bool = False,
+) -> dict[str, Any] | None:
+    """
+    Fetch a Deezer payload; failures return None, or raise a classified
+    MetadataFetchError when `strict` is set.
+    """
     try:
         response = get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
-    except Exception:
+    except Exception as exc:
+        if strict:
+            raise MetadataFetchError.from_exception(exc) from exc
+        return None
+
+    if not isinstance(data, dict):
+        if strict:
+            raise MetadataFetchError("transient", "payload is not a JSON object")
+        return None
+    if data.get("error"):
+        if strict:
+            raise MetadataFetchError.from_payload(data["error"])
         return None
-    return data if isinstance(data, dict) and not data.get("error") else None
+    return data
 
 
-def fetch_deezer_album(album_id: str, *, get: Callable[..., Any] = requests.get) -> dict[str, Any] | None:
-    return fetch_json(f"{DEEZER_API}/album/{album_id}", get=get)
+def fetch_deezer_album(
+    album_id: str,
+    *,
+    get: Callable[..., Any] = deezer_get,
+    strict: bool = False,
+) -> dict[str, Any] | None:
+    url = f"{DEEZER_API}/album/{album_id}"
+    return read_through(f"album/{album_id}", lambda: fetch_json(url, get=get, strict=strict))
 
 
-def fetch_deezer_artist(artist_id: str, *, get: Callable[..., Any] = requests.get) -> dict[str, Any] | None:
-    return fetch_json(f"{DEEZER_API}/artist/{artist_id}", get=get)
+def fetch_deezer_artist(artist_id: str, *, get: Callable[..., Any] = deezer_get) -> dict[str, Any] | None:
+    return read_through(f"artist/{artist_id}", lambda: fetch_json(f"{DEEZER_API}/artist/{artist_id}", get=get))
 
 
-def fetch_deezer_track(track_id: str, *, get: Callable[..., Any] = requests.get) -> dict[str, Any] | None:
-    return fetch_json(f"{DEEZER_API}/track/{track_id}", get=get)
+def fetch_deezer_track(track_id: str, *, get: Callable[..., Any] = deezer_get) -> dict[str, Any] | None:
+    return read_through(f"track/{track_id}", lambda: fetch_json(f"{DEEZER_API}/track/{track_id}", get=get))
 
 
 def parse_album_payload(data: dict[str, Any]) -> dict[str, Any]:
@@ -138,7 +315,11 @@ def parse_artist_payload(data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def parse_track_payload(data: dict[str, Any]) -> dict[str, Any]:
+def parse_track_payload(data: dict[str, Any], *, hydration: str = "track") -> dict[str, Any]:
+    """
+    Parse a track payload; `hydration` records whether it came from the
+    track endpoint ("track") or an album's embedded tracklist ("album").
+    """
     contributors = [_parse_contributor(item) for item in data.get("contributors", []) if isinstance(item, dict)]
     return {
         "deezer_track_id": str(data.get("id")),
@@ -154,37 +335,427 @@ def parse_track_payload(data: dict[str, Any]) -> dict[str, Any]:
             "content_lyrics": data.get("explicit_content_lyrics"),
             "content_cover": data.get("explicit_content_cover"),
         },
+        "hydration": hydration,
         "fetched_at": datetime.now().isoformat(timespec="seconds"),
     }
 
 
+def album_tracklist(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    tracks = payload.get("tracks", {})
+    items = tracks.get("data", []) if isinstance(tracks, dict) else []
+    return [item for item in items if isinstance(item, dict) and item.get("id")]
+
+
+def track_needs_deep_fetch(track: dict[str, Any]) -> bool:
+    """
+    True for album-tier tracks missing a deep field. Tracks already read
+    from the track endpoint are final even when Deezer has no ISRC for them.
+    """
+    return track.get("hydration") == "album" and any(not track.get(field) for field in DEEP_TRACK_FIELDS)
+
+
 def build_metadata_cache(
     lifecycle_registry: dict[str, Any],
     identity_registry: dict[str, Any],
     *,
     existing_cache: dict[str, Any] | None = None,
     limit: int | None = None,
-    get: Callable[..., Any] = requests.get,
+    workers: int = 1,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    hydration: str = "full",
+    retry_errors: bool = True,
+    journal: MetadataJournal | None = None,
+    progress: ProgressCallback | None = None,
+    now: datetime | None = None,
+    get: Callable[..., Any] = deezer_get,
     sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
 ) -> dict[str, Any]:
+    """
+    Fetch missing album, artist and track metadata into the cache.
+
+    With workers > 1 albums are harvested on a thread pool so network latency
+    overlaps, while one shared token bucket keeps the total request rate under
+    `requests_per_second`. Results are merged in album id order either way.
+
+    hydration="full" fetches every new track from the track endpoint.
+    hydration="album" builds track entries from the album's embedded
+    tracklist instead and leaves missing fields to deepen_tracks().
+
+    Each merged album is appended to `journal` when given, so an interrupted
+    build can resume via replay_journal(). `progress` receives
+    (done, total, info) after every album, with an ETA in info.
+
+    Failed albums are recorded in cache["errors"] with their failure kind,
+    attempt count and next retry time. With `retry_errors`, failures whose
+    backoff has elapsed are retried after all new ids.
+    """
+    if hydration not in HYDRATION_MODES:
+        raise ValueError(f"unknown hydration mode: {hydration}")
     cache = existing_cache or empty_cache()
-    cache["generated_at"] = datetime.now().isoformat(timespec="seconds")
+    now = now or datetime.now()
+    cache["generated_at"] = now.isoformat(timespec="seconds")
     ids = album_ids_from_registries(lifecycle_registry, identity_registry)
     missing = [
         album_id
         for album_id in ids
         if album_id not in cache["albums"] and album_id not in cache["errors"]
     ]
+    if retry_errors:
+        # New ids first, then failures whose backoff window has passed.
+        missing.extend(retry_eligible_errors(cache, ids, now=now))
     selected = missing[:limit] if limit is not None else missing
 
-    for album_id in selected:
-        payload = fetch_deezer_album(album_id, get=get)
-        if not payload:
-            cache["errors"][album_id] = {"type": "album_fetch_failed", "fetched_at": cache["generated_at"]}
+    harvester = _Harvester(
+        cache,
+        TokenBucket(requests_per_second, burst=max(1, workers), clock=clock, sleep=sleep),
+        get=get,
+        hydration=hydration,
+    )
+    started = clock()
+    failed = 0
+    for done, result in enumerate(_map_work(harvester.harvest_album, selected, workers), start=1):
+        _merge_harvest(cache, result)
+        if journal is not None:
+            journal.append(result)
+        failed += 1 if result.get("error") else 0
+        if progress is not None:
+            info = _progress_info(result["album_id"], done, len(selected), failed, clock() - started)
+            progress(done, len(selected), info)
+
+    cache["summary"] = metadata_coverage(cache, len(ids))
+    return cache
+
+
+def deepen_tracks(
+    cache: dict[str, Any],
+    *,
+    track_ids: list[str] | None = None,
+    limit: int | None = None,
+    workers: int = 1,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    get: Callable[..., Any] = deezer_get,
+    journal: MetadataJournal | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> int:
+    """
+    Fetch album-tier tracks whose cached entry lacks ISRC, disc number or
+    contributors. Each fetched track moves to the track tier, so repeated
+    runs with a `limit` work through the backlog instead of refetching it.
+
+    Without `track_ids` every cached track is considered, in id order. Pass
+    specific ids to hydrate on demand. Returns the number of tracks updated.
+    """
+    candidates = track_ids if track_ids is not None else sorted(cache["tracks"], key=_id_sort_key)
+    pending = [
+        track_id
+        for track_id in candidates
+        if track_id in cache["tracks"] and track_needs_deep_fetch(cache["tracks"][track_id])
+    ]
+    selected = pending[:limit] if limit is not None else pending
+
+    harvester = _Harvester(
+        cache,
+        TokenBucket(requests_per_second, burst=max(1, workers), clock=clock, sleep=sleep),
+        get=get,
+    )
+    updated = 0
+    for track_id, track in zip(selected, _map_work(harvester.fetch_track, selected, workers)):
+        if track:
+            cache["tracks"][track_id] = track
+            updated += 1
+            if journal is not None:
+                journal.append({"tracks": {track_id: track}})
+
+    if "summary" in cache:
+        cache["summary"]["tracks_pending_deep_fetch"] = _tracks_pending_deep_fetch(cache)
+    return updated
+
+
+def refresh_candidates(
+    cache: dict[str, Any],
+    kind: str,
+    *,
+    budget: int,
+    ttl_seconds: float | None = None,
+    now: datetime | None = None,
+) -> list[str]:
+    """
+    Up to `budget` ids of `kind`, stalest first.
+
+    With `ttl_seconds`, only entries fetched longer ago than the TTL are
+    eligible. Entries with no readable fetched_at count as the stalest.
+    """
+    now = now or datetime.now()
+    aged = []
+    for entity_id, record in cache.get(kind, {}).items():
+        fetched_at = _parse_iso(record.get("fetched_at")) if isinstance(record, dict) else None
+        if ttl_seconds is not None and fetched_at is not None:
+            if (now - fetched_at).total_seconds() <= ttl_seconds:
+                continue
+        aged.append((fetched_at or datetime.min, _id_sort_key(entity_id), entity_id))
+    return [entity_id for _, _, entity_id in sorted(aged)[: max(0, budget)]]
+
+
+def record_diff(old: dict[str, Any], new: dict[str, Any], prefix: str = "") -> dict[str, dict[str, Any]]:
+    """
+    Field-level changes between two cached records, keyed by dotted path.
+
+    Nested dicts (covers, explicit, artist) are compared per field; lists are
+    compared whole. Bookkeeping fields such as fetched_at are ignored.
+    """
+    changes: dict[str, dict[str, Any]] = {}
+    for key in sorted(set(old) | set(new)):
+        if not prefix and key in REFRESH_IGNORED_FIELDS:
+            continue
+        before, after = old.get(key), new.get(key)
+        if isinstance(before, dict) and isinstance(after, dict):
+            changes.update(record_diff(before, after, f"{prefix}{key}."))
+        elif before != after:
+            changes[f"{prefix}{key}"] = {"old": before, "new": after}
+    return changes
+
+
+def refresh_metadata(
+    cache: dict[str, Any],
+    *,
+    budgets: dict[str, int],
+    ttl_days: dict[str, float | None] | None = None,
+    workers: int = 1,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    now: datetime | None = None,
+    journal: MetadataJournal | None = None,
+    get: Callable[..., Any] = deezer_get,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> dict[str, Any]:
+    """
+    Re-fetch the stalest cached albums, artists and tracks.
+
+    `budgets` caps the entries refreshed per kind in this run; `ttl_days`
+    restricts each kind to entries older than its TTL (None: stalest first
+    regardless of age). Refreshes bypass the response cache so they see
+    Deezer's current payload. A failed refresh keeps the cached record.
+
+    Returns a refresh log: per-kind refreshed/changed/failed counts and the
+    field-level diffs of every changed entry.
+    """
+    now = now or datetime.now()
+    ttl_days = DEFAULT_REFRESH_TTL_DAYS if ttl_days is None else ttl_days
+    bucket = TokenBucket(requests_per_second, burst=max(1, workers), clock=clock, sleep=sleep)
+
+    def throttled_get(*args: Any, **kwargs: Any) -> Any:
+        bucket.acquire()
+        return get(*args, **kwargs)
+
+    log: dict[str, Any] = {"refreshed_at": now.isoformat(timespec="seconds"), "kinds": {}, "changes": []}
+    for kind in REFRESH_KINDS:
+        budget = budgets.get(kind, 0)
+        if budget <= 0:
+            continue
+        ttl = ttl_days.get(kind)
+        selected = refresh_candidates(
+            cache,
+            kind,
+            budget=budget,
+            ttl_seconds=ttl * 24 * 60 * 60 if ttl is not None else None,
+            now=now,
+        )
+        fetch_one = _refresh_fetcher(kind, throttled_get)
+        counts = {"selected": len(selected), "refreshed": 0, "changed": 0, "failed": 0}
+        for entity_id, record in zip(selected, _map_work(fetch_one, selected, workers)):
+            if record is None:
+                counts["failed"] += 1
+                continue
+            counts["refreshed"] += 1
+            changes = record_diff(cache[kind][entity_id], record)
+            if changes:
+                counts["changed"] += 1
+                log["changes"].append({"kind": kind, "id": entity_id, "fields": changes})
+            cache[kind][entity_id] = record
+            if journal is not None:
+                entry = {"album_id": entity_id, "album": record} if kind == "albums" else {kind: {entity_id: record}}
+                journal.append(entry)
+        log["kinds"][kind] = counts
+
+    if "summary" in cache:
+        cache["summary"]["tracks_pending_deep_fetch"] = _tracks_pending_deep_fetch(cache)
+    return log
+
+
+def _refresh_fetcher(kind: str, get: Callable[..., Any]) -> Callable[[str], dict[str, Any] | None]:
+    fetcher, parser, endpoint = {
+        "albums": (fetch_deezer_album, parse_album_payload, "album"),
+        "artists": (fetch_deezer_artist, parse_artist_payload, "artist"),
+        "tracks": (fetch_deezer_track, parse_track_payload, "track"),
+    }[kind]
+
+    def fetch_one(entity_id: str) -> dict[str, Any] | None:
+        cached = response_cache()
+        if cached is not None:
+            # Drop the stored payload so read_through fetches (and re-stores) a fresh one.
+            cached.invalidate(f"{endpoint}/{entity_id}")
+        payload = fetcher(entity_id, get=get)
+        return parser(payload) if payload else None
+
+    return fetch_one
+
+
+def _map_work(func: Callable[[str], Any], items: list[str], workers: int) -> Iterator[Any]:
+    return bounded_map(func, items, workers=workers, thread_name_prefix="metadata-harvest")
+
+
+def error_ledger_entry(
+    previous: dict[str, Any] | None,
+    error: MetadataFetchError,
+    failed_at: str,
+) -> dict[str, Any]:
+    """
+    Next ledger entry for an album after another failed attempt.
+
+    The retry window doubles with every attempt from a per-kind base, capped
+    at MAX_RETRY_BACKOFF_SECONDS.
+    """
+    previous = previous or {}
+    attempts = int(previous.get("attempts") or (1 if previous else 0)) + 1
+    backoff = min(RETRY_BACKOFF_SECONDS[error.kind] * 2 ** (attempts - 1), MAX_RETRY_BACKOFF_SECONDS)
+    next_retry = datetime.fromisoformat(failed_at) + timedelta(seconds=backoff)
+    return {
+        "type": "album_fetch_failed",
+        "kind": error.kind,
+        "status": error.status,
+        "message": error.message,
+        "attempts": attempts,
+        "first_failed_at": previous.get("first_failed_at") or previous.get("fetched_at") or failed_at,
+        "fetched_at": failed_at,
+        "next_retry_at": next_retry.isoformat(timespec="seconds"),
+    }
+
+
+def retry_eligible_errors(
+    cache: dict[str, Any],
+    album_ids: list[str],
+    *,
+    now: datetime | None = None,
+) -> list[str]:
+    """
+    Failed album ids, in id order, whose retry window has passed.
+
+    Entries from older caches carry no retry window and are always eligible.
+    """
+    now = now or datetime.now()
+    eligible = []
+    for album_id in album_ids:
+        entry = cache["errors"].get(album_id)
+        if entry is None or album_id in cache["albums"]:
             continue
+        next_retry = _parse_iso(entry.get("next_retry_at")) if isinstance(entry, dict) else None
+        if next_retry is None or next_retry <= now:
+            eligible.append(album_id)
+    return eligible
+
+
+def _parse_iso(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _progress_info(album_id: str, done: int, total: int, failed: int, elapsed: float) -> dict[str, Any]:
+    rate = done / elapsed if elapsed > 0 else 0.0
+    return {
+        "album_id": album_id,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 1),
+        "albums_per_second": round(rate, 3),
+        "eta_seconds": round((total - done) / rate, 1) if rate > 0 else None,
+    }
+
+
+class _Harvester:
+    """
+    Fetches one album plus its uncached artists and tracks.
+
+    Artist and track ids are claimed under a lock before fetching, so
+    concurrent albums that share contributors or tracks request them once.
+    A fetch that fails releases its claim, so a later album in the same
+    run can retry the id.
+    """
+
+    def __init__(
+        self,
+        cache: dict[str, Any],
+        bucket: TokenBucket,
+        *,
+        get: Callable[..., Any],
+        hydration: str = "full",
+    ) -> None:
+        self.bucket = bucket
+        self.get = get
+        self.hydration = hydration
+        self._lock = threading.Lock()
+        self._claimed_artists = set(cache["artists"])
+        self._claimed_tracks = set(cache["tracks"])
+        self._previous_errors = dict(cache["errors"])
+        self._fetched_at = cache["generated_at"]
+
+    def _claim(self, claimed: set[str], item_id: str) -> bool:
+        with self._lock:
+            if item_id in claimed:
+                return False
+            claimed.add(item_id)
+            return True
+
+    def _fetch_claimed(
+        self,
+        claimed: set[str],
+        item_id: str,
+        fetch: Callable[[str], dict[str, Any] | None],
+    ) -> dict[str, Any] | None:
+        """
+        fetch(item_id) if this harvester claims the id first; None if it
+        was already claimed. The claim is released when the fetch fails.
+        """
+        if not self._claim(claimed, item_id):
+            return None
+        try:
+            value = fetch(item_id)
+        except BaseException:
+            with self._lock:
+                claimed.discard(item_id)
+            raise
+        if value is None:
+            with self._lock:
+                claimed.discard(item_id)
+        return value
+
+    def _throttled_get(self, *args: Any, **kwargs: Any) -> Any:
+        self.bucket.acquire()
+        return self.get(*args, **kwargs)
+
+    def _fetch(
+        self,
+        fetcher: Callable[..., dict[str, Any] | None],
+        item_id: str,
+        **options: Any,
+    ) -> dict[str, Any] | None:
+        # Throttle only real requests; payloads served by the response cache are free.
+        return fetcher(item_id, get=self._throttled_get, **options)
+
+    def harvest_album(self, album_id: str) -> dict[str, Any]:
+        result: dict[str, Any] = {"album_id": album_id, "album": None, "artists": {}, "tracks": {}, "error": None}
+        try:
+            payload = self._fetch(fetch_deezer_album, album_id, strict=True)
+        except MetadataFetchError as exc:
+            result["error"] = error_ledger_entry(self._previous_errors.get(album_id), exc, self._fetched_at)
+            return result
 
         album = parse_album_payload(payload)
-        cache["albums"][album_id] = album
+        result["album"] = album
 
         artist_ids = {
             str(item.get("deezer_artist_id"))
@@ -192,25 +763,42 @@ def build_metadata_cache(
             if isinstance(item, dict) and item.get("deezer_artist_id")
         }
         for artist_id in sorted(artist_ids):
-            if artist_id in cache["artists"]:
-                continue
-            artist_payload = fetch_deezer_artist(artist_id, get=get)
+            artist_payload = self._fetch_claimed(
+                self._claimed_artists,
+                artist_id,
+                lambda item_id: self._fetch(fetch_deezer_artist, item_id),
+            )
             if artist_payload:
-                cache["artists"][artist_id] = parse_artist_payload(artist_payload)
-            sleep(REQUEST_DELAY)
+                result["artists"][artist_id] = parse_artist_payload(artist_payload)
+
+        if self.hydration == "album":
+            for item in album_tracklist(payload):
+                track_id = str(item["id"])
+                if self._claim(self._claimed_tracks, track_id):
+                    result["tracks"][track_id] = parse_track_payload(item, hydration="album")
+            return result
 
         for track_id in album.get("track_ids", []):
-            if track_id in cache["tracks"]:
-                continue
-            track_payload = fetch_deezer_track(track_id, get=get)
-            if track_payload:
-                cache["tracks"][track_id] = parse_track_payload(track_payload)
-            sleep(REQUEST_DELAY)
+            track = self._fetch_claimed(self._claimed_tracks, track_id, self.fetch_track)
+            if track:
+                result["tracks"][track_id] = track
 
-        sleep(REQUEST_DELAY)
+        return result
+
+    def fetch_track(self, track_id: str) -> dict[str, Any] | None:
+        payload = self._fetch(fetch_deezer_track, track_id)
+        return parse_track_payload(payload) if payload else None
 
-    cache["summary"] = metadata_coverage(cache, len(ids))
-    return cache
+
+def _merge_harvest(cache: dict[str, Any], result: dict[str, Any]) -> None:
+    if result.get("error"):
+        cache["errors"][result["album_id"]] = result["error"]
+        return
+    if result.get("album"):
+        cache["albums"][result["album_id"]] = result["album"]
+        cache["errors"].pop(result["album_id"], None)
+    cache["artists"].update(result.get("artists", {}))
+    cache["tracks"].update(result.get("tracks", {}))
 
 
 def metadata_coverage(cache: dict[str, Any], total_albums: int) -> dict[str, Any]:
@@ -221,10 +809,24 @@ def metadata_coverage(cache: dict[str, Any], total_albums: int) -> dict[str, Any
         "albums_missing_metadata": max(total_albums - albums_cached, 0),
         "artists_cached": len(cache.get("artists", {})),
         "tracks_cached": len(cache.get("tracks", {})),
+        "tracks_pending_deep_fetch": _tracks_pending_deep_fetch(cache),
+        "fetch_errors_by_kind": _fetch_errors_by_kind(cache),
         "coverage_percent": _pct_float(albums_cached, total_albums),
     }
 
 
+def _fetch_errors_by_kind(cache: dict[str, Any]) -> dict[str, int]:
+    counts = Counter(
+        entry.get("kind", "unclassified") if isinstance(entry, dict) else "unclassified"
+        for entry in cache.get("errors", {}).values()
+    )
+    return {kind: counts[kind] for kind in (*ERROR_KINDS, "unclassified") if counts[kind]}
+
+
+def _tracks_pending_deep_fetch(cache: dict[str, Any]) -> int:
+    return sum(1 for track in cache.get("tracks", {}).values() if track_needs_deep_fetch(track))
+
+
 def metadata_quality(cache: dict[str, Any]) -> dict[str, int]:
     albums = list(cache.get("albums", {}).values())
     tracks = list(cache.get("tracks", {}).values())
@@ -271,9 +873,10 @@ def write_metadata_cache(cache: dict[str, Any], path: Path) -> None:
 
 def write_metadata_reports(cache: dict[str, Any], reports_dir: Path) -> None:
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(reports_dir / "metadata_coverage_report.md", render_coverage_report(cache))
-    atomic_write_text(reports_dir / "metadata_quality_report.md", render_quality_report(cache))
-    atomic_write_text(reports_dir / "metadata_collection_report.md", render_collection_report(cache))
+    with atomic_batch():
+        atomic_write_text(reports_dir / "metadata_coverage_report.md", render_coverage_report(cache))
+        atomic_write_text(reports_dir / "metadata_quality_report.md", render_quality_report(cache))
+        atomic_write_text(reports_dir / "metadata_collection_report.md", render_collection_report(cache))
 
 
 def render_coverage_report(cache: dict[str, Any]) -> str:
@@ -290,9 +893,42 @@ def render_coverage_report(cache: dict[str, Any]) -> str:
         f"| Albums missing metadata | {summary['albums_missing_metadata']} |",
         f"| Artists cached | {summary['artists_cached']} |",
         f"| Tracks cached | {summary['tracks_cached']} |",
+        f"| Tracks pending deep fetch | {summary.get('tracks_pending_deep_fetch', 0)} |",
         f"| Coverage percentage | {summary['coverage_percent']:.1%} |",
         "",
     ]
+    errors_by_kind = summary.get("fetch_errors_by_kind", {})
+    if errors_by_kind:
+        lines.extend(["## Fetch Errors", "", "| Kind | Albums |", "| --- | ---: |"])
+        for kind, count in errors_by_kind.items():
+            lines.append(f"| {kind} | {count} |")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_refresh_report(log: dict[str, Any]) -> str:
+    lines = [
+        "# Metadata Refresh Report",
+        "",
+        f"Refreshed: {log.get('refreshed_at', 'unknown')}",
+        "",
+        "| Kind | Selected | Refreshed | Changed | Failed |",
+        "| --- | ---: | ---: | ---: | ---: |",
+    ]
+    for kind, counts in log.get("kinds", {}).items():
+        lines.append(
+            f"| {kind} | {counts['selected']} | {counts['refreshed']} | {counts['changed']} | {counts['failed']} |"
+        )
+    lines.append("")
+    if log.get("changes"):
+        lines.extend(["## Changes", "", "| Kind | ID | Field | Old | New |", "| --- | --- | --- | --- | --- |"])
+        for change in log["changes"]:
+            for field, values in change["fields"].items():
+                lines.append(
+                    f"| {change['kind']} | {change['id']} | {field} | "
+                    f"{_escape(values['old'])} | {_escape(values['new'])} |"
+                )
+        lines.append("")
     return "\n".join(lines)
 
 
@@ -368,26 +1004,177 @@ def _escape(value: Any) -> str:
     return str(value or "").replace("|", "\\|").replace("\n", " ").strip()
 
 
+def _print_progress(done: int, total: int, info: dict[str, Any]) -> None:
+    if done != total and done % 10:
+        return
+    eta = info["eta_seconds"]
+    eta_text = f"{int(eta // 60)}m{int(eta % 60):02d}s" if eta is not None else "unknown"
+    print(
+        f"  {done}/{total} albums, {info['failed']} failed, "
+        f"{info['albums_per_second']:.2f} albums/s, ETA {eta_text}",
+        file=sys.stderr,
+    )
+
+
+def _parse_kind_options(
+    parser: argparse.ArgumentParser,
+    values: list[str],
+    convert: Callable[[str], T],
+) -> dict[str, T]:
+    """
+    KIND=NUMBER options, each converted with `convert`; anything that is
+    not a known kind and a non-negative number is reported by parser.error.
+    """
+    options = {}
+    for value in values:
+        kind, _, amount = value.partition("=")
+        try:
+            number = convert(amount)
+        except ValueError:
+            number = None
+        if kind not in REFRESH_KINDS or number is None or not number >= 0:
+            parser.error(
+                f"expected KIND=NUMBER with KIND in {', '.join(REFRESH_KINDS)} "
+                f"and NUMBER a non-negative {convert.__name__}: {value}"
+            )
+        options[kind] = number
+    return options
+
+
 def main(argv: list[str] | None = None) -> None:
+    from curator.metadata_store import open_metadata_store
+
     parser = argparse.ArgumentParser(description="Build derived Deezer metadata cache.")
     parser.add_argument("--limit", type=int, default=None, help="maximum missing albums to fetch")
+    parser.add_argument("--workers", type=int, default=1, help="albums harvested concurrently")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help="ceiling on total Deezer requests per second across all workers",
+    )
+    parser.add_argument(
+        "--hydration",
+        choices=HYDRATION_MODES,
+        default="full",
+        help="'album' builds tracks from album tracklists instead of one request per track",
+    )
+    parser.add_argument(
+        "--deep-tracks",
+        type=int,
+        default=0,
+        help="maximum shallow tracks to complete from the track endpoint after the build",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=DEFAULT_CHECKPOINT_ALBUMS,
+        help="fsync the resume journal after this many albums",
+    )
+    parser.add_argument(
+        "--checkpoint-seconds",
+        type=float,
+        default=DEFAULT_CHECKPOINT_SECONDS,
+        help="fsync the resume journal at least this often",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("json", "sharded"),
+        default=None,
+        help="storage backend; defaults to sharded when data/metadata_cache/ exists, else json",
+    )
+    parser.add_argument(
+        "--export-json",
+        action="store_true",
+        help="with the sharded backend, also write data/metadata_cache.json",
+    )
+    parser.add_argument(
+        "--no-retry",
+        action="store_true",
+        help="do not retry failed albums whose backoff window has passed",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="append",
+        default=[],
+        metavar="KIND=N",
+        help="re-fetch up to N stale albums, artists or tracks after the build; repeatable",
+    )
+    parser.add_argument(
+        "--refresh-ttl",
+        action="append",
+        default=[],
+        metavar="KIND=DAYS",
+        help="only refresh entries older than DAYS (0: stalest first regardless of age); repeatable",
+    )
     args = parser.parse_args(argv)
+    refresh_budgets = _parse_kind_options(parser, args.refresh, int)
+    refresh_ttl_days: dict[str, float | None] = dict(DEFAULT_REFRESH_TTL_DAYS)
+    for kind, value in _parse_kind_options(parser, args.refresh_ttl, float).items():
+        refresh_ttl_days[kind] = value or None
 
     root = Path(__file__).resolve().parents[1]
     data_dir = root / "data"
     cache_path = data_dir / "metadata_cache.json"
-    cache = build_metadata_cache(
-        load_json_file(data_dir / "lifecycle_registry.json"),
-        load_json_file(data_dir / "identity_registry.json"),
-        existing_cache=load_cache(cache_path),
-        limit=args.limit,
-    )
-    write_metadata_cache(cache, cache_path)
+    store = open_metadata_store(data_dir, args.backend)
+    configure_default_client(pool_maxsize=max(args.workers, DEFAULT_POOL_MAXSIZE))
+    configure_response_cache(data_dir / RESPONSE_CACHE_DIRNAME)
+    journal_path = journal_path_for(cache_path)
+    # First sharded run: seed the shards from the legacy JSON document.
+    existing = store.load() if store.exists() else load_cache(cache_path)
+    replayed = replay_journal(existing, journal_path)
+    if replayed:
+        print(f"Resumed {replayed} journaled result(s) from an interrupted build.")
+
+    with MetadataJournal(
+        journal_path,
+        every_albums=args.checkpoint_every,
+        every_seconds=args.checkpoint_seconds,
+    ) as journal:
+        cache = build_metadata_cache(
+            load_json_file(data_dir / "lifecycle_registry.json"),
+            load_json_file(data_dir / "identity_registry.json"),
+            existing_cache=existing,
+            limit=args.limit,
+            workers=args.workers,
+            requests_per_second=args.rate,
+            hydration=args.hydration,
+            retry_errors=not args.no_retry,
+            journal=journal,
+            progress=_print_progress,
+        )
+        if args.deep_tracks:
+            deepen_tracks(
+                cache,
+                limit=args.deep_tracks,
+                workers=args.workers,
+                requests_per_second=args.rate,
+                journal=journal,
+            )
+        refresh_log = None
+        if refresh_budgets:
+            refresh_log = refresh_metadata(
+                cache,
+                budgets=refresh_budgets,
+                ttl_days=refresh_ttl_days,
+                workers=args.workers,
+                requests_per_second=args.rate,
+                journal=journal,
+            )
+    store.save(cache)
+    if args.export_json and store.backend == "sharded":
+        write_metadata_cache(cache, cache_path)
+    journal_path.unlink(missing_ok=True)
     write_metadata_reports(cache, root / "reports")
+    if refresh_log is not None:
+        atomic_write_text(root / "reports" / "metadata_refresh_report.md", render_refresh_report(refresh_log))
+        refreshed = sum(counts["refreshed"] for counts in refresh_log["kinds"].values())
+        changed = sum(counts["changed"] for counts in refresh_log["kinds"].values())
+        print(f"Refreshed {refreshed} cached entries; {changed} changed.")
 
     summary = cache["summary"]
     print(
-        "Wrote metadata cache; "
+        f"Wrote metadata cache ({store.backend}); "
         f"albums: {summary['albums_with_metadata']}/{summary['total_lifecycle_albums']}, "
         f"artists: {summary['artists_cached']}, tracks: {summary['tracks_cached']}."
     )
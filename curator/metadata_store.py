@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.lifecycle import load_json_file
+from curator.metadata_cache import empty_cache, load_cache, write_metadata_cache
+
+ENTITY_KINDS = ("albums", "artists", "tracks", "errors")
+SHARDED_DIRNAME = "metadata_cache"
+JSON_FILENAME = "metadata_cache.json"
+MANIFEST_FILENAME = "manifest.json"
+
+
+def shard_name(entity_id: str) -> str:
+    return hashlib.sha1(str(entity_id).encode("utf-8")).hexdigest()[:2]
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+
+
+class JsonMetadataStore:
+    """
+    The original single-document backend: `data/metadata_cache.json`.
+
+    Lookups parse the whole document once and reuse it until the file's
+    stat signature changes; kept for compatibility and as the export format
+    of the sharded backend.
+    """
+
+    backend = "json"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._document: tuple[tuple[int, int, int] | None, dict[str, Any]] | None = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> dict[str, Any]:
+        return load_cache(self.path)
+
+    def _records(self, kind: str) -> dict[str, Any]:
+        signature = _stat_signature(self.path)
+        if self._document is None or self._document[0] != signature:
+            self._document = (signature, self.load())
+        return self._document[1][kind]
+
+    def get(self, kind: str, entity_id: str) -> dict[str, Any] | None:
+        return self._records(kind).get(str(entity_id))
+
+    def get_many(self, kind: str, entity_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        records = self._records(kind)
+        return {str(item): records[str(item)] for item in entity_ids if str(item) in records}
+
+    def upsert(self, kind: str, records: dict[str, dict[str, Any]]) -> int:
+        cache = self.load()
+        if all(cache[kind].get(str(entity_id)) == record for entity_id, record in records.items()):
+            return 0
+        cache[kind].update({str(entity_id): record for entity_id, record in records.items()})
+        return self.save(cache)
+
+    def save(self, cache: dict[str, Any]) -> int:
+        write_metadata_cache(cache, self.path)
+        return 1
+
+
+class ShardedMetadataStore:
+    """
+    Per-entity shards under `data/metadata_cache/`.
+
+    Layout: `manifest.json` holds schema, generated_at, source and summary,
+    and `<kind>/<xx>.json` holds the records of one kind whose id hashes to
+    shard `xx` (256 shards per kind). A point lookup parses one small shard.
+    save() rewrites only shards whose content changed, so an incremental
+    build touches a handful of files instead of re-serializing everything.
+    """
+
+    backend = "sharded"
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._shard_text: dict[tuple[str, str], str] = {}
+
+    def exists(self) -> bool:
+        return (self.root / MANIFEST_FILENAME).exists()
+
+    def _shard_path(self, kind: str, shard: str) -> Path:
+        return self.root / kind / f"{shard}.json"
+
+    def _read_shard(self, kind: str, shard: str) -> dict[str, Any]:
+        path = self._shard_path(kind, shard)
+        try:
+            text = path.read_text(encoding="utf-8")
+            data = json.loads(text)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        self._shard_text[(kind, shard)] = text
+        return data
+
+    def _write_shard(self, kind: str, shard: str, records: dict[str, Any]) -> bool:
+        text = _dumps(records)
+        if self._shard_text.get((kind, shard)) == text:
+            return False
+        path = self._shard_path(kind, shard)
+        if (kind, shard) not in self._shard_text and path.exists():
+            if path.read_text(encoding="utf-8") == text:
+                self._shard_text[(kind, shard)] = text
+                return False
+        atomic_write_text(path, text)
+        self._shard_text[(kind, shard)] = text
+        return True
+
+    def load(self) -> dict[str, Any]:
+        cache = empty_cache()
+        manifest = self.manifest()
+        for key in ("schema", "generated_at", "source", "summary"):
+            if key in manifest:
+                cache[key] = manifest[key]
+        for kind in ENTITY_KINDS:
+            kind_dir = self.root / kind
+            if not kind_dir.is_dir():
+                continue
+            for path in sorted(kind_dir.glob("*.json")):
+                cache[kind].update(self._read_shard(kind, path.stem))
+        return cache
+
+    def manifest(self) -> dict[str, Any]:
+        try:
+            data = json.loads((self.root / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, kind: str, entity_id: str) -> dict[str, Any] | None:
+        return self._read_shard(kind, shard_name(entity_id)).get(str(entity_id))
+
+    def get_many(self, kind: str, entity_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        by_shard: dict[str, list[str]] = {}
+        for entity_id in entity_ids:
+            by_shard.setdefault(shard_name(entity_id), []).append(str(entity_id))
+        out: dict[str, dict[str, Any]] = {}
+        for shard, ids in sorted(by_shard.items()):
+            records = self._read_shard(kind, shard)
+            out.update({item: records[item] for item in ids if item in records})
+        return out
+
+    def upsert(self, kind: str, records: dict[str, dict[str, Any]]) -> int:
+        by_shard: dict[str, dict[str, Any]] = {}
+        for entity_id, record in records.items():
+            by_shard.setdefault(shard_name(entity_id), {})[str(entity_id)] = record
+        written = 0
+        for shard, updates in sorted(by_shard.items()):
+            merged = self._read_shard(kind, shard)
+            merged.update(updates)
+            written += self._write_shard(kind, shard, merged)
+        return written
+
+    def save(self, cache: dict[str, Any]) -> int:
+        """
+        Write every changed shard and then the manifest as one group commit,
+        so a crash cannot leave a manifest from a different save than its
+        shards.
+        """
+        written = 0
+        try:
+            with atomic_batch():
+                for kind in ENTITY_KINDS:
+                    by_shard: dict[str, dict[str, Any]] = {}
+                    for entity_id, record in cache.get(kind, {}).items():
+                        by_shard.setdefault(shard_name(entity_id), {})[str(entity_id)] = record
+                    kind_dir = self.root / kind
+                    existing = {path.stem for path in kind_dir.glob("*.json")} if kind_dir.is_dir() else set()
+                    for shard in sorted(existing | set(by_shard)):
+                        written += self._write_shard(kind, shard, by_shard.get(shard, {}))
+
+                manifest = {key: cache[key] for key in ("schema", "generated_at", "source", "summary") if key in cache}
+                manifest["backend"] = self.backend
+                atomic_write_text(self.root / MANIFEST_FILENAME, _dumps(manifest))
+        except BaseException:
+            # Staged shards were discarded, so the remembered texts are stale.
+            self._shard_text.clear()
+            raise
+        return written + 1
+
+    def export_json(self, path: Path) -> None:
+        """
+        Write the current single-document schema for older consumers.
+        """
+        write_metadata_cache(self.load(), path)
+
+
+def open_metadata_store(data_dir: Path, backend: str | None = None) -> JsonMetadataStore | ShardedMetadataStore:
+    """
+    Return the store for `data_dir`; without `backend`, a sharded store wins
+    when its manifest exists, otherwise the JSON document is used.
+    """
+    sharded = ShardedMetadataStore(data_dir / SHARDED_DIRNAME)
+    if backend == "sharded" or (backend is None and sharded.exists()):
+        return sharded
+    if backend not in (None, "json"):
+        raise ValueError(f"unknown metadata store backend: {backend}")
+    return JsonMetadataStore(data_dir / JSON_FILENAME)
+
+
+def load_metadata_cache(data_dir: Path) -> dict[str, Any]:
+    store = open_metadata_store(data_dir)
+    if isinstance(store, JsonMetadataStore):
+        return load_json_file(store.path)
+    return store.load() if store.exists() else {}
+
+
+def load_metadata_subset(data_dir: Path, album_ids: Iterable[str]) -> dict[str, Any]:
+    """
+    Cache-shaped dict holding only the given albums and their tracks and
+    artists; with the sharded backend this reads a few shards instead of
+    the whole cache.
+    """
+    store = open_metadata_store(data_dir)
+    if not store.exists():
+        return {}
+    albums = store.get_many("albums", [str(item) for item in album_ids if item])
+    track_ids = [track_id for album in albums.values() for track_id in album.get("track_ids", [])]
+    artist_ids = sorted(
+        {
+            str(item.get("deezer_artist_id"))
+            for album in albums.values()
+            for item in [album.get("artist"), *album.get("contributors", [])]
+            if isinstance(item, dict) and item.get("deezer_artist_id")
+        }
+    )
+    return {
+        "albums": albums,
+        "artists": store.get_many("artists", artist_ids),
+        "tracks": store.get_many("tracks", track_ids),
+        "errors": {},
+    }
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any
+
+from curator.lifecycle_states import STATE_KEYS, STATE_ORDER
+
+# Named album groups: (name, state that must be present, state that must be missing).
+GAP_GROUPS = (
+    ("discovered_not_attempted", "discovered", "attempted"),
+    ("shipped_not_validated", "shipped", "validated"),
+    ("attempted_not_shipped", "attempted", "shipped"),
+    ("confirmed_not_validated", "confirmed", "validated"),
+    ("validated_not_discovered", "validated", "discovered"),
+    ("shipped_not_attempted", "shipped", "attempted"),
+    ("validated_not_shipped", "validated", "shipped"),
+)
+AGE_BUCKETS = ("missing_timestamp", "last_30_days", "31_90_days", "91_365_days", "over_365_days")
+
+
+def aggregate_registry(registry: dict[str, Any], *, now: datetime | None = None) -> dict[str, Any]:
+    """
+    Every counter, grouping and gap list the lifecycle, validation and
+    archive intelligence reports need, from one pass over the albums.
+
+    Writers compute this once and hand it to each renderer, so adding a
+    report does not add another pass over the registry. Groups keep
+    registry order; renderers sort them as each report requires.
+    """
+    now = now or datetime.now()
+    highest_counts: Counter[str] = Counter()
+    evidence_counts: Counter[str] = Counter()
+    confidence_counts: Counter[str] = Counter()
+    gaps: dict[str, list[dict[str, Any]]] = {name: [] for name, _, _ in GAP_GROUPS}
+    groups: dict[str, list[dict[str, Any]]] = {"validated": [], "with_validation_evidence": [], "with_validation_log": []}
+    artists: dict[str, dict[str, Any]] = defaultdict(
+        lambda: {"artist": "", "discovered": 0, "validated": 0, "confirmed": 0, "backlog": 0}
+    )
+    age_buckets = dict.fromkeys(AGE_BUCKETS, 0)
+    total = 0
+
+    for row in registry.get("albums", []):
+        total += 1
+        states = row.get("states", {})
+        flags = {key: bool(states.get(key, False)) for key in STATE_KEYS.values()}
+        evidence = row.get("validation_evidence", {})
+
+        highest_counts[row.get("highest_state") or "UNKNOWN"] += 1
+        for state, key in STATE_KEYS.items():
+            if flags[key]:
+                evidence_counts[state] += 1
+        confidence_counts[evidence.get("confidence", "none")] += 1
+
+        for name, present, missing in GAP_GROUPS:
+            if flags[present] and not flags[missing]:
+                gaps[name].append(row)
+
+        if evidence.get("available"):
+            groups["with_validation_evidence"].append(row)
+        if "validation_log" in evidence.get("available_evidence", []):
+            groups["with_validation_log"].append(row)
+
+        if flags["discovered"]:
+            artist = row.get("artist") or "(unknown)"
+            item = artists[artist]
+            item["artist"] = artist
+            item["discovered"] += 1
+            item["validated"] += flags["validated"]
+            item["confirmed"] += flags["confirmed"]
+            item["backlog"] += not flags["attempted"]
+
+        if flags["validated"]:
+            groups["validated"].append(row)
+            age_buckets[_age_bucket(evidence.get("validated_at"), now)] += 1
+
+    return {
+        "total_albums": total,
+        "highest_state_counts": {state: highest_counts.get(state, 0) for state in STATE_ORDER},
+        "state_evidence_counts": {state: evidence_counts.get(state, 0) for state in STATE_ORDER},
+        "validation_confidence_counts": dict(confidence_counts),
+        "gaps": gaps,
+        "groups": groups,
+        "artist_coverage": list(artists.values()),
+        "validation_age_buckets": age_buckets,
+    }
+
+
+def _parse_dt(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _age_bucket(value: Any, now: datetime) -> str:
+    dt = _parse_dt(value)
+    if not dt:
+        return "missing_timestamp"
+    age_days = (now.replace(tzinfo=None) - dt.replace(tzinfo=None)).days
+    if age_days <= 30:
+        return "last_30_days"
+    if age_days <= 90:
+        return "31_90_days"
+    if age_days <= 365:
+        return "91_365_days"
+    return "over_365_days"
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+RESPONSE_CACHE_DIRNAME = "deezer_response_cache"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def response_key(endpoint: str) -> str:
+    normalized = endpoint.strip().strip("/")
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent Deezer payload cache keyed by endpoint, e.g. `album/302127`.
+
+    Entries live at `<root>/<key[:2]>/<key>.json`, where the key is the
+    SHA-256 of the normalized endpoint. Entries older than `ttl_seconds` read
+    as misses. File mtimes record last use, so when the cache grows past
+    `max_bytes` the least recently used entries are evicted, and that
+    ordering survives across processes.
+
+    Entries are disposable: they are replaced without fsync, and an
+    unreadable entry is simply a miss.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, endpoint: str) -> Path:
+        key = response_key(endpoint)
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, endpoint: str) -> dict[str, Any] | None:
+        path = self.path_for(endpoint)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        stored_at = entry.get("stored_at") if isinstance(entry, dict) else None
+        payload = entry.get("payload") if isinstance(entry, dict) else None
+        expired = (
+            self.ttl_seconds is not None
+            and isinstance(stored_at, (int, float))
+            and self._clock() - stored_at > self.ttl_seconds
+        )
+        if not isinstance(payload, dict) or expired:
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+            index = self._load_index()
+            if path.name in index:
+                index.move_to_end(path.name)
+        return payload
+
+    def put(self, endpoint: str, payload: dict[str, Any]) -> None:
+        path = self.path_for(endpoint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(
+            {"endpoint": endpoint.strip().strip("/"), "stored_at": self._clock(), "payload": payload},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            tmp.write(text)
+        os.replace(tmp.name, path)
+
+        size = path.stat().st_size
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes -= index.pop(path.name, 0)
+            index[path.name] = size
+            self._total_bytes += size
+            victims = self._select_victims()
+        for victim in victims:
+            self._remove(victim)
+
+    def invalidate(self, endpoint: str) -> None:
+        self._remove(self.path_for(endpoint))
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total_bytes
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is not None:
+            return self._index
+
+        entries: list[tuple[float, str, int]] = []
+        if self.root.exists():
+            for shard in os.scandir(self.root):
+                if not shard.is_dir():
+                    continue
+                for item in os.scandir(shard.path):
+                    if not item.name.endswith(".json") or item.name.startswith("."):
+                        continue
+                    stat = item.stat()
+                    entries.append((stat.st_mtime, item.name, stat.st_size))
+
+        self._index = OrderedDict((name, size) for _, name, size in sorted(entries))
+        self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _select_victims(self) -> list[Path]:
+        victims = []
+        index = self._index or OrderedDict()
+        while self._total_bytes > self.max_bytes and len(index) > 1:
+            name, size = index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            victims.append(self.root / name[:2] / name)
+        return victims
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            if self._index is not None and path.name in self._index:
+                self._total_bytes -= self._index.pop(path.name)
+
+
+_response_cache: ResponseCache | None = None
+
+
+def configure_response_cache(root: Path | None, **options: Any) -> ResponseCache | None:
+    """
+    Enable the process-wide cache at `root`, or disable it with None.
+
+    Disabled is the default so library callers and tests always hit the
+    injected fetchers; the CLI and GUI entry points opt in.
+    """
+    global _response_cache
+    _response_cache = ResponseCache(root, **options) if root is not None else None
+    return _response_cache
+
+
+def response_cache() -> ResponseCache | None:
+    return _response_cache
+
+
+def read_through(
+    endpoint: str,
+    fetch: Callable[[], dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """
+    Return the cached payload for `endpoint`, or fetch and store it.
+
+    Only successful payloads are cached: dicts without a Deezer `error` key.
+    """
+    cache = _response_cache
+    if cache is None:
+        return fetch()
+
+    payload = cache.get(endpoint)
+    if payload is not None:
+        return payload
+
+    payload = fetch()
+    if isinstance(payload, dict) and not payload.get("error"):
+        cache.put(endpoint, payload)
+    return payload
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Thread-safe request throttle shared by every worker that talks to one API.
+
+    Each acquire() reserves the next send slot and sleeps until it arrives, so
+    total throughput stays at or below `rate` requests per second while up to
+    `burst` requests may start back to back. Waiting is computed from the
+    clock once and never polled, which keeps injected no-op sleeps testable.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.interval = 1.0 / rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot: float | None = None
+        self.acquired = 0
+        self.waited = 0.0
+
+    def acquire(self) -> float:
+        with self._lock:
+            now = self._clock()
+            slot = now if self._next_slot is None else max(self._next_slot, now)
+            tolerance = (self.burst - 1) * self.interval
+            wait = max(0.0, slot - now - tolerance)
+            self._next_slot = slot + self.interval
+            self.acquired += 1
+            self.waited += wait
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from curator.atomic import atomic_write_text
+
+VALIDATION_LOG_INDEX_FILENAME = "validation_log_index.json"
+VALIDATION_LOG_INDEX_SCHEMA = 2
+
+
+def log_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ParsedLogCache:
+    """
+    Process-wide memo of parsed log records, keyed by path and the
+    (size, mtime_ns) signature they were parsed at.
+
+    Evidence collection fills it and the identity builder reads from it, so
+    one pipeline run reads and decodes each log once. A changed signature
+    reads as a miss.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[str, tuple[tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: str, signature: tuple[int, int]) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._records.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def store(self, key: str, signature: tuple[int, int], record: Any) -> None:
+        with self._lock:
+            self._records[key] = (signature, record)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+shared_log_cache = ParsedLogCache()
+
+
+class ValidationLogIndex:
+    """
+    On-disk index of discovered and parsed `STIGMA_VALIDATED.txt` logs.
+
+    Parsed records are keyed by (log path, size, mtime_ns): a log is only
+    re-parsed when its stat changes. Directory listings are keyed by the
+    directory's mtime_ns, so an unchanged directory is not re-listed; it
+    still gets a stat, and its subdirectories are still visited, because a
+    directory's mtime only reflects its direct entries.
+
+    Logs and directories under a walked root that were not seen again are
+    evicted on save(). With `path=None` the index lives for one process.
+    With `shared`, parsed records are also published to (and taken from)
+    that in-process ParsedLogCache.
+
+    discover() and parse_many() accept a thread count: walks fan out per
+    top-level directory and parses run concurrently, which hides the
+    per-call latency of network storage. Results are returned sorted or in
+    input order, so they do not depend on the worker count.
+    """
+
+    def __init__(self, path: Path | None = None, *, shared: ParsedLogCache | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.shared = shared
+        data = self._load()
+        self._logs: dict[str, dict[str, Any]] = data.get("logs", {})
+        self._dirs: dict[str, dict[str, Any]] = data.get("dirs", {})
+        self._seen_logs: set[str] = set()
+        self._seen_dirs: set[str] = set()
+        self._walked_roots: list[str] = []
+        self._lock = threading.Lock()
+        self.stats = {"parsed": 0, "reused": 0, "dirs_listed": 0, "dirs_reused": 0, "evicted": 0}
+
+    def _load(self) -> dict[str, Any]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(data, dict) or data.get("schema") != VALIDATION_LOG_INDEX_SCHEMA:
+            return {}
+        return data
+
+    def discover(self, roots: list[Path], log_filename: str, *, workers: int = 1) -> list[Path]:
+        """
+        Every `log_filename` file under `roots`, sorted, matching
+        Path.rglob(): symlinked directories are not followed.
+        """
+        logs: set[str] = set()
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="log-walk") if workers > 1 else None
+        try:
+            for root in roots:
+                if not root.exists():
+                    continue
+                if root.is_file() and root.name == log_filename:
+                    logs.add(str(root))
+                    continue
+                self._walked_roots.append(str(root))
+                logs.update(self._walk_root(str(root), log_filename, pool))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+        return sorted(Path(item) for item in logs)
+
+    def _walk_root(self, root: str, log_filename: str, pool: ThreadPoolExecutor | None) -> list[str]:
+        if pool is None:
+            return self._merge_walk(self._walk([root], log_filename))
+
+        # List the root itself, then walk each top-level subtree on the pool.
+        top = self._walk([root], log_filename, max_depth=0)
+        logs = self._merge_walk(top)
+        subtrees = [os.path.join(root, name) for name in top["subdirs"]]
+        for result in pool.map(lambda subtree: self._walk([subtree], log_filename), subtrees):
+            logs.extend(self._merge_walk(result))
+        return logs
+
+    def _walk(self, start: list[str], log_filename: str, max_depth: int | None = None) -> dict[str, Any]:
+        """
+        Walk from `start` without mutating the index; _merge_walk() applies
+        the result, so concurrent walks need no locking.
+        """
+        result: dict[str, Any] = {"logs": [], "dirs": {}, "subdirs": [], "stats": Counter()}
+        stack = [(directory, 0) for directory in start]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+            listing = self._dirs.get(directory)
+            if listing and listing.get("mtime_ns") == mtime_ns:
+                result["stats"]["dirs_reused"] += 1
+            else:
+                listing = self._list_directory(directory, log_filename, mtime_ns)
+                if listing is None:
+                    continue
+                result["stats"]["dirs_listed"] += 1
+
+            result["dirs"][directory] = listing
+            if listing["has_log"]:
+                result["logs"].append(os.path.join(directory, log_filename))
+            if max_depth is not None and depth >= max_depth:
+                result["subdirs"].extend(listing["subdirs"])
+                continue
+            stack.extend((os.path.join(directory, name), depth + 1) for name in reversed(listing["subdirs"]))
+        return result
+
+    def _merge_walk(self, result: dict[str, Any]) -> list[str]:
+        self._dirs.update(result["dirs"])
+        self._seen_dirs.update(result["dirs"])
+        for key, count in result["stats"].items():
+            self.stats[key] += count
+        return result["logs"]
+
+    @staticmethod
+    def _list_directory(directory: str, log_filename: str, mtime_ns: int) -> dict[str, Any] | None:
+        has_log = False
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == log_filename and entry.is_file():
+                        has_log = True
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+        except OSError:
+            return None
+        return {"mtime_ns": mtime_ns, "has_log": has_log, "subdirs": sorted(subdirs)}
+
+    def parse(self, path: Path, parser: Callable[[Path], Any]) -> Any:
+        """
+        The parsed record for `path`, re-running `parser` only when the
+        log's size or mtime changed since it was indexed.
+        """
+        key = str(path)
+        with self._lock:
+            self._seen_logs.add(key)
+        signature = log_signature(path)
+        if signature is None:
+            with self._lock:
+                self._logs.pop(key, None)
+            return parser(path)
+
+        if self.shared is not None:
+            found, record = self.shared.lookup(key, signature)
+            if found:
+                with self._lock:
+                    self._logs[key] = {"size": signature[0], "mtime_ns": signature[1], "parsed": record}
+                    self.stats["reused"] += 1
+                return record
+
+        cached = self._logs.get(key)
+        if cached and (cached.get("size"), cached.get("mtime_ns")) == signature:
+            with self._lock:
+                self.stats["reused"] += 1
+            record = cached.get("parsed")
+        else:
+            record = parser(path)
+            with self._lock:
+                self._logs[key] = {"size": signature[0], "mtime_ns": signature[1], "parsed": record}
+                self.stats["parsed"] += 1
+
+        if self.shared is not None:
+            self.shared.store(key, signature, record)
+        return record
+
+    def seed_shared_cache(self) -> int:
+        """
+        Publish every indexed record to the shared cache, e.g. before an
+        identity build in a process that did not collect evidence. Entries
+        are still checked against the log's current stat on lookup.
+        """
+        if self.shared is None:
+            return 0
+        for key, entry in self._logs.items():
+            self.shared.store(key, (entry.get("size"), entry.get("mtime_ns")), entry.get("parsed"))
+        return len(self._logs)
+
+    def parse_many(
+        self,
+        paths: list[Path],
+        parser: Callable[[Path], Any],
+        *,
+        workers: int = 1,
+    ) -> list[Any]:
+        """
+        parse() for every path, in input order.
+        """
+        if workers <= 1 or len(paths) <= 1:
+            return [self.parse(path, parser) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="log-parse") as pool:
+            return list(pool.map(lambda path: self.parse(path, parser), paths))
+
+    def evict_missing(self) -> int:
+        """
+        Drop logs and directories under walked roots that were not seen in
+        this run, plus any log that no longer exists.
+        """
+        evicted = 0
+        for key in list(self._logs):
+            if key in self._seen_logs:
+                continue
+            if _under_any(key, self._walked_roots) or not os.path.exists(key):
+                del self._logs[key]
+                evicted += 1
+        for key in list(self._dirs):
+            if key not in self._seen_dirs and (_under_any(key, self._walked_roots) or not os.path.isdir(key)):
+                del self._dirs[key]
+        self.stats["evicted"] += evicted
+        return evicted
+
+    def save(self) -> None:
+        self.evict_missing()
+        if self.path is None:
+            return
+        text = json.dumps(
+            {"schema": VALIDATION_LOG_INDEX_SCHEMA, "logs": self._logs, "dirs": self._dirs},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        atomic_write_text(self.path, text + "\n")
+
+
+def _under_any(path: str, roots: list[str]) -> bool:
+    return any(path == root or path.startswith(root.rstrip(os.sep) + os.sep) for root in roots)
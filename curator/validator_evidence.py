@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from curator.atomic import atomic_write_text
+from curator.atomic import atomic_batch, atomic_write_text
+from curator.report_aggregates import aggregate_registry
+from curator.validation_log_index import ValidationLogIndex, log_signature, shared_log_cache
 
 LOG_FILENAME = "STIGMA_VALIDATED.txt"
+DEFAULT_EVIDENCE_WORKERS = 8
 
 
 def default_evidence_roots() -> list[Path]:
@@ -30,17 +34,7 @@ def load_json_file(path: Path) -> dict[str, Any]:
 
 
 def discover_validation_logs(roots: list[Path]) -> list[Path]:
-    logs: set[Path] = set()
-    for root in roots:
-        if not root.exists():
-            continue
-        if root.is_file() and root.name == LOG_FILENAME:
-            logs.add(root)
-            continue
-        for path in root.rglob(LOG_FILENAME):
-            if path.is_file():
-                logs.add(path)
-    return sorted(logs)
+    return ValidationLogIndex().discover(roots, LOG_FILENAME)
 
 
 def evidence_from_validated_index(path: Path) -> dict[str, dict[str, Any]]:
@@ -68,6 +62,10 @@ def parse_validation_log(path: Path) -> dict[str, Any] | None:
     except Exception:
         return None
 
+    return _parsed_from_data(path, data)
+
+
+def _parsed_from_data(path: Path, data: Any) -> dict[str, Any] | None:
     if not isinstance(data, dict):
         return None
 
@@ -112,6 +110,46 @@ def parse_validation_log(path: Path) -> dict[str, Any] | None:
     }
 
 
+def manifest_hash_from_hashes(hashes: dict[str, Any]) -> str | None:
+    if not hashes:
+        return None
+    manifest = "\n".join(f"{name}\0{hashes[name]}" for name in sorted(hashes))
+    return hashlib.sha256(manifest.encode("utf-8")).hexdigest()
+
+
+def _manifest_hash_from_data(data: Any) -> str | None:
+    completeness = data.get("completeness", {}) if isinstance(data, dict) else {}
+    hashes = completeness.get("hashes", {}) if isinstance(completeness, dict) else {}
+    return manifest_hash_from_hashes(hashes) if isinstance(hashes, dict) else None
+
+
+def _read_log_record(path: Path) -> dict[str, Any]:
+    """
+    Everything later stages need from one log, from a single read:
+    the parse_validation_log() record and the file manifest hash.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {"parsed": None, "manifest_hash": None}
+    return {"parsed": _parsed_from_data(path, data), "manifest_hash": _manifest_hash_from_data(data)}
+
+
+def read_validation_log(path: Path) -> dict[str, Any]:
+    """
+    `{"parsed": ..., "manifest_hash": ...}` for a log, served from the
+    process-wide cache when the log is unchanged since it was last read.
+    """
+    signature = log_signature(path)
+    if signature is None:
+        return _read_log_record(path)
+    found, record = shared_log_cache.lookup(str(path), signature)
+    if not found:
+        record = _read_log_record(path)
+        shared_log_cache.store(str(path), signature, record)
+    return record
+
+
 def _merge_evidence(base: dict[str, Any], extra: dict[str, Any]) -> dict[str, Any]:
     merged = dict(base)
     for key, value in extra.items():
@@ -136,7 +174,23 @@ def _merge_evidence(base: dict[str, Any], extra: dict[str, Any]) -> dict[str, An
 def collect_validation_evidence(
     data_dir: Path,
     evidence_roots: list[Path] | None = None,
+    *,
+    index_path: Path | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
+    """
+    Validation evidence per album from validated_albums.json and every
+    STIGMA_VALIDATED.txt under the evidence roots.
+
+    With `index_path`, discovered directories and parsed logs are kept in a
+    ValidationLogIndex there, so unchanged logs are not re-parsed. Parsed
+    logs are also published to the process-wide cache that
+    read_validation_log() serves, so the identity build reuses them.
+
+    `workers` > 1 walks each top-level directory and parses logs on a thread
+    pool. Logs are still merged in sorted path order, so evidence_by_album
+    and unmatched_logs are the same as a single-threaded run.
+    """
     evidence_by_album = evidence_from_validated_index(data_dir / "validated_albums.json")
     folder_to_album = {
         item.get("folder"): album_id
@@ -145,11 +199,13 @@ def collect_validation_evidence(
     }
 
     roots = evidence_roots if evidence_roots is not None else default_evidence_roots()
-    logs = discover_validation_logs(roots)
+    index = ValidationLogIndex(index_path, shared=shared_log_cache)
+    logs = index.discover(roots, LOG_FILENAME, workers=workers)
+    records = index.parse_many(logs, _read_log_record, workers=workers)
     unmatched_logs: list[dict[str, Any]] = []
 
-    for path in logs:
-        parsed = parse_validation_log(path)
+    for path, record in zip(logs, records):
+        parsed = record["parsed"]
         if not parsed:
             unmatched_logs.append({"path": str(path), "reason": "unreadable"})
             continue
@@ -170,6 +226,8 @@ def collect_validation_evidence(
                 }
             )
 
+    index.save()
+
     confidence_counts = Counter(
         item.get("confidence", "unknown") for item in evidence_by_album.values()
     )
@@ -190,6 +248,7 @@ def collect_validation_evidence(
             "evidence_roots": [str(path) for path in roots],
         },
         "unmatched_logs": unmatched_logs,
+        "index_stats": dict(index.stats),
     }
 
 
@@ -224,50 +283,18 @@ def attach_validation_evidence(
     return registry
 
 
-def _parse_dt(value: Any) -> datetime | None:
-    if not isinstance(value, str) or not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-
-
 def validation_age_buckets(registry: dict[str, Any], *, now: datetime | None = None) -> dict[str, int]:
-    now = now or datetime.now()
-    buckets = {
-        "missing_timestamp": 0,
-        "last_30_days": 0,
-        "31_90_days": 0,
-        "91_365_days": 0,
-        "over_365_days": 0,
-    }
-    for row in registry.get("albums", []):
-        if not row.get("states", {}).get("validated", False):
-            continue
-        dt = _parse_dt(row.get("validation_evidence", {}).get("validated_at"))
-        if not dt:
-            buckets["missing_timestamp"] += 1
-            continue
-        age_days = (now.replace(tzinfo=None) - dt.replace(tzinfo=None)).days
-        if age_days <= 30:
-            buckets["last_30_days"] += 1
-        elif age_days <= 90:
-            buckets["31_90_days"] += 1
-        elif age_days <= 365:
-            buckets["91_365_days"] += 1
-        else:
-            buckets["over_365_days"] += 1
-    return buckets
+    return aggregate_registry(registry, now=now)["validation_age_buckets"]
 
 
-def render_validation_evidence_report(registry: dict[str, Any]) -> str:
+def render_validation_evidence_report(
+    registry: dict[str, Any],
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> str:
+    aggregates = aggregates or aggregate_registry(registry)
     summary = registry.get("validation_evidence_summary", {})
-    rows = [
-        row
-        for row in registry.get("albums", [])
-        if row.get("validation_evidence", {}).get("available")
-    ]
+    rows = aggregates["groups"]["with_validation_evidence"]
     lines = [
         "# Validation Evidence Report",
         "",
@@ -308,16 +335,16 @@ def render_validation_evidence_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def render_validation_coverage_report(registry: dict[str, Any]) -> str:
-    albums = registry.get("albums", [])
-    total = len(albums)
-    validated = [row for row in albums if row.get("states", {}).get("validated", False)]
-    with_evidence = [row for row in albums if row.get("validation_evidence", {}).get("available")]
-    with_logs = [
-        row
-        for row in albums
-        if "validation_log" in row.get("validation_evidence", {}).get("available_evidence", [])
-    ]
+def render_validation_coverage_report(
+    registry: dict[str, Any],
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> str:
+    aggregates = aggregates or aggregate_registry(registry)
+    total = aggregates["total_albums"]
+    validated = aggregates["groups"]["validated"]
+    with_evidence = aggregates["groups"]["with_validation_evidence"]
+    with_logs = aggregates["groups"]["with_validation_log"]
     lines = [
         "# Validation Coverage Report",
         "",
@@ -334,8 +361,20 @@ def render_validation_coverage_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def render_validation_age_report(registry: dict[str, Any], *, now: datetime | None = None) -> str:
-    buckets = validation_age_buckets(registry, now=now)
+def render_validation_age_report(
+    registry: dict[str, Any],
+    *,
+    now: datetime | None = None,
+    aggregates: dict[str, Any] | None = None,
+) -> str:
+    """
+    Ages are measured from `now`. Precomputed `aggregates` already carry
+    their buckets, so pass aggregate_registry(registry, now=...) instead of
+    both.
+    """
+    if aggregates is not None and now is not None:
+        raise ValueError("pass now to aggregate_registry() when giving aggregates")
+    buckets = (aggregates or aggregate_registry(registry, now=now))["validation_age_buckets"]
     lines = [
         "# Validation Age Report",
         "",
@@ -353,11 +392,12 @@ def render_validation_age_report(registry: dict[str, Any], *, now: datetime | No
     return "\n".join(lines)
 
 
-def render_validation_confidence_report(registry: dict[str, Any]) -> str:
-    counts = Counter(
-        row.get("validation_evidence", {}).get("confidence", "none")
-        for row in registry.get("albums", [])
-    )
+def render_validation_confidence_report(
+    registry: dict[str, Any],
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> str:
+    counts = (aggregates or aggregate_registry(registry))["validation_confidence_counts"]
     lines = [
         "# Validation Confidence Report",
         "",
@@ -386,12 +426,31 @@ def render_validation_confidence_report(registry: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def write_validation_reports(registry: dict[str, Any], reports_dir: Path) -> None:
+def write_validation_reports(
+    registry: dict[str, Any],
+    reports_dir: Path,
+    *,
+    aggregates: dict[str, Any] | None = None,
+) -> None:
+    aggregates = aggregates or aggregate_registry(registry)
     reports_dir.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(reports_dir / "validation_evidence_report.md", render_validation_evidence_report(registry))
-    atomic_write_text(reports_dir / "validation_coverage_report.md", render_validation_coverage_report(registry))
-    atomic_write_text(reports_dir / "validation_age_report.md", render_validation_age_report(registry))
-    atomic_write_text(reports_dir / "validation_confidence_report.md", render_validation_confidence_report(registry))
+    with atomic_batch():
+        atomic_write_text(
+            reports_dir / "validation_evidence_report.md",
+            render_validation_evidence_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(
+            reports_dir / "validation_coverage_report.md",
+            render_validation_coverage_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(
+            reports_dir / "validation_age_report.md",
+            render_validation_age_report(registry, aggregates=aggregates),
+        )
+        atomic_write_text(
+            reports_dir / "validation_confidence_report.md",
+            render_validation_confidence_report(registry, aggregates=aggregates),
+        )
 
 
 def _pct(count: int, total: int) -> str:
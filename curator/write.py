@@ -22,6 +22,35 @@ def has_expansion_block(text: str, artist_url: str) -> bool:
     return f"# source: {artist_url}" in text
 
 
+def expansion_files(output_dir: Path) -> dict[str, Path]:
+    """
+    Map each expanded Deezer artist URL to the artist file holding its
+    block. Every file is read once, so a refresh can look up any number
+    of artists; the first file in name order wins.
+    """
+    if not output_dir.exists():
+        return {}
+
+    files: dict[str, Path] = {}
+    for path in sorted(output_dir.glob("*.txt")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line.startswith("# source: "):
+                files.setdefault(line[len("# source: ") :].strip(), path)
+
+    return files
+
+
+def known_album_ids(text: str) -> set[str]:
+    """
+    Album ids already listed in an artist file, from any block.
+    """
+    return {
+        album_id
+        for line in text.splitlines()
+        if line.startswith("http") and (album_id := album_id_from_url(line.split()[0]))
+    }
+
+
 # ---------------- Existing behavior (unchanged) ----------------
 
 
@@ -136,3 +165,52 @@ def write_expansion_block(
         f.write("\n")
 
     return True
+
+
+def append_expansion_delta(
+    *,
+    path: Path,
+    artist_url: str,
+    releases: dict[str, list[str]],
+) -> int:
+    """
+    Append only releases whose album id is not yet in the artist file.
+
+    The delta block repeats the source line and carries its own
+    expanded_at stamp, so the file records when it was last expanded.
+
+    Returns the number of release lines appended (0 -> nothing written).
+    """
+    text = path.read_text(encoding="utf-8")
+    seen = known_album_ids(text)
+
+    sections = []
+    for heading, key in (("# Albums", "albums"), ("# EPs", "eps"), ("# Singles", "singles")):
+        lines = [
+            line
+            for line in releases.get(key, [])
+            if album_id_from_url(line.split()[0]) not in seen
+        ]
+        if lines:
+            sections.append((heading, lines))
+
+    if not sections:
+        return 0
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    with path.open("a", encoding="utf-8") as f:
+        if not text.endswith("\n\n"):
+            f.write("\n" if text.endswith("\n") else "\n\n")
+
+        f.write("# === Deezer artist expansion update ===\n")
+        f.write(f"# source: {artist_url}\n")
+        f.write(f"# expanded_at: {timestamp}\n\n")
+
+        for heading, lines in sections:
+            f.write(heading + "\n")
+            for line in lines:
+                f.write(line + "\n")
+            f.write("\n")
+
+    return sum(len(lines) for _, lines in sections)
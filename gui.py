@@ -11,6 +11,8 @@ import webbrowser
 from identity_viewer import IdentityViewer
 
 from curator.curate import run_curation
+from curator.metadata_store import load_metadata_subset
+from curator.response_cache import RESPONSE_CACHE_DIRNAME, configure_response_cache
 from curator.state import (
     load_confirmed,
     save_confirmed,
@@ -26,7 +28,7 @@ from curator.preferences import (
     load_preferences,
     save_preferences,
 )
-from audio_division.dashboard import dashboard_summary, load_json
+from audio_division.dashboard import dashboard_summary
 from audio_division.settings import (
     load_audio_division_settings,
     save_audio_division_settings,
@@ -43,7 +45,9 @@ from audio_division.operation_runner import run_operation
 from audio_division.playback import run_playback_action
 from audio_division.archive_reconciliation import reconcile_archive, write_archive_reconciliation_report
 from audio_division.archive_audit import audit_archive, write_archive_audit
-from audio_division.revalidation import revalidate_archive, write_archive_revalidation_report
+from audio_division.archive_scan import scan_workers
+from audio_division.revalidation import RevalidationCancelled, revalidate_archive, write_archive_revalidation_report
+from audio_division.registry_store import load_registry, load_registry_metadata
 from audio_division.album_workspace import album_workspace
 from audio_division.active_album import ActiveAlbum, active_album_from_row, active_album_index, restore_active_album
 from audio_division.canonical_album import AlbumRef, CanonicalAlbumResolver
@@ -227,6 +231,7 @@ class DeezerCuratorGUI(tk.Tk):
         self.archive_revalidation_status_var = tk.StringVar(value="")
         self._archive_audit_running = False
         self._archive_revalidation_running = False
+        self._archive_revalidation_cancel: threading.Event | None = None
         self.archive_current_nfo: dict = {}
         self.archive_current_tracklist: dict = {}
         self.processing_queue = load_processing_queue(PROCESSING_QUEUE_FILE)
@@ -550,6 +555,13 @@ class DeezerCuratorGUI(tk.Tk):
         self.archive_audit_button.pack(side="left", padx=(6, 0))
         self.archive_revalidation_button = ttk.Button(toolbar, text="Revalidate Archive", command=self.run_archive_revalidation)
         self.archive_revalidation_button.pack(side="left", padx=(6, 0))
+        self.archive_revalidation_cancel_button = ttk.Button(
+            toolbar,
+            text="Cancel",
+            command=self.cancel_archive_revalidation,
+            state="disabled",
+        )
+        self.archive_revalidation_cancel_button.pack(side="left", padx=(6, 0))
         ttk.Label(toolbar, textvariable=self.archive_audit_status_var).pack(side="left", padx=(8, 0))
         ttk.Label(toolbar, textvariable=self.archive_revalidation_status_var).pack(side="left", padx=(8, 0))
         ttk.Label(toolbar, text="Artist").pack(side="left", padx=(12, 4))
@@ -945,9 +957,9 @@ class DeezerCuratorGUI(tk.Tk):
             restore_album_key = selection.album_key
             restore_artist_key = selection.artist_key
             restore_album_yview = selection.album_yview
-        registry = load_json(DATA_DIR / "archive_registry.json")
-        identity = load_json(DATA_DIR / "identity_registry.json")
-        metadata = load_json(DATA_DIR / "metadata_cache.json")
+        registry = load_registry(DATA_DIR / "archive_registry.json")
+        identity = load_registry(DATA_DIR / "identity_registry.json")
+        metadata = load_registry_metadata(DATA_DIR)
         self.archive_albums = build_archive_albums(registry, identity, metadata)
         self.processing_queue = load_processing_queue(PROCESSING_QUEUE_FILE)
         self.apply_archive_filters(
@@ -1131,7 +1143,7 @@ class DeezerCuratorGUI(tk.Tk):
         if not canonical:
             self._set_album_workspace_empty_state(target)
             return {}, {}
-        metadata = load_json(DATA_DIR / "metadata_cache.json")
+        metadata = load_metadata_subset(DATA_DIR, [canonical.get("album_id")])
         workspace = album_workspace(canonical, metadata, self._workspace_collection_albums())
         presentation = workspace.get("presentation", {})
         sections = presentation.get("sections", {})
@@ -1195,10 +1207,10 @@ class DeezerCuratorGUI(tk.Tk):
     def canonical_album_resolver(self) -> CanonicalAlbumResolver:
         archive_root = self.audio_settings.get("archive_paths", {}).get("main_archive_root", "")
         return CanonicalAlbumResolver(
-            archive_registry=load_json(DATA_DIR / "archive_registry.json"),
-            identity_registry=load_json(DATA_DIR / "identity_registry.json"),
-            lifecycle_registry=load_json(DATA_DIR / "lifecycle_registry.json"),
-            metadata_cache=load_json(DATA_DIR / "metadata_cache.json"),
+            archive_registry=load_registry(DATA_DIR / "archive_registry.json"),
+            identity_registry=load_registry(DATA_DIR / "identity_registry.json"),
+            lifecycle_registry=load_registry(DATA_DIR / "lifecycle_registry.json"),
+            metadata_cache=load_registry_metadata(DATA_DIR),
             archive_root=Path(archive_root) if archive_root else None,
         )
 
@@ -1972,7 +1984,7 @@ class DeezerCuratorGUI(tk.Tk):
         if not self.library_data:
             self.refresh_library()
             return
-        self.artwork_rows = artwork_items(self.library_data, load_json(DATA_DIR / "archive_registry.json"))
+        self.artwork_rows = artwork_items(self.library_data, load_registry(DATA_DIR / "archive_registry.json"))
         self.apply_artwork_filters()
 
     def apply_artwork_filters(self):
@@ -2189,6 +2201,7 @@ class DeezerCuratorGUI(tk.Tk):
                 ("archive_paths", "incoming_root", "Incoming Root"),
                 ("archive_paths", "problematic_root", "Problematic Root"),
                 ("archive_paths", "needs_validation_root", "Needs Validation Root"),
+                ("archive_paths", "scan_workers", "Archive Scan Workers"),
                 ("validator", "validated_index_path", "Validated Index Path"),
                 ("validator", "validation_log_root", "Validation Log Root"),
                 ("metadata", "metadata_cache_path", "Metadata Cache Path"),
@@ -2271,8 +2284,8 @@ class DeezerCuratorGUI(tk.Tk):
         if not archive_root:
             self.status.config(text="Archive reconciliation failed: Main Archive Root is not configured")
             return
-        registry = load_json(DATA_DIR / "archive_registry.json")
-        report = reconcile_archive(Path(archive_root), registry)
+        registry = load_registry(DATA_DIR / "archive_registry.json")
+        report = reconcile_archive(Path(archive_root), registry, workers=scan_workers(self.audio_settings))
         reports_dir = Path(self.audio_settings.get("reports", {}).get("reports_directory") or BASE_DIR / "reports")
         if not reports_dir.is_absolute():
             reports_dir = BASE_DIR / reports_dir
@@ -2288,7 +2301,7 @@ class DeezerCuratorGUI(tk.Tk):
         )
 
     def run_archive_audit(self):
-        registry = load_json(DATA_DIR / "archive_registry.json")
+        registry = load_registry(DATA_DIR / "archive_registry.json")
         archive_root_text = registry.get("archive_root") or self.audio_settings.get("archive_paths", {}).get("main_archive_root", "")
         if not archive_root_text:
             self.status.config(text="Archive audit failed: Main Archive Root is not configured")
@@ -2321,7 +2334,7 @@ class DeezerCuratorGUI(tk.Tk):
 
     def _run_archive_audit_thread(self, registry: dict, archive_root: Path, reports_dir: Path, selection):
         try:
-            report = audit_archive(registry, archive_root)
+            report = audit_archive(registry, archive_root, workers=scan_workers(self.audio_settings))
             self.after(0, lambda: self.archive_audit_status_var.set("Writing archive audit report..."))
             write_archive_audit(report, reports_dir)
             summary = report.get("summary", {})
@@ -2336,7 +2349,7 @@ class DeezerCuratorGUI(tk.Tk):
         self.after(0, lambda message=message: self._finish_archive_wide_operation("Run Audit", message, selection, self._set_archive_audit_running))
 
     def run_archive_revalidation(self):
-        registry = load_json(DATA_DIR / "archive_registry.json")
+        registry = load_registry(DATA_DIR / "archive_registry.json")
         archive_root_text = registry.get("archive_root") or self.audio_settings.get("archive_paths", {}).get("main_archive_root", "")
         if not archive_root_text:
             self.status.config(text="Archive revalidation failed: Main Archive Root is not configured")
@@ -2348,26 +2361,34 @@ class DeezerCuratorGUI(tk.Tk):
         if self._archive_revalidation_running:
             return
         selection = self.capture_active_archive_context(active_tab=self.tabs.select())
+        self._archive_revalidation_cancel = threading.Event()
         self._set_archive_revalidation_running(True, "Archive revalidation running...")
         thread = threading.Thread(
             target=self._run_archive_revalidation_thread,
-            args=(registry, archive_root, reports_dir, selection),
+            args=(registry, archive_root, reports_dir, selection, self._archive_revalidation_cancel),
             daemon=True,
         )
         thread.start()
 
+    def cancel_archive_revalidation(self):
+        if self._archive_revalidation_running and self._archive_revalidation_cancel is not None:
+            self._archive_revalidation_cancel.set()
+            self.archive_revalidation_status_var.set("Cancelling archive revalidation...")
+
     def _set_archive_revalidation_running(self, running: bool, message: str):
         self._archive_revalidation_running = running
         state = "disabled" if running else "normal"
         if hasattr(self, "archive_revalidation_button"):
             self.archive_revalidation_button.config(state=state)
+        if hasattr(self, "archive_revalidation_cancel_button"):
+            self.archive_revalidation_cancel_button.config(state="normal" if running else "disabled")
         if hasattr(self, "archive_revalidation_status_var"):
             self.archive_revalidation_status_var.set(message)
         if hasattr(self, "archive_operation_result_var"):
             self.archive_operation_result_var.set(message)
         self.status.config(text=message)
 
-    def _run_archive_revalidation_thread(self, registry: dict, archive_root: Path, reports_dir: Path, selection):
+    def _run_archive_revalidation_thread(self, registry: dict, archive_root: Path, reports_dir: Path, selection, cancel: threading.Event):
         try:
             def progress(current: int, total: int, row: dict):
                 if current == 1 or current == total or current % 25 == 0:
@@ -2378,10 +2399,12 @@ class DeezerCuratorGUI(tk.Tk):
             report = revalidate_archive(
                 registry,
                 archive_root,
-                identity_registry=load_json(DATA_DIR / "identity_registry.json"),
-                lifecycle_registry=load_json(DATA_DIR / "lifecycle_registry.json"),
-                validated_index=load_json(DATA_DIR / "validated_albums.json"),
+                identity_registry=load_registry(DATA_DIR / "identity_registry.json"),
+                lifecycle_registry=load_registry(DATA_DIR / "lifecycle_registry.json"),
+                validated_index=load_registry(DATA_DIR / "validated_albums.json"),
                 progress=progress,
+                workers=scan_workers(self.audio_settings),
+                cancel=cancel,
             )
             self.after(0, lambda: self.archive_revalidation_status_var.set("Writing archive revalidation report..."))
             write_archive_revalidation_report(report, reports_dir)
@@ -2393,6 +2416,8 @@ class DeezerCuratorGUI(tk.Tk):
                 f"{summary.get('warnings', 0)} warnings, "
                 f"{summary.get('errors', 0)} errors"
             )
+        except RevalidationCancelled as exc:
+            message = f"{exc} No report was written."
         except Exception as exc:
             message = f"Archive revalidation failed: {exc}"
         self.after(0, lambda message=message: self._finish_archive_wide_operation("Revalidate Archive", message, selection, self._set_archive_revalidation_running))
@@ -2940,6 +2965,7 @@ class DeezerCuratorGUI(tk.Tk):
 
 
 def main():
+    configure_response_cache(DATA_DIR / RESPONSE_CACHE_DIRNAME)
     app = DeezerCuratorGUI()
     app.mainloop()
 
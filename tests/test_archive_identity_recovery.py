@@ -83,6 +83,33 @@ class ArchiveIdentityRecoveryTests(unittest.TestCase):
         )
         self.assertEqual(no_matches, [])
 
+        fuzzy = recovery_candidates_for_unresolved(
+            {"parsed_folder": {"artist": "Artists", "title": "Album"}, "validation": {}},
+            candidates,
+        )
+        self.assertEqual(fuzzy[0]["recovery_level"], "RECOVERABLE_LOW")
+        self.assertEqual(fuzzy[0]["reasons"][0], "fuzzy_artist_title")
+
+    def test_empty_artist_still_matches_candidates_without_artist(self):
+        candidates = [
+            {
+                "deezer_album_id": "1",
+                "artist": None,
+                "title": "Abcdxfgh",
+                "normalized_artist": "",
+                "normalized_title": "abcdxfgh",
+                "highest_lifecycle_state": "DISCOVERED",
+            }
+        ]
+
+        matches = recovery_candidates_for_unresolved(
+            {"parsed_folder": {"artist": "", "title": "Abcdefgh"}, "validation": {}},
+            candidates,
+        )
+
+        self.assertEqual(matches[0]["recovery_level"], "RECOVERABLE_LOW")
+        self.assertIn("exact_artist", matches[0]["reasons"])
+
     def test_recovery_registry_and_reports(self):
         identity_registry = {
             "releases": [
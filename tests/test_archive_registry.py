@@ -1,3 +1,4 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -14,6 +15,7 @@ from audio_division.archive_registry import (
     is_album_root,
     render_archive_registry_report,
     render_artifact_coverage_report,
+    walk_album_roots,
 )
 from audio_division.artifacts import (
     CANONICAL_ARTIFACT_TYPES,
@@ -166,6 +168,34 @@ class ArchiveRegistryTests(unittest.TestCase):
         self.assertIn("Archive Artifact Coverage Report", coverage_report)
         self.assertEqual(registry["summary"]["artifacts"]["missing_nfo"], 1)
 
+    def test_walk_matches_album_root_rules_and_per_album_detection(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            boxed = root / "B" / "Albums" / "Box"
+            (boxed / "CD1").mkdir(parents=True)
+            (boxed / "CD1" / "01.flac").write_text("audio")
+            (boxed / "cover.jpg").write_text("art")
+            nested = boxed / "Albums" / "Inner"
+            nested.mkdir(parents=True)
+            (nested / "01.mp3").write_text("audio")
+            empty = root / "B" / "EPs" / "Empty"
+            empty.mkdir(parents=True)
+            category_only = root / "B" / "Albums" / "Live"
+            category_only.mkdir()
+            (category_only / "01.flac").write_text("audio")
+            linked = root / "C" / "Singles" / "Linked"
+            linked.parent.mkdir(parents=True)
+            os.symlink(boxed, linked)
+
+            walked = list(walk_album_roots(root))
+            rglob_roots = sorted(path for path in root.rglob("*") if path.is_dir() and is_album_root(path, root))
+
+            self.assertEqual([path for path, _ in walked], rglob_roots)
+            self.assertEqual([path for path, _ in walked], [boxed, nested, linked])
+            for path, detected in walked:
+                self.assertEqual(detected, detect_artifacts(path))
+            self.assertEqual(list(walk_album_roots(root / "missing")), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from audio_division.archive_registry import build_archive_registry
+from audio_division.archive_registry_index import (
+    ARCHIVE_REGISTRY_INDEX_FILENAME,
+    ArchiveRegistryIndex,
+    refresh_archive_registry,
+)
+
+OLD_NS = 1_600_000_000_000_000_000
+
+
+def _age(root: Path, when: int = OLD_NS) -> None:
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(when, when))
+
+
+def _touch(*paths: Path, when: int = OLD_NS + 1_000_000_000) -> None:
+    for path in paths:
+        os.utime(path, ns=(when, when))
+
+
+def _without_timestamp(registry: dict) -> dict:
+    return {key: value for key, value in registry.items() if key != "generated_at"}
+
+
+class ArchiveRegistryIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        base = Path(self._tmp.name)
+        self.root = base / "archive"
+        self.data_dir = base / "data"
+        self.data_dir.mkdir()
+        self.box = self.root / "A" / "Albums" / "Box"
+        (self.box / "CD1").mkdir(parents=True)
+        (self.box / "CD1" / "01.flac").write_text("audio")
+        (self.box / "cover.jpg").write_text("art")
+        self.single = self.root / "A" / "Singles" / "Single"
+        self.single.mkdir(parents=True)
+        (self.single / "01.mp3").write_text("audio")
+        (self.root / "A" / "EPs" / "Empty").mkdir(parents=True)
+        _age(self.root)
+
+    def _refresh(self, **kwargs) -> tuple[dict, ArchiveRegistryIndex]:
+        registry, index = refresh_archive_registry(self.root, self.data_dir, **kwargs)
+        (self.data_dir / "archive_registry.json").write_text(json.dumps(registry), encoding="utf-8")
+        index.save()
+        return registry, index
+
+    def assertMatchesFullBuild(self, registry: dict) -> None:
+        self.assertEqual(_without_timestamp(registry), _without_timestamp(build_archive_registry(self.root)))
+
+    def test_unchanged_archive_reuses_every_entry(self) -> None:
+        first, index = self._refresh()
+        self.assertEqual(index.stats["albums_scanned"], 3)
+
+        second, index = self._refresh()
+
+        self.assertMatchesFullBuild(second)
+        self.assertEqual(second["albums"], first["albums"])
+        self.assertEqual(index.stats["albums_scanned"], 0)
+        self.assertEqual(index.stats["albums_reused"], 3)
+        self.assertEqual(index.stats["dirs_listed"], 0)
+
+    def test_only_changed_albums_are_rescanned(self) -> None:
+        self._refresh()
+
+        (self.box / "CD1" / "02.flac").write_text("audio")
+        _touch(self.box / "CD1")
+        new_album = self.root / "A" / "Albums" / "New"
+        new_album.mkdir()
+        (new_album / "01.flac").write_text("audio")
+        _touch(new_album, self.root / "A" / "Albums")
+        shutil.rmtree(self.single)
+        _touch(self.root / "A" / "Singles")
+        registry, index = self._refresh()
+
+        self.assertMatchesFullBuild(registry)
+        self.assertEqual(index.stats["albums_scanned"], 2)
+        self.assertEqual(index.stats["albums_reused"], 1)
+        box = next(row for row in registry["albums"] if row["name"] == "Box")
+        self.assertEqual(box["track_count"], 2)
+        saved = json.loads((self.data_dir / ARCHIVE_REGISTRY_INDEX_FILENAME).read_text(encoding="utf-8"))
+        self.assertNotIn(str(self.single), saved["albums"])
+
+    def test_recently_modified_folders_are_not_trusted(self) -> None:
+        _age(self.root, when=0)
+        os.utime(self.box, None)
+        self._refresh()
+
+        registry, index = self._refresh()
+
+        self.assertMatchesFullBuild(registry)
+        self.assertEqual(index.stats["albums_scanned"], 1)
+
+    def test_foreign_registry_and_full_mode_rescan_everything(self) -> None:
+        self._refresh()
+        (self.data_dir / "archive_registry.json").write_text(json.dumps({"albums": []}), encoding="utf-8")
+
+        registry, index = refresh_archive_registry(self.root, self.data_dir)
+        self.assertMatchesFullBuild(registry)
+        self.assertEqual(index.stats["albums_scanned"], len(registry["albums"]))
+
+        self._refresh()
+        registry, index = self._refresh(full=True)
+        self.assertMatchesFullBuild(registry)
+        self.assertEqual(index.stats["albums_scanned"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
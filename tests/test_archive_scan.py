@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from audio_division.archive_audit import audit_archive
+from audio_division.archive_reconciliation import reconcile_archive
+from audio_division.archive_registry import build_archive_registry, walk_album_roots
+from audio_division.archive_scan import DEFAULT_SCAN_WORKERS, list_archive_tree, map_albums, scan_workers, stream_albums
+from audio_division.revalidation import revalidate_archive
+
+
+def _without_timestamp(report: dict) -> dict:
+    return {key: value for key, value in report.items() if key != "generated_at"}
+
+
+class ArchiveScanTests(unittest.TestCase):
+    def make_archive(self, root: Path) -> None:
+        for index in range(12):
+            album = root / f"Artist{index % 3}" / "Albums" / f"Album{index:02d}"
+            if index % 4 == 0:
+                (album / "CD1").mkdir(parents=True)
+                (album / "CD1" / "01.flac").write_text("audio")
+            else:
+                album.mkdir(parents=True)
+                (album / "01.flac").write_text("audio")
+            if index % 2:
+                (album / "playlist.m3u8").write_text("01.flac\nmissing.flac\n")
+        linked = root / "Linked" / "Singles" / "Link"
+        linked.parent.mkdir(parents=True)
+        os.symlink(root / "Artist0" / "Albums" / "Album00", linked)
+
+    def test_parallel_scans_match_serial_scans(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.make_archive(root)
+            registry = build_archive_registry(root)
+            sources = {"identity_registry": {}, "lifecycle_registry": {}, "validated_index": {}}
+
+            self.assertEqual(list(walk_album_roots(root, workers=4)), list(walk_album_roots(root)))
+            self.assertEqual(_without_timestamp(build_archive_registry(root, workers=4)), _without_timestamp(registry))
+            self.assertEqual(
+                _without_timestamp(reconcile_archive(root, registry, workers=4)),
+                _without_timestamp(reconcile_archive(root, registry)),
+            )
+            self.assertEqual(
+                _without_timestamp(audit_archive(registry, root, workers=4, **sources)),
+                _without_timestamp(audit_archive(registry, root, **sources)),
+            )
+            self.assertEqual(
+                _without_timestamp(revalidate_archive(registry, root, workers=4, **sources)),
+                _without_timestamp(revalidate_archive(registry, root, **sources)),
+            )
+
+    def test_tree_listing_does_not_follow_symlinked_folders(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.make_archive(root)
+
+            listings = list_archive_tree(root, 4)
+
+        self.assertIn(root / "Linked" / "Singles" / "Link", listings)
+        self.assertNotIn(root / "Linked" / "Singles" / "Link" / "CD1", listings)
+        self.assertIn(root / "Artist0" / "Albums" / "Album00" / "CD1", listings)
+
+    def test_map_albums_keeps_order_and_reports_progress_on_caller_thread(self):
+        caller = threading.current_thread()
+        calls = []
+
+        def progress(index, total, item):
+            calls.append((index, total, item, threading.current_thread() is caller))
+
+        results = list(map_albums(lambda item: item * 2, range(50), workers=4, progress=progress))
+
+        self.assertEqual(results, [item * 2 for item in range(50)])
+        self.assertEqual(calls, [(index + 1, 50, index, True) for index in range(50)])
+
+    def test_map_albums_propagates_errors(self):
+        def fail_on_three(item):
+            if item == 3:
+                raise ValueError("unreadable album")
+            return item
+
+        with self.assertRaises(ValueError):
+            list(map_albums(fail_on_three, range(10), workers=3))
+
+    def test_stream_albums_yields_every_item_once(self):
+        results = dict(stream_albums(lambda item: item * 2, range(30), workers=4))
+
+        self.assertEqual(results, {index: index * 2 for index in range(30)})
+
+    def test_stream_albums_stops_without_waiting_for_albums_in_flight(self):
+        release = threading.Event()
+        cancel = threading.Event()
+        self.addCleanup(release.set)
+
+        def work(item):
+            if item:
+                release.wait(5)
+            return item
+
+        stream = stream_albums(work, range(10), workers=2, cancel=cancel)
+        self.assertEqual(next(stream), (0, 0))
+        cancel.set()
+        started = time.monotonic()
+
+        self.assertEqual(list(stream), [])
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_scan_workers_setting(self):
+        self.assertEqual(scan_workers({"archive_paths": {"scan_workers": "3"}}), 3)
+        self.assertEqual(scan_workers({"archive_paths": {"scan_workers": "0"}}), 1)
+        self.assertEqual(scan_workers({"archive_paths": {"scan_workers": "many"}}), DEFAULT_SCAN_WORKERS)
+        self.assertEqual(scan_workers({}), DEFAULT_SCAN_WORKERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
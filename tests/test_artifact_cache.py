@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from audio_division.artifacts import (
+    RACY_WINDOW_NS,
+    ArtifactCache,
+    album_unchanged,
+    artifact_cache,
+    classify_artifacts,
+    detect_artifacts,
+    scan_album,
+    scan_directory,
+)
+
+OLD_NS = 1_600_000_000_000_000_000
+
+
+def _age(*paths: Path, when: int = OLD_NS) -> None:
+    for path in paths:
+        os.utime(path, ns=(when, when))
+
+
+class ArtifactCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.album = Path(self._tmp.name) / "Albums" / "Box"
+        (self.album / "CD1").mkdir(parents=True)
+        (self.album / "CD1" / "01.flac").write_text("audio")
+        (self.album / "cover.jpg").write_text("art")
+        _age(self.album, self.album / "CD1")
+
+    def test_unchanged_folder_is_listed_once(self) -> None:
+        cache = ArtifactCache()
+
+        first = cache.detect(self.album)
+        second = cache.detect(self.album)
+
+        self.assertIs(first, second)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        self.assertEqual(first, classify_artifacts(self.album, scan_directory(self.album)))
+
+    def test_disc_folder_change_is_picked_up(self) -> None:
+        cache = ArtifactCache()
+        self.assertEqual(cache.detect(self.album).count("audio"), 1)
+
+        (self.album / "CD1" / "02.flac").write_text("audio")
+        _age(self.album / "CD1", when=OLD_NS + 1_000_000_000)
+
+        self.assertEqual(cache.detect(self.album).count("audio"), 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_recently_modified_folder_is_not_cached(self) -> None:
+        cache = ArtifactCache()
+        os.utime(self.album / "CD1", None)
+
+        cache.detect(self.album)
+        cache.detect(self.album)
+
+        self.assertEqual((cache.misses, cache.hits, len(cache)), (2, 0, 0))
+
+    def test_scan_album_records_trusted_disc_mtimes(self) -> None:
+        started_ns = OLD_NS + RACY_WINDOW_NS + 1
+        detected, discs = scan_album(self.album, scan_directory(self.album), started_ns)
+
+        self.assertEqual(detected, classify_artifacts(self.album, scan_directory(self.album)))
+        self.assertEqual(discs, {"CD1": OLD_NS})
+        self.assertTrue(album_unchanged(self.album, OLD_NS, OLD_NS, discs.items()))
+
+        _age(self.album / "CD1", when=OLD_NS + 1)
+        self.assertFalse(album_unchanged(self.album, OLD_NS, OLD_NS, discs.items()))
+        self.assertEqual(scan_album(self.album, scan_directory(self.album), started_ns)[1], {"CD1": None})
+
+    def test_least_recently_used_folder_is_evicted(self) -> None:
+        cache = ArtifactCache(max_entries=2)
+        folders = []
+        for name in ("A", "B", "C"):
+            folder = self.album.parent / name
+            folder.mkdir()
+            _age(folder)
+            folders.append(folder)
+
+        cache.detect(folders[0])
+        cache.detect(folders[1])
+        cache.detect(folders[0])
+        cache.detect(folders[2])
+        cache.detect(folders[0])
+        cache.detect(folders[1])
+
+        self.assertEqual(cache.evictions, 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_detect_artifacts_shares_the_process_cache(self) -> None:
+        artifact_cache.clear()
+        self.addCleanup(artifact_cache.clear)
+
+        detect_artifacts(self.album)
+        detect_artifacts(str(self.album))
+        missing = detect_artifacts(self.album / "missing")
+
+        self.assertEqual(artifact_cache.hits, 1)
+        self.assertFalse(missing.exists)
+        self.assertFalse(detect_artifacts(None).exists)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,9 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from curator.atomic import atomic_write_text
+from curator.atomic import atomic_batch, atomic_write_text
 from curator.attempts import AttemptInfo, load_attempts, save_attempts
 from curator.preferences import DEFAULTS, load_preferences, save_preferences
 from curator.ship import _load_shipped_db, _save_shipped_db
@@ -32,6 +33,45 @@ class AtomicWriteTextTests(unittest.TestCase):
             self.assertEqual(path.read_text(encoding="utf-8"), "new\n")
 
 
+class AtomicBatchTests(unittest.TestCase):
+    def test_batch_lands_on_exit_with_one_fsync_per_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.md").write_text("old\n", encoding="utf-8")
+
+            with patch("curator.atomic._fsync_dir") as fsync_dir:
+                with atomic_batch() as batch:
+                    atomic_write_text(root / "a.md", "first\n")
+                    atomic_write_text(root / "a.md", "second\n")
+                    atomic_write_text(root / "b.md", "b\n")
+                    atomic_write_text(root / "nested" / "c.md", "c\n")
+                    with atomic_batch() as inner:
+                        self.assertIs(inner, batch)
+                    self.assertEqual(len(batch), 3)
+                    self.assertEqual((root / "a.md").read_text(encoding="utf-8"), "old\n")
+                    self.assertFalse((root / "b.md").exists())
+
+            self.assertEqual((root / "a.md").read_text(encoding="utf-8"), "second\n")
+            self.assertEqual((root / "nested" / "c.md").read_text(encoding="utf-8"), "c\n")
+            self.assertEqual(sorted(p.name for p in root.iterdir()), ["a.md", "b.md", "nested"])
+            self.assertEqual([call.args[0] for call in fsync_dir.call_args_list], [root, root / "nested"])
+
+    def test_failed_batch_replaces_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.md").write_text("old\n", encoding="utf-8")
+
+            with self.assertRaises(RuntimeError):
+                with atomic_batch():
+                    atomic_write_text(root / "a.md", "new\n")
+                    raise RuntimeError("render failed")
+
+            self.assertEqual((root / "a.md").read_text(encoding="utf-8"), "old\n")
+            self.assertEqual([p.name for p in root.iterdir()], ["a.md"])
+            atomic_write_text(root / "a.md", "after\n")
+            self.assertEqual((root / "a.md").read_text(encoding="utf-8"), "after\n")
+
+
 class StateWriterTests(unittest.TestCase):
     def test_confirmed_albums_roundtrip_and_overwrite(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
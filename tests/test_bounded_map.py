@@ -0,0 +1,54 @@
+import threading
+import unittest
+
+from curator.bounded_map import bounded_map
+
+
+class BoundedMapTests(unittest.TestCase):
+    def test_keeps_order_and_bounds_work_ahead_of_the_consumer(self):
+        lock = threading.Lock()
+        started = []
+
+        def work(item):
+            with lock:
+                started.append(item)
+            return item * 2
+
+        results = bounded_map(work, range(100), workers=2, queue_depth=3)
+        first = next(results)
+        with lock:
+            ahead = len(started)
+
+        self.assertEqual(first, 0)
+        self.assertLessEqual(ahead, 2 * 3 + 1)
+        self.assertEqual([first, *results], [item * 2 for item in range(100)])
+
+    def test_closing_early_drops_queued_items(self):
+        release = threading.Event()
+        started = []
+
+        def work(item):
+            started.append(item)
+            if item:
+                release.wait(5)
+            return item
+
+        results = bounded_map(work, range(1000), workers=2, queue_depth=2)
+        self.assertEqual(next(results), 0)
+        release.set()
+        results.close()
+
+        self.assertLess(len(started), 10)
+
+    def test_propagates_errors(self):
+        def fail_on_three(item):
+            if item == 3:
+                raise ValueError("failed fetch")
+            return item
+
+        with self.assertRaises(ValueError):
+            list(bounded_map(fail_on_three, range(10), workers=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
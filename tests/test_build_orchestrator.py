@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import build_archive_intelligence
+from audio_division.build_context import BuildContext
+from audio_division.build_orchestrator import (
+    BUILD_STATE_FILENAME,
+    STAGES,
+    Stage,
+    render_build_summary,
+    run_build,
+    select_stages,
+    stage_dependencies,
+)
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _copy_stage(name: str, source: str, target: str, calls: list[str]) -> Stage:
+    def run(ctx) -> str:
+        calls.append(name)
+        data = ctx.json(source)
+        _write_json(ctx.root / target, {"generated_at": str(len(calls)), "value": data.get("value")})
+        return "copied"
+
+    return Stage(name, (source,), (target,), run)
+
+
+class StageGraphTests(unittest.TestCase):
+    def test_dependencies_follow_outputs_to_inputs(self) -> None:
+        dependencies = stage_dependencies(STAGES)
+
+        self.assertEqual(dependencies["lifecycle"], set())
+        self.assertEqual(dependencies["identity"], {"lifecycle"})
+        self.assertEqual(dependencies["archive_audit"], {"archive_registry", "identity", "lifecycle"})
+        self.assertEqual(dependencies["archive_reconciliation"], {"archive_registry"})
+
+    def test_selecting_a_stage_pulls_in_its_upstream_stages(self) -> None:
+        names = [stage.name for stage in select_stages(STAGES, ["archive_identity_recovery"])]
+
+        self.assertEqual(names, ["lifecycle", "identity", "archive_identity_recovery"])
+        with self.assertRaises(ValueError):
+            select_stages(STAGES, ["nope"])
+
+
+class RunBuildTests(unittest.TestCase):
+    def test_second_run_skips_stages_with_unchanged_inputs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            calls: list[str] = []
+            stages = (
+                _copy_stage("first", "data/source.json", "data/first.json", calls),
+                _copy_stage("second", "data/first.json", "data/second.json", calls),
+            )
+            _write_json(root / "data" / "source.json", {"value": 1})
+
+            run_build(root, stages=stages)
+            result = run_build(root, stages=stages)
+
+            self.assertEqual(calls, ["first", "second"])
+            self.assertEqual([row["status"] for row in result["stages"]], ["skipped", "skipped"])
+            self.assertTrue((root / "data" / BUILD_STATE_FILENAME).exists())
+
+    def test_changed_input_reruns_stage_and_only_changed_outputs_cascade(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            calls: list[str] = []
+            stages = (
+                _copy_stage("first", "data/source.json", "data/first.json", calls),
+                _copy_stage("second", "data/first.json", "data/second.json", calls),
+            )
+            _write_json(root / "data" / "source.json", {"value": 1})
+            run_build(root, stages=stages)
+
+            # Only a volatile key changes downstream, so "second" still skips.
+            _write_json(root / "data" / "source.json", {"value": 1, "extra": True})
+            result = run_build(root, stages=stages)
+            self.assertEqual([row["status"] for row in result["stages"]], ["ran", "skipped"])
+
+            _write_json(root / "data" / "source.json", {"value": 2})
+            result = run_build(root, stages=stages)
+            self.assertEqual([row["status"] for row in result["stages"]], ["ran", "ran"])
+            self.assertEqual(json.loads((root / "data" / "second.json").read_text())["value"], 2)
+
+    def test_deleted_output_and_force_rerun_stage(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            calls: list[str] = []
+            stages = (_copy_stage("first", "data/source.json", "data/first.json", calls),)
+            _write_json(root / "data" / "source.json", {"value": 1})
+            run_build(root, stages=stages)
+
+            (root / "data" / "first.json").unlink()
+            run_build(root, stages=stages)
+            run_build(root, stages=stages, force=True)
+
+            self.assertEqual(calls, ["first", "first", "first"])
+
+    def test_independent_stages_run_in_parallel_and_failures_block_dependents(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            barrier = threading.Barrier(2, timeout=5)
+
+            def meet(ctx) -> str:
+                barrier.wait()
+                return "met"
+
+            def fail(ctx) -> str:
+                raise RuntimeError("boom")
+
+            stages = (
+                Stage("left", (), ("data/left.json",), meet, external=True),
+                Stage("right", (), ("data/right.json",), meet, external=True),
+                Stage("broken", (), ("data/broken.json",), fail),
+                Stage("after", ("data/broken.json",), (), meet),
+            )
+
+            result = run_build(root, stages=stages, workers=3)
+
+            statuses = {row["stage"]: row["status"] for row in result["stages"]}
+            self.assertEqual(statuses, {"left": "ran", "right": "ran", "broken": "failed", "after": "blocked"})
+            self.assertIn("RuntimeError: boom", render_build_summary(result))
+
+    def test_full_pipeline_loads_each_shared_source_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_json(
+                root / "data" / "audio_division_settings.json",
+                {"archive_paths": {"main_archive_root": str(root / "archive")}},
+            )
+            (root / "archive").mkdir()
+
+            first = run_build(root, workers=4)
+            second = run_build(root, workers=4)
+
+            self.assertTrue(all(row["status"] == "ran" for row in first["stages"]))
+            self.assertTrue(all(count == 1 for count in first["source_loads"].values()), first["source_loads"])
+            skipped = {row["stage"] for row in second["stages"] if row["status"] == "skipped"}
+            self.assertIn("archive_readiness", skipped)
+            self.assertIn("archive_identity_recovery", skipped)
+            self.assertTrue((root / "reports").is_dir())
+
+            (root / "reports" / "archive_readiness_report.md").unlink()
+            third = run_build(root, only=["archive_readiness"], workers=4)
+
+            statuses = {row["stage"]: row["status"] for row in third["stages"]}
+            self.assertEqual(statuses["archive_readiness"], "ran")
+            self.assertTrue((root / "reports" / "archive_readiness_report.md").exists())
+
+    def test_scripts_and_stages_share_one_build_function(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _write_json(root / "data" / "lifecycle_registry.json", {"albums": [{"album_id": "1"}]})
+
+            message = build_archive_intelligence.build(BuildContext(root))
+
+            stage = next(stage for stage in STAGES if stage.name == "archive_intelligence")
+            self.assertIs(stage.run, build_archive_intelligence.build)
+            self.assertEqual(message, "Wrote archive intelligence reports for 1 album(s).")
+            self.assertTrue(all((root / output).exists() for output in stage.outputs))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from curator.curate import run_curation
+from curator.write import expansion_files
 
 
 class CurationRetryTests(unittest.TestCase):
@@ -77,5 +78,78 @@ class CurationRetryTests(unittest.TestCase):
             )
 
 
+class DeltaExpansionTests(unittest.TestCase):
+    ARTIST_FILE = "\n".join(
+        [
+            "# Artist: Example",
+            "",
+            "# === Deezer artist expansion ===",
+            "# source: https://www.deezer.com/artist/123",
+            "# expanded_at: 2026-01-01 10:00",
+            "",
+            "# Albums",
+            "https://www.deezer.com/album/1  # ALBUM | First | 2020 | 10 tracks",
+            "",
+            "# EPs",
+            "",
+            "# Singles",
+            "",
+            "",
+        ]
+    )
+
+    def test_refresh_appends_only_new_releases(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            inbox = base / "inbox.txt"
+            log = base / "curated.log"
+            artists = base / "artists"
+            artists.mkdir()
+            (artists / "Example.txt").write_text(self.ARTIST_FILE, encoding="utf-8")
+            inbox.write_text("https://www.deezer.com/artist/123\n", encoding="utf-8")
+            log.write_text("https://www.deezer.com/artist/123\n", encoding="utf-8")
+            releases = {
+                "albums": ["https://www.deezer.com/album/1  # ALBUM | First | 2020 | 10 tracks"],
+                "eps": [],
+                "singles": ["https://www.deezer.com/album/2  # SINGLE | Second | 2026 | 1 tracks"],
+            }
+
+            with patch("curator.curate.expand_artist_releases", return_value=releases) as expand:
+                skipped = run_curation(inbox, log, artists)
+                result = run_curation(inbox, log, artists, refresh_artists=True)
+                again = run_curation(inbox, log, artists, refresh_artists=True)
+
+            text = (artists / "Example.txt").read_text(encoding="utf-8")
+
+        self.assertEqual(skipped["stats"]["artists_skipped"], 1)
+        self.assertEqual(expand.call_args_list[0].kwargs, {"known_album_ids": {"1"}})
+        self.assertEqual(expand.call_args_list[1].kwargs, {"known_album_ids": {"1", "2"}})
+        self.assertEqual((result["stats"]["artists_updated"], result["stats"]["releases_added"]), (1, 1))
+        self.assertEqual(again["stats"]["artists_updated"], 0)
+        self.assertTrue(text.startswith(self.ARTIST_FILE))
+        update = text[len(self.ARTIST_FILE) :].splitlines()
+        self.assertEqual(update[0], "# === Deezer artist expansion update ===")
+        self.assertEqual(update[1], "# source: https://www.deezer.com/artist/123")
+        self.assertEqual(update[4:6], ["# Singles", "https://www.deezer.com/album/2  # SINGLE | Second | 2026 | 1 tracks"])
+
+    def test_expansion_files_maps_every_source_url(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            artists = Path(tmp)
+            (artists / "Example.txt").write_text(self.ARTIST_FILE, encoding="utf-8")
+            other = self.ARTIST_FILE.replace("artist/123", "artist/1234")
+            (artists / "Other.txt").write_text(other + other, encoding="utf-8")
+
+            files = expansion_files(artists)
+
+            self.assertEqual(
+                files,
+                {
+                    "https://www.deezer.com/artist/123": artists / "Example.txt",
+                    "https://www.deezer.com/artist/1234": artists / "Other.txt",
+                },
+            )
+            self.assertEqual(expansion_files(artists / "missing"), {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from curator import deezer_client
+from curator.deezer_client import DeezerClient, configure_default_client, deezer_get
+
+
+class DeezerClientTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        deezer_client._default_client = None
+
+    def test_mounts_pooled_adapter_retrying_only_connection_attempts(self) -> None:
+        client = DeezerClient(pool_maxsize=4, retries=2, timeout=5)
+        adapter = client.session.get_adapter("https://api.deezer.com/album/1")
+
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(adapter.max_retries.connect, 2)
+        self.assertEqual((adapter.max_retries.read, adapter.max_retries.status), (0, 0))
+        self.assertFalse(adapter.max_retries.status_forcelist)
+        client.close()
+
+    def test_get_applies_default_timeout(self) -> None:
+        session = requests.Session()
+        client = DeezerClient(session=session, timeout=7)
+
+        with patch.object(session, "get", return_value="response") as get:
+            self.assertEqual(client.get("https://api.deezer.com/album/1"), "response")
+
+        get.assert_called_once_with("https://api.deezer.com/album/1", params=None, timeout=7)
+
+    def test_deezer_get_reuses_process_wide_client(self) -> None:
+        client = configure_default_client(pool_maxsize=2)
+
+        with patch.object(client.session, "get", return_value="response") as get:
+            deezer_get("https://api.deezer.com/artist/27/albums", params={"index": 0}, timeout=3)
+            deezer_get("https://api.deezer.com/album/302127")
+
+        self.assertIs(deezer_client.default_client(), client)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(get.call_args_list[0].kwargs, {"params": {"index": 0}, "timeout": 3})
+        self.assertEqual(get.call_args_list[1].kwargs["timeout"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from curator.expand import PAGE_SIZE, expand_artist_releases
+from curator.metadata import AlbumMetadata
+
+
+class FakeResponse:
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self.payload
+
+
+def artist_catalog(count: int, *, total: int | None = None) -> dict[int, dict]:
+    record_types = ("album", "ep", "single", "compile")
+    items = [{"id": 1000 + n, "record_type": record_types[n % len(record_types)]} for n in range(count)]
+    pages = {}
+    for index in range(0, count + PAGE_SIZE, PAGE_SIZE):
+        pages[index] = {"data": items[index : index + PAGE_SIZE], "total": count if total is None else total}
+    return pages
+
+
+class ExpandArtistReleasesTests(unittest.TestCase):
+    def expand(
+        self,
+        pages: dict[int, dict],
+        workers: int,
+        known: set[str] = frozenset(),
+    ) -> tuple[dict[str, list[str]], list[int]]:
+        requested = []
+        lock = threading.Lock()
+
+        def fake_get(url, params=None, timeout=None):
+            with lock:
+                requested.append(params["index"])
+            return FakeResponse(pages.get(params["index"], {"data": []}))
+
+        def fake_metadata(album_id: str, throttle=None) -> AlbumMetadata | None:
+            n = int(album_id) - 1000
+            if n % 7 == 3:
+                return None
+            title = f"Release {n} Live" if n % 6 == 0 else f"Release {n}"
+            year = None if n % 5 == 0 else 1990 + n % 4
+            return AlbumMetadata(artist="Artist", title=title, year=year, tracks=n)
+
+        with (
+            patch("curator.expand.deezer_get", side_effect=fake_get),
+            patch("curator.expand.time.sleep"),
+            patch("curator.expand.get_album_metadata", side_effect=fake_metadata) as lookup,
+        ):
+            releases = expand_artist_releases("27", workers=workers, known_album_ids=known)
+            self.looked_up = lookup.call_count
+        return releases, sorted(requested)
+
+    def test_parallel_expansion_matches_sequential_output(self) -> None:
+        pages = artist_catalog(173)
+
+        sequential, sequential_pages = self.expand(pages, workers=1)
+        parallel, parallel_pages = self.expand(pages, workers=6)
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(parallel_pages, sequential_pages)
+        self.assertEqual(sequential_pages, [0, 50, 100, 150, 200])
+        self.assertEqual(len(sequential["albums"]), 38)
+
+    def test_pages_beyond_a_stale_total_are_still_read(self) -> None:
+        pages = artist_catalog(120, total=60)
+
+        sequential, _ = self.expand(pages, workers=1)
+        parallel, requested = self.expand(pages, workers=4)
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(requested, [0, 50, 100, 150])
+
+    def test_known_album_ids_skip_metadata_lookups(self) -> None:
+        pages = artist_catalog(8)
+
+        releases, _ = self.expand(pages, workers=2, known={"1000", "1001", "1002"})
+
+        self.assertEqual(self.looked_up, 3)
+        self.assertEqual(
+            [line.split()[0] for lines in releases.values() for line in lines],
+            ["https://www.deezer.com/album/1004", "https://www.deezer.com/album/1005", "https://www.deezer.com/album/1006"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+
+from curator.fuzzy_index import FuzzyIndex, dice, text_grams
+
+
+class FuzzyIndexTests(unittest.TestCase):
+    def test_grams_and_dice(self) -> None:
+        self.assertEqual(text_grams("ab"), frozenset([" ab", "ab "]))
+        self.assertEqual(text_grams(""), frozenset())
+        self.assertEqual(dice(text_grams("discovery"), text_grams("discovery")), 1.0)
+        self.assertEqual(dice(text_grams("discovery"), frozenset()), 0.0)
+
+    def test_search_ranks_close_spellings_first(self) -> None:
+        index = FuzzyIndex(
+            [
+                ("daft punk", "discovery"),
+                ("daft punk", "homework"),
+                ("daft punk", "discovery live"),
+                ("nirvana", "nevermind"),
+            ]
+        )
+
+        results = index.search("daft punk", "discovry", min_score=0.6)
+
+        self.assertEqual([row for row, _ in results], [0, 2])
+        self.assertGreater(results[0][1], results[1][1])
+        self.assertEqual(index.search("nirvana", "in utero"), [])
+        self.assertEqual(index.rows_for_artist("daft punk"), [0, 1, 2])
+
+    def test_common_grams_do_not_hide_the_match(self) -> None:
+        pairs = [("the band", f"the album {n}") for n in range(50)] + [("the bnad", "the albun")]
+        index = FuzzyIndex(pairs, max_posting=10)
+
+        self.assertEqual(index.search("the bnad", "the albun", limit=1), [(50, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
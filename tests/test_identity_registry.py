@@ -124,6 +124,27 @@ class IdentityRegistryTests(unittest.TestCase):
         self.assertEqual(unresolved["candidates"][0]["deezer_album_id"], "1135101")
         self.assertEqual(len(unresolved["validation"]["manifest_hash"]), 64)
 
+    def test_unresolved_log_gets_fuzzy_candidates_without_exact_match(self):
+        registry = build_identity_registry(
+            {
+                "albums": [
+                    {"album_id": "302127", "artist": "Daft Punk", "title": "Discovery"},
+                    {"album_id": "301775", "artist": "Daft Punk", "title": "Homework"},
+                ],
+                "unmatched_validation_logs": [
+                    {"folder": "Daft Punk-Discovry-2001-FLAC-STiGMA", "reason": "no_album_id_or_index_folder_match"}
+                ],
+            },
+            generated_at="2026-06-15T12:01:00",
+        )
+
+        unresolved = registry["unresolved"][0]
+        self.assertEqual(unresolved["identity_confidence"], "LOW")
+        self.assertEqual([item["deezer_album_id"] for item in unresolved["candidates"]], ["302127"])
+        self.assertEqual(unresolved["candidates"][0]["evidence"], ["fuzzy_artist_title_match"])
+        self.assertEqual(registry["summary"]["unresolved_with_candidates"], 1)
+        self.assertEqual(registry["summary"]["unresolved_with_fuzzy_candidates"], 1)
+
     def test_report_rendering(self):
         registry = build_identity_registry(
             {
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
+
+from curator import lifecycle
 
 from curator.lifecycle import (
     build_lifecycle_registry,
     highest_state,
+    read_artist_releases,
     render_discovery_gap_report,
     render_lifecycle_summary,
     render_shipment_gap_report,
@@ -177,6 +182,81 @@ class LifecycleRegistryTests(unittest.TestCase):
             self.assertIn("`555555`", validation)
             self.assertIn("`888888`", validation)
 
+    def test_incremental_rebuild_matches_full_build(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            self._write_synthetic_data(data_dir)
+            (data_dir / "artists" / "Other.txt").write_text(
+                "# Artist: Other\nhttps://www.deezer.com/album/42  # ALBUM | Answer | 2024 | 10 tracks\n",
+                encoding="utf-8",
+            )
+            manifest_path = data_dir / "lifecycle_build_manifest.json"
+
+            first = build_lifecycle_registry(data_dir, generated_at="t", manifest_path=manifest_path)
+            self.assertEqual(first, build_lifecycle_registry(data_dir, generated_at="t"))
+
+            unchanged = build_lifecycle_registry(data_dir, generated_at="t", manifest_path=manifest_path)
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            self.assertEqual(unchanged, first)
+            self.assertEqual(manifest["last_build"], {"sources_reparsed": 0, "albums_remerged": 0})
+
+            (data_dir / "artists" / "Other.txt").write_text(
+                "# Artist: Other\nhttps://www.deezer.com/album/43  # ALBUM | Question | 2025 | 9 tracks\n",
+                encoding="utf-8",
+            )
+            rebuilt = build_lifecycle_registry(data_dir, generated_at="t", manifest_path=manifest_path)
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+            self.assertEqual(rebuilt, build_lifecycle_registry(data_dir, generated_at="t"))
+            self.assertEqual(manifest["last_build"], {"sources_reparsed": 1, "albums_remerged": 2})
+            album_ids = {row["album_id"] for row in rebuilt["albums"]}
+            self.assertIn("43", album_ids)
+            self.assertNotIn("42", album_ids)
+
+    def test_parallel_parsing_matches_sequential(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            self._write_synthetic_data(data_dir)
+            for n in range(12):
+                (data_dir / "artists" / f"Artist_{n:02d}.txt").write_text(
+                    f"# Artist: Artist {n}\n"
+                    f"https://www.deezer.com/album/{n % 5}  # ALBUM | Title {n} | 2020 | 1 tracks\n"
+                    "https://www.deezer.com/album/302127\n",
+                    encoding="utf-8",
+                )
+
+            with patch.object(lifecycle, "MIN_PARALLEL_SOURCES", 2):
+                self.assertEqual(
+                    read_artist_releases(data_dir / "artists", workers=3),
+                    read_artist_releases(data_dir / "artists"),
+                )
+                self.assertEqual(
+                    build_lifecycle_registry(data_dir, generated_at="t", workers=3),
+                    build_lifecycle_registry(data_dir, generated_at="t"),
+                )
+
+    def test_only_changed_content_is_parsed_and_small_rebuilds_skip_the_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            self._write_synthetic_data(data_dir)
+            manifest_path = data_dir / "lifecycle_build_manifest.json"
+            first = build_lifecycle_registry(data_dir, generated_at="t", manifest_path=manifest_path)
+
+            touched = data_dir / "artists" / "Daft_Punk.txt"
+            os.utime(touched, ns=(1, 1))
+            other = data_dir / "artists" / "Other.txt"
+            other.write_text("# Artist: Other\nhttps://www.deezer.com/album/42\n", encoding="utf-8")
+
+            with (
+                patch.object(lifecycle, "_parse_source", wraps=lifecycle._parse_source) as parse,
+                patch.object(lifecycle, "ProcessPoolExecutor", side_effect=AssertionError("pool started")),
+            ):
+                rebuilt = build_lifecycle_registry(data_dir, generated_at="t", manifest_path=manifest_path, workers=8)
+
+            self.assertEqual([call.args[0] for call in parse.call_args_list], ["artists/Other.txt"])
+            self.assertEqual(rebuilt, build_lifecycle_registry(data_dir, generated_at="t"))
+            self.assertNotEqual(rebuilt, first)
+
     def test_registry_and_reports_are_written(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             base = Path(tmp)
@@ -1,17 +1,39 @@
+import contextlib
+import io
+import tempfile
+import threading
 import unittest
+from datetime import datetime
+from pathlib import Path
+
+import requests
 
 from curator.metadata_cache import (
+    MetadataFetchError,
+    MetadataJournal,
     build_metadata_cache,
     collection_summary,
+    deepen_tracks,
+    empty_cache,
+    fetch_json,
+    main,
     metadata_coverage,
     metadata_quality,
     parse_album_payload,
     parse_artist_payload,
     parse_track_payload,
+    record_diff,
+    refresh_candidates,
+    refresh_metadata,
     render_collection_report,
     render_coverage_report,
     render_quality_report,
+    render_refresh_report,
+    replay_journal,
+    retry_eligible_errors,
+    track_needs_deep_fetch,
 )
+from curator.throttle import TokenBucket
 
 
 class FakeResponse:
@@ -169,6 +191,364 @@ class MetadataCacheTests(unittest.TestCase):
         self.assertIn("Metadata Quality Report", render_quality_report(cache))
         self.assertIn("Metadata Collection Report", render_collection_report(cache))
 
+    def test_concurrent_harvest_matches_sequential_and_fetches_shared_ids_once(self):
+        calls = []
+        lock = threading.Lock()
+
+        def counting_get(url, timeout=10):
+            with lock:
+                calls.append(url)
+            if "/album/" in url and "/album/302127" not in url:
+                album_id = url.rsplit("/", 1)[1]
+                payload = fake_get("https://api.deezer.com/album/302127").json() | {"id": int(album_id)}
+                return FakeResponse(payload)
+            return fake_get(url, timeout)
+
+        registry = {"albums": [{"album_id": "302127"}, {"album_id": "302128"}, {"album_id": "302129"}]}
+        sequential = build_metadata_cache(registry, {"releases": []}, get=fake_get, sleep=lambda _: None)
+        concurrent = build_metadata_cache(
+            registry,
+            {"releases": []},
+            workers=3,
+            requests_per_second=1000,
+            get=counting_get,
+            sleep=lambda _: None,
+        )
+
+        self.assertEqual(list(concurrent["albums"]), ["302127", "302128", "302129"])
+        self.assertEqual(sorted(concurrent["artists"]), sorted(sequential["artists"]))
+        self.assertEqual(sum(1 for url in calls if "/artist/27" in url), 1)
+        self.assertEqual(sum(1 for url in calls if "/track/3135556" in url), 1)
+
+    def test_failed_shared_fetch_is_retried_by_a_later_album(self):
+        failures = {"/artist/27": 1, "/track/3135556": 1}
+
+        def flaky_get(url, timeout=10):
+            for fragment, remaining in failures.items():
+                if fragment in url and remaining:
+                    failures[fragment] -= 1
+                    raise requests.ConnectionError("reset")
+            if "/album/302128" in url:
+                return FakeResponse(fake_get("https://api.deezer.com/album/302127").json() | {"id": 302128})
+            return fake_get(url, timeout)
+
+        cache = build_metadata_cache(
+            {"albums": [{"album_id": "302127"}, {"album_id": "302128"}]},
+            {"releases": []},
+            get=flaky_get,
+            sleep=lambda _: None,
+        )
+
+        self.assertIn("27", cache["artists"])
+        self.assertIn("3135556", cache["tracks"])
+
+    def test_album_hydration_builds_tracks_without_track_requests(self):
+        urls = []
+
+        def recording_get(url, timeout=10):
+            urls.append(url)
+            if "/album/302127" in url:
+                payload = fake_get(url).json()
+                payload["tracks"] = {
+                    "data": [{"id": 3135556, "title": "Harder Better Faster Stronger", "duration": 226}]
+                }
+                return FakeResponse(payload)
+            return fake_get(url, timeout)
+
+        cache = build_metadata_cache(
+            {"albums": [{"album_id": "302127"}]},
+            {"releases": []},
+            hydration="album",
+            get=recording_get,
+            sleep=lambda _: None,
+        )
+
+        track = cache["tracks"]["3135556"]
+        self.assertFalse(any("/track/" in url for url in urls))
+        self.assertEqual(track["title"], "Harder Better Faster Stronger")
+        self.assertEqual(track["hydration"], "album")
+        self.assertTrue(track_needs_deep_fetch(track))
+        self.assertEqual(cache["summary"]["tracks_pending_deep_fetch"], 1)
+
+        updated = deepen_tracks(cache, get=recording_get, sleep=lambda _: None)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(cache["tracks"]["3135556"]["isrc"], "GBDUW0000059")
+        self.assertEqual(cache["tracks"]["3135556"]["hydration"], "track")
+        self.assertEqual(cache["summary"]["tracks_pending_deep_fetch"], 0)
+        self.assertEqual(deepen_tracks(cache, get=recording_get, sleep=lambda _: None), 0)
+
+    def test_deep_fetch_limit_advances_past_tracks_without_isrc(self):
+        urls = []
+
+        def no_isrc_get(url, timeout=10):
+            urls.append(url)
+            track_id = url.rsplit("/", 1)[-1]
+            return FakeResponse({"id": int(track_id), "title": f"Track {track_id}", "disk_number": 1})
+
+        cache = empty_cache()
+        cache["summary"] = {}
+        for track_id in range(1, 5):
+            cache["tracks"][str(track_id)] = parse_track_payload({"id": track_id, "title": "Album tier"}, hydration="album")
+        cache["tracks"]["9"] = parse_track_payload({"id": 9, "title": "Track tier"})
+
+        self.assertEqual(deepen_tracks(cache, limit=2, get=no_isrc_get, sleep=lambda _: None), 2)
+        self.assertEqual(deepen_tracks(cache, limit=2, get=no_isrc_get, sleep=lambda _: None), 2)
+
+        self.assertEqual([url.rsplit("/", 1)[-1] for url in urls], ["1", "2", "3", "4"])
+        self.assertFalse(track_needs_deep_fetch(cache["tracks"]["1"]))
+        self.assertEqual(cache["summary"]["tracks_pending_deep_fetch"], 0)
+        self.assertEqual(deepen_tracks(cache, limit=2, get=no_isrc_get, sleep=lambda _: None), 0)
+
+    def test_unknown_hydration_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            build_metadata_cache({"albums": []}, {"releases": []}, hydration="lazy")
+
+    def test_interrupted_build_resumes_from_journal(self):
+        registry = {"albums": [{"album_id": "302127"}, {"album_id": "302128"}]}
+        urls = []
+
+        def recording_get(url, timeout=10):
+            urls.append(url)
+            if "/album/302128" in url:
+                return FakeResponse(fake_get("https://api.deezer.com/album/302127").json() | {"id": 302128})
+            return fake_get(url, timeout)
+
+        def interrupt(done, total, info):
+            self.assertEqual((done, total, info["album_id"]), (1, 2, "302127"))
+            raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            journal_path = Path(tmp) / "metadata_cache.json.journal"
+            with self.assertRaises(KeyboardInterrupt):
+                with MetadataJournal(journal_path, every_albums=10) as journal:
+                    build_metadata_cache(
+                        registry,
+                        {"releases": []},
+                        journal=journal,
+                        progress=interrupt,
+                        get=recording_get,
+                        sleep=lambda _: None,
+                    )
+            with journal_path.open("a", encoding="utf-8") as handle:
+                handle.write('{"album_id": "torn')
+
+            resumed = {"schema": 1, "albums": {}, "artists": {}, "tracks": {}, "errors": {}}
+            self.assertEqual(replay_journal(resumed, journal_path), 1)
+
+        self.assertEqual(sorted(resumed["albums"]), ["302127"])
+        self.assertIn("3135556", resumed["tracks"])
+
+        urls.clear()
+        progress = []
+        cache = build_metadata_cache(
+            registry,
+            {"releases": []},
+            existing_cache=resumed,
+            progress=lambda done, total, info: progress.append((done, total, info["eta_seconds"])),
+            get=recording_get,
+            sleep=lambda _: None,
+        )
+        self.assertEqual(sorted(cache["albums"]), ["302127", "302128"])
+        self.assertEqual(urls, ["https://api.deezer.com/album/302128"])
+        self.assertEqual([item[:2] for item in progress], [(1, 1)])
+
+    def test_journal_checkpoints_every_n_albums(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with MetadataJournal(Path(tmp) / "journal", every_albums=2, every_seconds=3600) as journal:
+                for album_id in ("1", "2", "3"):
+                    journal.append({"album_id": album_id, "error": {"type": "album_fetch_failed"}})
+                self.assertEqual(journal.checkpoints, 1)
+            self.assertEqual(journal.checkpoints, 2)
+
+
+class StatusResponse(FakeResponse):
+    def __init__(self, status_code, payload=None):
+        super().__init__(payload or {})
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+class ErrorLedgerTests(unittest.TestCase):
+    def classify(self, get):
+        with self.assertRaises(MetadataFetchError) as ctx:
+            fetch_json("https://api.deezer.com/album/1", get=get, strict=True)
+        return ctx.exception.kind, ctx.exception.status
+
+    def test_failures_are_classified(self):
+        def timeout(url, timeout=10):
+            raise requests.Timeout("read timed out")
+
+        self.assertEqual(self.classify(lambda url, timeout=10: StatusResponse(404)), ("not_found", 404))
+        self.assertEqual(self.classify(lambda url, timeout=10: StatusResponse(429)), ("rate_limited", 429))
+        self.assertEqual(self.classify(lambda url, timeout=10: StatusResponse(503)), ("transient", 503))
+        self.assertEqual(self.classify(timeout), ("transient", None))
+        no_data = {"error": {"type": "DataException", "message": "no data", "code": 800}}
+        quota = {"error": {"type": "Exception", "message": "Quota limit exceeded", "code": 4}}
+        self.assertEqual(self.classify(lambda url, timeout=10: FakeResponse(no_data)), ("not_found", None))
+        self.assertEqual(self.classify(lambda url, timeout=10: FakeResponse(quota)), ("rate_limited", None))
+        self.assertIsNone(fetch_json("https://api.deezer.com/album/1", get=lambda url, timeout=10: StatusResponse(404)))
+
+    def test_failures_back_off_and_are_retried_when_eligible(self):
+        registry = {"albums": [{"album_id": "302127"}]}
+        attempts = []
+
+        def flaky_get(url, timeout=10):
+            attempts.append(url)
+            if len(attempts) == 1:
+                return StatusResponse(503)
+            return fake_get(url, timeout)
+
+        first_run = datetime(2026, 6, 15, 12, 0, 0)
+        cache = build_metadata_cache(registry, {"releases": []}, now=first_run, get=flaky_get, sleep=lambda _: None)
+        entry = cache["errors"]["302127"]
+        self.assertEqual((entry["kind"], entry["status"], entry["attempts"]), ("transient", 503, 1))
+        self.assertEqual(entry["next_retry_at"], "2026-06-15T13:00:00")
+        self.assertEqual(cache["summary"]["fetch_errors_by_kind"], {"transient": 1})
+
+        too_soon = datetime(2026, 6, 15, 12, 30, 0)
+        self.assertEqual(retry_eligible_errors(cache, ["302127"], now=too_soon), [])
+        build_metadata_cache(registry, {"releases": []}, existing_cache=cache, now=too_soon, get=flaky_get)
+        self.assertEqual(len(attempts), 1)
+
+        later = datetime(2026, 6, 15, 13, 0, 0)
+        cache = build_metadata_cache(
+            registry,
+            {"releases": []},
+            existing_cache=cache,
+            now=later,
+            get=flaky_get,
+            sleep=lambda _: None,
+        )
+        self.assertIn("302127", cache["albums"])
+        self.assertEqual(cache["errors"], {})
+
+    def test_repeated_failures_double_the_backoff(self):
+        registry = {"albums": [{"album_id": "1"}]}
+        missing = {"error": {"message": "no data", "code": 800}}
+        cache = {"albums": {}, "artists": {}, "tracks": {}, "errors": {"1": {"type": "album_fetch_failed"}}}
+
+        cache = build_metadata_cache(
+            registry,
+            {"releases": []},
+            existing_cache=cache,
+            now=datetime(2026, 6, 1),
+            get=lambda url, timeout=10: FakeResponse(missing),
+            sleep=lambda _: None,
+        )
+
+        entry = cache["errors"]["1"]
+        self.assertEqual((entry["kind"], entry["attempts"]), ("not_found", 2))
+        self.assertEqual(entry["next_retry_at"], "2026-06-15T00:00:00")
+
+
+class RefreshTests(unittest.TestCase):
+    def cached(self):
+        cache = build_metadata_cache(
+            {"albums": [{"album_id": "302127"}]},
+            {"releases": []},
+            get=fake_get,
+            sleep=lambda _: None,
+        )
+        cache["albums"]["302127"]["fetched_at"] = "2026-01-01T00:00:00"
+        cache["albums"]["302127"]["label"] = "Virgin"
+        cache["albums"]["302127"]["covers"]["xl"] = "old-xl.jpg"
+        cache["artists"]["27"]["fetched_at"] = "2026-06-14T00:00:00"
+        cache["tracks"]["3135556"]["fetched_at"] = "2025-06-01T00:00:00"
+        return cache
+
+    def test_candidates_are_stalest_first_within_ttl_and_budget(self):
+        cache = {"albums": {
+            "1": {"fetched_at": "2026-05-01T00:00:00"},
+            "2": {"fetched_at": "2026-01-01T00:00:00"},
+            "3": {},
+            "4": {"fetched_at": "2026-06-14T00:00:00"},
+        }}
+        now = datetime(2026, 6, 15)
+
+        self.assertEqual(refresh_candidates(cache, "albums", budget=2, now=now), ["3", "2"])
+        self.assertEqual(
+            refresh_candidates(cache, "albums", budget=10, ttl_seconds=30 * 24 * 60 * 60, now=now),
+            ["3", "2", "1"],
+        )
+
+    def test_refresh_records_field_level_diffs(self):
+        cache = self.cached()
+
+        log = refresh_metadata(
+            cache,
+            budgets={"albums": 5, "artists": 5},
+            ttl_days={"albums": 30, "artists": 30},
+            now=datetime(2026, 6, 15),
+            get=fake_get,
+            sleep=lambda _: None,
+        )
+
+        self.assertEqual(log["kinds"]["albums"], {"selected": 1, "refreshed": 1, "changed": 1, "failed": 0})
+        self.assertEqual(log["kinds"]["artists"]["selected"], 0)
+        self.assertNotIn("tracks", log["kinds"])
+        self.assertEqual(
+            log["changes"][0]["fields"],
+            {"covers.xl": {"old": "old-xl.jpg", "new": "xl.jpg"}, "label": {"old": "Virgin", "new": "Daft Life"}},
+        )
+        self.assertEqual(cache["albums"]["302127"]["label"], "Daft Life")
+        self.assertIn("| albums | 302127 | label | Virgin | Daft Life |", render_refresh_report(log))
+
+    def test_failed_refresh_keeps_cached_record(self):
+        cache = self.cached()
+
+        log = refresh_metadata(
+            cache,
+            budgets={"tracks": 1},
+            ttl_days={"tracks": None},
+            get=lambda url, timeout=10: FakeResponse({"error": {"code": 800}}),
+            sleep=lambda _: None,
+        )
+
+        self.assertEqual(log["kinds"]["tracks"]["failed"], 1)
+        self.assertEqual(cache["tracks"]["3135556"]["isrc"], "GBDUW0000059")
+        self.assertEqual(record_diff({"a": 1, "fetched_at": "x"}, {"a": 1, "fetched_at": "y"}), {})
+
+    def test_refresh_options_are_validated_as_their_type(self):
+        for argv in (
+            ["--refresh", "tracks=1.5"],
+            ["--refresh", "tracks=-1"],
+            ["--refresh", "playlists=5"],
+            ["--refresh-ttl", "albums=soon"],
+        ):
+            with self.subTest(argv=argv), contextlib.redirect_stderr(io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as ctx:
+                    main(argv)
+                self.assertEqual(ctx.exception.code, 2)
+                self.assertIn("expected KIND=NUMBER", stderr.getvalue())
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_spaces_requests_at_configured_rate(self):
+        now = [0.0]
+        waits = []
+
+        def fake_sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(4, clock=lambda: now[0], sleep=fake_sleep)
+        for _ in range(5):
+            bucket.acquire()
+
+        self.assertEqual(waits, [0.25, 0.25, 0.25, 0.25])
+        self.assertEqual(now[0], 1.0)
+
+    def test_burst_allows_back_to_back_starts(self):
+        now = [0.0]
+        bucket = TokenBucket(10, burst=3, clock=lambda: now[0], sleep=lambda _: None)
+
+        self.assertEqual([bucket.acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertGreater(bucket.acquire(), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,7 +30,7 @@ class MetadataContractTests(unittest.TestCase):
         }
 
         with (
-            patch("curator.metadata.requests.get", return_value=FakeResponse(payload)),
+            patch("curator.metadata.deezer_get", return_value=FakeResponse(payload)),
             patch("curator.metadata.time.sleep"),
         ):
             metadata = get_album_metadata("302127")
@@ -58,7 +58,7 @@ class MetadataContractTests(unittest.TestCase):
         }
 
         with (
-            patch("curator.metadata.requests.get", return_value=FakeResponse(payload)),
+            patch("curator.metadata.deezer_get", return_value=FakeResponse(payload)),
             patch("curator.metadata.time.sleep"),
         ):
             metadata = get_album_metadata("123")
@@ -85,7 +85,7 @@ class MetadataContractTests(unittest.TestCase):
         ]
 
         with (
-            patch("curator.expand.requests.get", side_effect=pages),
+            patch("curator.expand.deezer_get", side_effect=pages),
             patch("curator.expand.time.sleep"),
             patch(
                 "curator.expand.get_album_metadata",
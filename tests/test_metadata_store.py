@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from curator import metadata_store
+from curator.metadata_cache import empty_cache, write_metadata_cache
+from curator.metadata_store import (
+    JsonMetadataStore,
+    ShardedMetadataStore,
+    load_metadata_cache,
+    load_metadata_subset,
+    open_metadata_store,
+    shard_name,
+)
+
+
+def sample_cache() -> dict:
+    cache = empty_cache("2026-06-15T12:00:00")
+    cache["albums"] = {
+        "302127": {
+            "deezer_album_id": "302127",
+            "title": "Discovery",
+            "artist": {"deezer_artist_id": "27", "name": "Daft Punk"},
+            "contributors": [],
+            "track_ids": ["3135556"],
+        },
+        "1": {"deezer_album_id": "1", "title": "Other", "track_ids": []},
+    }
+    cache["artists"] = {"27": {"deezer_artist_id": "27", "name": "Daft Punk"}}
+    cache["tracks"] = {"3135556": {"deezer_track_id": "3135556", "isrc": "GBDUW0000059"}}
+    cache["summary"] = {"albums_with_metadata": 2}
+    return cache
+
+
+class ShardedMetadataStoreTests(unittest.TestCase):
+    def test_roundtrip_and_point_lookups(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ShardedMetadataStore(Path(tmp) / "metadata_cache")
+            store.save(sample_cache())
+
+            reopened = ShardedMetadataStore(Path(tmp) / "metadata_cache")
+            self.assertEqual(reopened.load(), sample_cache())
+            self.assertEqual(reopened.get("albums", "302127")["title"], "Discovery")
+            self.assertIsNone(reopened.get("albums", "404"))
+            self.assertEqual(list(reopened.get_many("tracks", ["3135556", "9"])), ["3135556"])
+            self.assertTrue((Path(tmp) / "metadata_cache" / "albums" / f"{shard_name('302127')}.json").exists())
+
+    def test_save_rewrites_only_changed_shards(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ShardedMetadataStore(Path(tmp) / "metadata_cache")
+            cache = sample_cache()
+            store.save(cache)
+
+            cache["albums"]["1"]["title"] = "Renamed"
+            written = ShardedMetadataStore(Path(tmp) / "metadata_cache").save(cache)
+
+            self.assertEqual(written, 2)
+            self.assertEqual(store.upsert("artists", {"27": {"name": "Daft Punk"}}), 1)
+            self.assertEqual(store.upsert("artists", {"27": {"name": "Daft Punk"}}), 0)
+
+    def test_failed_save_leaves_the_previous_save_in_place(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ShardedMetadataStore(Path(tmp) / "metadata_cache")
+            store.save(sample_cache())
+            changed = sample_cache()
+            changed["albums"]["1"]["title"] = "Renamed"
+            changed["generated_at"] = "2026-06-16T12:00:00"
+
+            real_dumps = metadata_store._dumps
+
+            def fail_on_manifest(data):
+                if "backend" in data:
+                    raise OSError("disk full")
+                return real_dumps(data)
+
+            with patch.object(metadata_store, "_dumps", fail_on_manifest):
+                with self.assertRaises(OSError):
+                    store.save(changed)
+
+            self.assertEqual(ShardedMetadataStore(Path(tmp) / "metadata_cache").load(), sample_cache())
+            self.assertEqual(store.save(changed), 2)
+            self.assertEqual(ShardedMetadataStore(Path(tmp) / "metadata_cache").load(), changed)
+
+    def test_export_matches_json_backend(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            store = ShardedMetadataStore(data_dir / "metadata_cache")
+            store.save(sample_cache())
+            store.export_json(data_dir / "exported.json")
+            write_metadata_cache(sample_cache(), data_dir / "legacy.json")
+
+            self.assertEqual(
+                (data_dir / "exported.json").read_text(encoding="utf-8"),
+                (data_dir / "legacy.json").read_text(encoding="utf-8"),
+            )
+
+
+class JsonMetadataStoreTests(unittest.TestCase):
+    def test_lookups_parse_the_document_once_until_it_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            write_metadata_cache(sample_cache(), data_dir / "metadata_cache.json")
+
+            with patch.object(metadata_store, "load_cache", wraps=metadata_store.load_cache) as load:
+                subset = load_metadata_subset(data_dir, ["302127"])
+                self.assertEqual(load.call_count, 1)
+
+                store = JsonMetadataStore(data_dir / "metadata_cache.json")
+                self.assertEqual(store.upsert("artists", {"27": {"name": "Thomas"}}), 1)
+                self.assertEqual(store.upsert("artists", {"27": {"name": "Thomas"}}), 0)
+                self.assertEqual(store.get("artists", "27"), {"name": "Thomas"})
+                self.assertEqual(store.get_many("artists", ["27", "9"]), {"27": {"name": "Thomas"}})
+
+        self.assertEqual(list(subset["tracks"]), ["3135556"])
+        self.assertEqual(list(subset["artists"]), ["27"])
+        self.assertEqual(load.call_count, 4)
+
+
+class MetadataStoreSelectionTests(unittest.TestCase):
+    def test_prefers_sharded_store_when_present(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            self.assertIsInstance(open_metadata_store(data_dir), JsonMetadataStore)
+            self.assertEqual(load_metadata_cache(data_dir), {})
+
+            (data_dir / "metadata_cache.json").write_text(json.dumps({"albums": {"9": {}}}), encoding="utf-8")
+            self.assertEqual(load_metadata_cache(data_dir), {"albums": {"9": {}}})
+
+            ShardedMetadataStore(data_dir / "metadata_cache").save(sample_cache())
+            self.assertIsInstance(open_metadata_store(data_dir), ShardedMetadataStore)
+            self.assertEqual(sorted(load_metadata_cache(data_dir)["albums"]), ["1", "302127"])
+
+    def test_subset_holds_album_tracks_and_artists(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            ShardedMetadataStore(data_dir / "metadata_cache").save(sample_cache())
+
+            subset = load_metadata_subset(data_dir, ["302127"])
+
+            self.assertEqual(list(subset["albums"]), ["302127"])
+            self.assertEqual(list(subset["tracks"]), ["3135556"])
+            self.assertEqual(list(subset["artists"]), ["27"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import copy
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from audio_division.library import load_library_sources
+from audio_division.registry_store import RegistryStore, freeze, thaw
+from curator.atomic import atomic_write_text
+from curator.metadata_store import ShardedMetadataStore
+
+
+def _write(path: Path, data: dict) -> None:
+    atomic_write_text(path, json.dumps(data))
+
+
+class RegistryStoreTests(unittest.TestCase):
+    def test_unchanged_file_is_parsed_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "lifecycle_registry.json"
+            _write(path, {"albums": [{"album_id": "1"}]})
+            store = RegistryStore()
+
+            first = store.load(path)
+            second = store.load(path)
+
+            self.assertIs(first, second)
+            self.assertEqual((store.misses, store.hits), (1, 1))
+
+    def test_same_size_rewrite_is_reloaded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "identity_registry.json"
+            store = RegistryStore()
+            _write(path, {"value": "a"})
+            self.assertEqual(store.load(path)["value"], "a")
+
+            _write(path, {"value": "b"})
+
+            self.assertEqual(store.load(path)["value"], "b")
+
+    def test_views_are_read_only_but_copy_out_mutable(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "archive_registry.json"
+            _write(path, {"albums": [{"name": "Discovery", "tags": ["a"]}]})
+            registry = RegistryStore().load(path)
+
+            with self.assertRaises(TypeError):
+                registry["albums"] = []
+            with self.assertRaises(TypeError):
+                registry["albums"].append({})
+            with self.assertRaises(TypeError):
+                registry["albums"][0]["tags"].sort()
+
+            self.assertIsInstance(registry, dict)
+            self.assertEqual(json.loads(json.dumps(registry)), {"albums": [{"name": "Discovery", "tags": ["a"]}]})
+            row = dict(registry["albums"][0])
+            row["name"] = "Homework"
+            mutable = thaw(registry)
+            mutable["albums"][0]["tags"].append("b")
+            copied = copy.deepcopy(registry)
+            copied["albums"].clear()
+            self.assertEqual(registry["albums"][0]["tags"], ["a"])
+
+    def test_missing_and_invalid_files_read_as_empty(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "broken.json"
+            path.write_text("{not json", encoding="utf-8")
+            store = RegistryStore()
+
+            self.assertEqual(store.load(path), {})
+            self.assertEqual(store.load(Path(tmp) / "missing.json"), {})
+
+    def test_metadata_follows_sharded_upserts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            sharded = ShardedMetadataStore(data_dir / "metadata_cache")
+            sharded.save({"albums": {"1": {"title": "Old"}}, "artists": {}, "tracks": {}, "errors": {}})
+            store = RegistryStore()
+
+            first = store.metadata(data_dir)
+            self.assertIs(store.metadata(data_dir), first)
+            sharded.upsert("albums", {"2": {"title": "New"}})
+
+            self.assertEqual(sorted(store.metadata(data_dir)["albums"]), ["1", "2"])
+
+    def test_freeze_reuses_frozen_parts(self) -> None:
+        inner = freeze({"a": [1]})
+
+        self.assertIs(freeze({"inner": inner})["inner"], inner)
+
+    def test_library_sources_share_one_parse(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            _write(data_dir / "lifecycle_registry.json", {"albums": [{"album_id": "1"}]})
+            _write(data_dir / "identity_registry.json", {"releases": []})
+
+            first = load_library_sources(data_dir)
+            second = load_library_sources(data_dir)
+
+            self.assertIs(first["lifecycle"], second["lifecycle"])
+            self.assertIs(first["metadata"], second["metadata"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from curator.lifecycle import write_reports
+from curator.report_aggregates import aggregate_registry
+from curator.validator_evidence import write_validation_reports
+
+
+def album(album_id: str, artist: str, highest: str | None, **states: bool) -> dict:
+    keys = ("discovered", "attempted", "shipped", "validated", "confirmed")
+    return {
+        "album_id": album_id,
+        "artist": artist,
+        "title": f"Album {album_id}",
+        "states": {key: states.get(key, False) for key in keys},
+        "highest_state": highest,
+        "timestamps": {},
+        "details": {},
+    }
+
+
+def synthetic_registry() -> dict:
+    return {
+        "generated_at": "2026-06-15T16:00:00",
+        "albums": [
+            album("1", "Artist A", "VALIDATED", discovered=True, attempted=True, shipped=True, validated=True),
+            album("2", "Artist A", "DISCOVERED", discovered=True),
+            album("3", "Artist B", "CONFIRMED", discovered=True, attempted=True, confirmed=True),
+            album("4", "Artist C", "SHIPPED", attempted=True, shipped=True),
+            album("5", "Artist D", "VALIDATED", validated=True),
+        ],
+    }
+
+
+class ReportAggregateTests(unittest.TestCase):
+    def test_one_pass_collects_counts_groups_and_gaps(self) -> None:
+        registry = synthetic_registry()
+        registry["albums"][0]["validation_evidence"] = {
+            "available": True,
+            "available_evidence": ["validation_log"],
+            "confidence": "detailed_log",
+            "validated_at": "2026-06-01T00:00:00",
+        }
+
+        aggregates = aggregate_registry(registry, now=datetime(2026, 6, 15))
+
+        self.assertEqual(aggregates["total_albums"], 5)
+        self.assertEqual(aggregates["highest_state_counts"]["VALIDATED"], 2)
+        self.assertEqual(aggregates["state_evidence_counts"]["DISCOVERED"], 3)
+        self.assertEqual([row["album_id"] for row in aggregates["gaps"]["discovered_not_attempted"]], ["2"])
+        self.assertEqual([row["album_id"] for row in aggregates["gaps"]["validated_not_shipped"]], ["5"])
+        self.assertEqual([row["album_id"] for row in aggregates["groups"]["with_validation_log"]], ["1"])
+        self.assertEqual(aggregates["validation_confidence_counts"], {"detailed_log": 1, "none": 4})
+        self.assertEqual(aggregates["validation_age_buckets"]["last_30_days"], 1)
+        self.assertEqual(aggregates["validation_age_buckets"]["missing_timestamp"], 1)
+        self.assertEqual(
+            [(item["artist"], item["discovered"], item["backlog"]) for item in aggregates["artist_coverage"]],
+            [("Artist A", 2, 1), ("Artist B", 1, 0)],
+        )
+
+    def test_writers_share_one_aggregate(self) -> None:
+        registry = synthetic_registry()
+        registry["summary"] = {
+            "total_albums": 5,
+            "highest_state_counts": {},
+            "state_evidence_counts": {},
+            "gaps": {
+                "discovered_not_attempted": 1,
+                "shipped_not_validated": 1,
+                "confirmed_not_validated": 1,
+                "validated_not_discovered": 1,
+            },
+        }
+        aggregates = aggregate_registry(registry)
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "curator.report_aggregates.aggregate_registry", side_effect=AssertionError("recomputed")
+        ), patch("curator.validator_evidence.aggregate_registry", side_effect=AssertionError("recomputed")):
+            write_reports(registry, Path(tmp), aggregates=aggregates)
+            write_validation_reports(registry, Path(tmp), aggregates=aggregates)
+
+            self.assertEqual(len(list(Path(tmp).glob("*.md"))), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from curator.metadata import get_album_metadata
+from curator.metadata_cache import build_metadata_cache, refresh_metadata
+from curator.response_cache import ResponseCache, configure_response_cache, read_through
+
+
+class FakeResponse:
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self.payload
+
+
+ALBUM = {
+    "id": 302127,
+    "title": "Discovery",
+    "release_date": "2001-03-07",
+    "nb_tracks": 0,
+    "record_type": "album",
+    "artist": {"id": 27, "name": "Daft Punk"},
+    "tracks": {"data": []},
+}
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        configure_response_cache(None)
+
+    def test_roundtrip_is_content_addressed_by_endpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResponseCache(Path(tmp))
+            cache.put("/album/302127", ALBUM)
+
+            self.assertEqual(cache.get("album/302127"), ALBUM)
+            self.assertIsNone(cache.get("album/1"))
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(cache.path_for("album/302127").parent.parent, Path(tmp))
+
+    def test_expired_entries_read_as_misses(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            now = [1000.0]
+            cache = ResponseCache(Path(tmp), ttl_seconds=60, clock=lambda: now[0])
+            cache.put("album/302127", ALBUM)
+            now[0] += 61
+
+            self.assertIsNone(cache.get("album/302127"))
+            self.assertFalse(cache.path_for("album/302127").exists())
+
+    def test_evicts_least_recently_used_when_over_size(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            now = [1000.0]
+            seed = ResponseCache(root, clock=lambda: now[0])
+            seed.put("album/1", ALBUM)
+            seed.put("album/2", ALBUM)
+            os.utime(seed.path_for("album/1"), (1000, 1000))
+            os.utime(seed.path_for("album/2"), (1001, 1001))
+            entry_size = seed.path_for("album/1").stat().st_size
+
+            cache = ResponseCache(root, max_bytes=entry_size * 2 + 10, clock=lambda: now[0])
+            now[0] = 2000.0
+            self.assertIsNotNone(cache.get("album/1"))
+            cache.put("album/3", ALBUM)
+
+            self.assertTrue(cache.path_for("album/1").exists())
+            self.assertFalse(cache.path_for("album/2").exists())
+            self.assertTrue(cache.path_for("album/3").exists())
+            self.assertEqual(cache.evictions, 1)
+
+    def test_error_payloads_are_not_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_response_cache(Path(tmp))
+            calls = []
+
+            def fetch():
+                calls.append(1)
+                return {"error": {"code": 800}}
+
+            read_through("album/1", fetch)
+            read_through("album/1", fetch)
+
+            self.assertEqual(len(calls), 2)
+
+    def test_expansion_and_metadata_build_share_album_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_response_cache(Path(tmp))
+            with (
+                patch("curator.metadata.deezer_get", return_value=FakeResponse(ALBUM)) as first,
+                patch("curator.metadata.time.sleep"),
+            ):
+                self.assertEqual(get_album_metadata("302127").title, "Discovery")
+                self.assertEqual(get_album_metadata("302127").title, "Discovery")
+
+            urls = []
+
+            def fake_get(url, timeout=10):
+                urls.append(url)
+                return FakeResponse({"id": 27, "name": "Daft Punk"})
+
+            cache = build_metadata_cache(
+                {"albums": [{"album_id": "302127"}]},
+                {"releases": []},
+                get=fake_get,
+                sleep=lambda _: None,
+            )
+
+        self.assertEqual(first.call_count, 1)
+        self.assertIn("302127", cache["albums"])
+        self.assertEqual(urls, ["https://api.deezer.com/artist/27"])
+
+    def test_throttle_is_spent_only_on_real_requests(self) -> None:
+        throttled = []
+        with tempfile.TemporaryDirectory() as tmp:
+            configure_response_cache(Path(tmp))
+            with (
+                patch("curator.metadata.deezer_get", return_value=FakeResponse(ALBUM)) as get,
+                patch("curator.metadata.time.sleep") as sleep,
+            ):
+                for _ in range(3):
+                    self.assertEqual(get_album_metadata("302127", throttle=lambda: throttled.append(1)).title, "Discovery")
+
+        self.assertEqual((get.call_count, len(throttled)), (1, 1))
+        sleep.assert_not_called()
+
+    def test_refresh_bypasses_cached_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            responses = configure_response_cache(Path(tmp))
+            responses.put("album/302127", {**ALBUM, "label": "Stale"})
+            cache = {"albums": {"302127": {"deezer_album_id": "302127", "label": "Stale"}}}
+
+            log = refresh_metadata(
+                cache,
+                budgets={"albums": 1},
+                ttl_days={},
+                get=lambda url, timeout=10: FakeResponse({**ALBUM, "label": "Daft Life"}),
+                sleep=lambda _: None,
+            )
+
+            self.assertEqual(log["kinds"]["albums"]["changed"], 1)
+            self.assertEqual(cache["albums"]["302127"]["label"], "Daft Life")
+            self.assertEqual(responses.get("album/302127")["label"], "Daft Life")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
@@ -8,9 +9,11 @@ from audio_division.revalidation import (
     HEALTH_ERROR,
     HEALTH_OK,
     HEALTH_WARNING,
+    RevalidationCancelled,
     render_archive_revalidation_report,
     revalidate_album,
     revalidate_archive,
+    stream_revalidation,
 )
 
 
@@ -107,6 +110,49 @@ class ArchiveRevalidationTests(unittest.TestCase):
         self.assertEqual(result["health_score"], 100)
         self.assertEqual(result["warnings"], [])
 
+    def make_archive_registry(self, root: Path, count: int) -> dict:
+        albums = []
+        for index in range(count):
+            album = self.make_album(root, f"artist-album-{index:02d}")
+            (album / "01.flac").write_text("audio", encoding="utf-8")
+            if index % 3 == 0:
+                (album / "playlist.m3u8").write_text("missing.flac\n", encoding="utf-8")
+            albums.append(album_entry(album, root))
+        return {"archive_root": str(root), "albums": albums}
+
+    def test_parallel_revalidation_report_matches_serial(self):
+        sources = {"identity_registry": {}, "lifecycle_registry": {}, "validated_index": {}}
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            registry = self.make_archive_registry(root, 20)
+
+            serial = revalidate_archive(registry, root, **sources)
+            done = []
+            parallel = revalidate_archive(registry, root, workers=4, progress=lambda current, total, row: done.append(current), **sources)
+            streamed = dict(stream_revalidation(registry, root, workers=4, **sources))
+
+        parallel["generated_at"] = serial["generated_at"]
+        self.assertEqual(render_archive_revalidation_report(parallel), render_archive_revalidation_report(serial))
+        self.assertEqual(parallel, serial)
+        self.assertEqual(done, list(range(1, 21)))
+        self.assertEqual([streamed[index] for index in range(20)], serial["albums"])
+
+    def test_cancelled_revalidation_raises_without_a_report(self):
+        sources = {"identity_registry": {}, "lifecycle_registry": {}, "validated_index": {}}
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            registry = self.make_archive_registry(root, 20)
+            for workers in (1, 4):
+                cancel = threading.Event()
+
+                def progress(current, total, row):
+                    if current == 3:
+                        cancel.set()
+
+                with self.assertRaises(RevalidationCancelled):
+                    revalidate_archive(registry, root, workers=workers, progress=progress, cancel=cancel, **sources)
+                self.assertEqual(list(stream_revalidation(registry, root, workers=workers, cancel=cancel, **sources)), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from curator.identity import build_identity_registry
+from curator.validation_log_index import ValidationLogIndex, shared_log_cache
+from curator.validator_evidence import LOG_FILENAME, collect_validation_evidence, parse_validation_log
+
+
+def write_log(folder: Path, album_id: str, tracks: int = 10) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / LOG_FILENAME
+    path.write_text(
+        json.dumps({"album": folder.name, "tracks": tracks, "completeness": {"album_id": album_id}}),
+        encoding="utf-8",
+    )
+    return path
+
+
+class ValidationLogIndexTests(unittest.TestCase):
+    def test_discovery_matches_rglob(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "downloads"
+            write_log(root / "A-Album-2001", "1")
+            write_log(root / "complete_releases" / "B-Album-2002", "2")
+            write_log(root / "complete_releases" / "B-Album-2002" / "Disc 2", "3")
+            (root / "C-Empty").mkdir()
+            (root / "C-Empty" / "notes.txt").write_text("", encoding="utf-8")
+            os.symlink(root / "A-Album-2001", root / "linked")
+
+            expected = sorted(path for path in root.rglob(LOG_FILENAME) if path.is_file())
+
+            self.assertEqual(ValidationLogIndex().discover([root], LOG_FILENAME), expected)
+
+    def test_rebuild_parses_only_changed_logs_and_evicts_deleted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            root = base / "downloads"
+            index_path = base / "validation_log_index.json"
+            first = write_log(root / "A-Album-2001", "1")
+            write_log(root / "B-Album-2002", "2")
+
+            initial = ValidationLogIndex(index_path)
+            for path in initial.discover([root], LOG_FILENAME):
+                initial.parse(path, parse_validation_log)
+            initial.save()
+
+            unchanged = ValidationLogIndex(index_path)
+            logs = unchanged.discover([root], LOG_FILENAME)
+            records = [unchanged.parse(path, parse_validation_log) for path in logs]
+            self.assertEqual([record["album_id"] for record in records], ["1", "2"])
+            self.assertEqual(
+                unchanged.stats,
+                {"parsed": 0, "reused": 2, "dirs_listed": 0, "dirs_reused": 3, "evicted": 0},
+            )
+
+            write_log(root / "A-Album-2001", "1", tracks=12)
+            os.utime(first, ns=(first.stat().st_atime_ns, first.stat().st_mtime_ns + 1_000_000))
+            shutil.rmtree(root / "B-Album-2002")
+            changed = ValidationLogIndex(index_path)
+            logs = changed.discover([root], LOG_FILENAME)
+            record = changed.parse(logs[0], parse_validation_log)
+            changed.save()
+
+            self.assertEqual(logs, [first])
+            self.assertEqual(record["track_count"], 12)
+            self.assertEqual((changed.stats["parsed"], changed.stats["evicted"]), (1, 1))
+            self.assertEqual(list(json.loads(index_path.read_text(encoding="utf-8"))["logs"]), [str(first)])
+
+    def test_collect_validation_evidence_uses_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp) / "data"
+            data_dir.mkdir()
+            root = Path(tmp) / "downloads"
+            write_log(root / "A-Album-2001", "1")
+            index_path = data_dir / "validation_log_index.json"
+
+            first = collect_validation_evidence(data_dir, [root], index_path=index_path)
+            second = collect_validation_evidence(data_dir, [root], index_path=index_path)
+
+            self.assertEqual(first["evidence_by_album"], second["evidence_by_album"])
+            self.assertEqual(first["index_stats"]["parsed"], 1)
+            self.assertEqual(second["index_stats"]["parsed"], 0)
+
+    def test_parallel_collection_matches_sequential(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp) / "data"
+            data_dir.mkdir()
+            (data_dir / "validated_albums.json").write_text(
+                json.dumps({"7": {"folder": "Folder-7"}, "8": {"folder": "Folder-8"}}),
+                encoding="utf-8",
+            )
+            root = Path(tmp) / "downloads"
+            for n in range(24):
+                album_id = str(n) if n % 3 else ""
+                write_log(root / f"Artist-{n % 4}" / f"Folder-{n}", album_id)
+            (root / "Artist-0" / "Broken").mkdir()
+            (root / "Artist-0" / "Broken" / LOG_FILENAME).write_text("{not json", encoding="utf-8")
+
+            sequential = collect_validation_evidence(data_dir, [root])
+            parallel = collect_validation_evidence(data_dir, [root], workers=6)
+
+            self.assertEqual(parallel["evidence_by_album"], sequential["evidence_by_album"])
+            self.assertEqual(parallel["unmatched_logs"], sequential["unmatched_logs"])
+            self.assertEqual(parallel["summary"], sequential["summary"])
+            self.assertEqual(len(parallel["unmatched_logs"]), 9)
+
+    def test_identity_build_reuses_logs_parsed_during_collection(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp) / "data"
+            data_dir.mkdir()
+            root = Path(tmp) / "downloads"
+            for n in range(3):
+                write_log(root / f"Artist-Album-200{n}", "")
+            shared_log_cache.clear()
+
+            evidence = collect_validation_evidence(data_dir, [root], workers=2)
+            lifecycle = {"albums": [], "unmatched_validation_logs": evidence["unmatched_logs"]}
+            with patch.object(Path, "read_text", side_effect=AssertionError("log read twice")):
+                registry = build_identity_registry(lifecycle, generated_at="2026-06-15T12:00:00")
+
+            self.assertEqual(registry["summary"]["unresolved_validator_logs"], 3)
+            self.assertEqual(shared_log_cache.hits, 3)
+
+    def test_seeded_cache_rejects_changed_logs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = Path(tmp) / "validation_log_index.json"
+            root = Path(tmp) / "downloads"
+            path = write_log(root / "A-Album-2001", "1")
+            collect_validation_evidence(Path(tmp), [root], index_path=index_path)
+            shared_log_cache.clear()
+
+            ValidationLogIndex(index_path, shared=shared_log_cache).seed_shared_cache()
+            write_log(root / "A-Album-2001", "1", tracks=12)
+            os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+            record = ValidationLogIndex(shared=shared_log_cache).parse(path, parse_validation_log)
+
+            self.assertEqual(record["track_count"], 12)
+            self.assertEqual((shared_log_cache.hits, shared_log_cache.misses), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
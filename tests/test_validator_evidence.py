@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 
 from curator.lifecycle import build_lifecycle_registry
+from curator.report_aggregates import aggregate_registry
 from curator.validator_evidence import (
     attach_validation_evidence,
     collect_validation_evidence,
@@ -118,6 +119,23 @@ class ValidatorEvidenceTests(unittest.TestCase):
 
             self.assertEqual(buckets["last_30_days"], 1)
 
+    def test_age_report_uses_the_clock_of_its_aggregates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir, evidence_root = self._write_data(Path(tmp))
+            evidence = collect_validation_evidence(data_dir, [evidence_root])
+            registry = build_lifecycle_registry(data_dir, validation_evidence=evidence)
+            now = datetime.fromisoformat("2028-07-01T00:00:00")
+
+            report = render_validation_age_report(registry, now=now)
+
+            self.assertIn("| Over 365 days | 1 |", report)
+            self.assertEqual(
+                render_validation_age_report(registry, aggregates=aggregate_registry(registry, now=now)),
+                report,
+            )
+            with self.assertRaises(ValueError):
+                render_validation_age_report(registry, now=now, aggregates=aggregate_registry(registry))
+
     def test_report_rendering_and_writing(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             base = Path(tmp)